@@ -838,6 +838,10 @@ def auto_scrape_school(school_name: str) -> dict:
     """
     Automatically find and scrape a school's football staff page.
 
+    A staff URL already known for the school (discovery cache or
+    schools.staff_url) is tried first with one conditional request; the
+    search and URL-pattern probes only run when there is none.
+
     Returns dict with:
         - success: bool
         - staff_url: discovered URL (if any)
@@ -845,9 +849,13 @@ def auto_scrape_school(school_name: str) -> dict:
         - rc: {name, email, twitter} (if found)
         - error: error message (if failed)
         - needs_manual: bool - whether admin needs to add manually
+        - discovery: 'cache', 'known', 'search', 'pattern' or 'cached_miss'
     """
     import requests as req_lib
-    from bs4 import BeautifulSoup
+    from browser.fetcher import get_fetcher
+    from extraction.parser_backend import make_soup
+    from scrapers.auto_scrape import extract_staff_targets
+    from scrapers.discovery_cache import get_staff_url_cache
     from urllib.parse import quote_plus, urljoin
 
     result = {
@@ -866,15 +874,59 @@ def auto_scrape_school(school_name: str) -> dict:
 
     # Clean school name for search
     clean_name = school_name.strip()
+    fetcher = get_fetcher()
+    url_cache = get_staff_url_cache()
 
-    # Try to find staff page URL via Google search
     staff_url = None
+    html = None
+    targets = None
+    validators = (None, None)
+
+    # Known staff page: cached discovery, else the school's saved staff_url
+    cached = url_cache.lookup(clean_name)
+    if cached is None and SUPABASE_AVAILABLE and _supabase_db:
+        try:
+            school = _supabase_db.get_school(clean_name)
+            if school and school.get('staff_url'):
+                cached = url_cache.store(clean_name, school['staff_url'], 'known')
+        except Exception as e:
+            logger.debug(f"Known staff URL lookup failed for {clean_name}: {e}")
+
+    if cached is not None and cached.negative:
+        result['discovery'] = 'cached_miss'
+        result['error'] = 'Could not find staff page URL. Please provide manually.'
+        return result
+
+    if cached is not None:
+        check = url_cache.revalidate(cached, fetcher.session)
+        if check.not_modified and cached.targets:
+            staff_url, targets = cached.staff_url, cached.targets
+            validators = (cached.etag, cached.last_modified)
+            result['fetch_tier'] = 'not_modified'
+        elif check.html is not None:
+            staff_url = cached.staff_url
+            validators = (check.etag, check.last_modified)
+            if fetcher.has_staff_content(check.html, staff_url, clean_name):
+                html = check.html
+                result['fetch_tier'] = 'static'
+        elif check.gone:
+            url_cache.invalidate(clean_name)
+        else:
+            # Temporary failure: keep the entry, fetch through the tiers below
+            staff_url = cached.staff_url
+        if staff_url:
+            result['discovery'] = 'cache' if cached.method in ('search', 'pattern') else cached.method
+
+    # Try to find staff page URL via Google search
     search_queries = [
         f'{clean_name} football coaching staff',
         f'{clean_name} football staff directory',
         f'{clean_name} athletics football coaches',
     ]
 
+    # A miss is only cached when every query got a real results page; errors,
+    # timeouts and rate-limit/anomaly pages say nothing about the school
+    searches_answered = 0
     for query in search_queries:
         if staff_url:
             break
@@ -883,7 +935,11 @@ def auto_scrape_school(school_name: str) -> dict:
             search_url = f'https://html.duckduckgo.com/html/?q={quote_plus(query)}'
             resp = req_lib.get(search_url, headers=headers, timeout=10)
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                soup = make_soup(resp.text)
+                if soup.select_one('.result, .no-results'):
+                    searches_answered += 1
+                else:
+                    logger.warning(f"Search for '{query}' returned no results page (rate limited?)")
                 # Find result links
                 for link in soup.select('a.result__a'):
                     href = link.get('href', '')
@@ -891,6 +947,7 @@ def auto_scrape_school(school_name: str) -> dict:
                     if any(x in href.lower() for x in ['athletics', 'sports', 'football', 'staff', 'coaches', 'roster']):
                         if '.edu' in href or 'athletics' in href:
                             staff_url = href
+                            result['discovery'] = 'search'
                             break
         except Exception as e:
             logger.warning(f"Search failed for '{query}': {e}")
@@ -910,93 +967,41 @@ def auto_scrape_school(school_name: str) -> dict:
                 resp = req_lib.head(pattern_url, headers=headers, timeout=5, allow_redirects=True)
                 if resp.status_code == 200:
                     staff_url = pattern_url
+                    result['discovery'] = 'pattern'
                     break
             except:
                 continue
 
     if not staff_url:
+        if searches_answered == len(search_queries):
+            url_cache.store_negative(clean_name)
         result['error'] = 'Could not find staff page URL. Please provide manually.'
         return result
 
+    if result.get('discovery') in ('search', 'pattern'):
+        url_cache.store(clean_name, staff_url, result['discovery'])
     result['staff_url'] = staff_url
 
-    # Now scrape the staff page
-    try:
-        resp = req_lib.get(staff_url, headers=headers, timeout=15)
-        resp.raise_for_status()
-        html = resp.text
-    except Exception as e:
-        result['error'] = f'Failed to fetch staff page: {str(e)}'
-        return result
-
-    soup = BeautifulSoup(html, 'html.parser')
-
-    # Extract all emails from page
-    all_emails = list(set(re.findall(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', html, re.IGNORECASE)))
-    result['all_emails_found'] = all_emails
-
-    # OL coach patterns
-    ol_patterns = ['offensive line', 'o-line', 'oline', 'ol coach', 'offensive line coach']
-    rc_patterns = ['recruiting coordinator', 'director of recruiting', 'recruiting director', 'director of player personnel']
-
-    ol_coach = None
-    ol_email = None
-    ol_twitter = None
-    rc_coach = None
-    rc_email = None
-    rc_twitter = None
-
-    # Find staff cards/sections
-    staff_cards = soup.find_all(['div', 'article', 'li', 'section'], class_=lambda x: x and any(
-        k in str(x).lower() for k in ['staff', 'coach', 'card', 'person', 'bio', 'member']
-    ))
-
-    # Also check all divs/sections for coach info
-    if not staff_cards:
-        staff_cards = soup.find_all(['div', 'article', 'li'])
-
-    for card in staff_cards:
-        card_text = card.get_text(' ', strip=True).lower()
-        card_html = str(card)
-
-        # Check for OL coach
-        if any(p in card_text for p in ol_patterns) and not ol_coach:
-            name_tag = card.find(['h2', 'h3', 'h4', 'h5', 'a', 'strong', 'b', 'span'])
-            if name_tag:
-                name = name_tag.get_text(strip=True)
-                # Validate it looks like a name
-                if 2 < len(name) < 50 and '@' not in name and not any(x in name.lower() for x in ['coach', 'offensive', 'line', 'staff']):
-                    ol_coach = name
-            # Find email
-            card_emails = re.findall(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', card_html, re.IGNORECASE)
-            if card_emails:
-                ol_email = card_emails[0]
-            # Find Twitter
-            twitter_match = re.search(r'(?:twitter\.com|x\.com)/([A-Za-z0-9_]+)', card_html, re.IGNORECASE)
-            if twitter_match:
-                ol_twitter = f'https://x.com/{twitter_match.group(1)}'
-
-        # Check for RC
-        if any(p in card_text for p in rc_patterns) and not rc_coach:
-            name_tag = card.find(['h2', 'h3', 'h4', 'h5', 'a', 'strong', 'b', 'span'])
-            if name_tag:
-                name = name_tag.get_text(strip=True)
-                if 2 < len(name) < 50 and '@' not in name and not any(x in name.lower() for x in ['coordinator', 'recruiting', 'director', 'staff']):
-                    rc_coach = name
-            card_emails = re.findall(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', card_html, re.IGNORECASE)
-            if card_emails:
-                rc_email = card_emails[0]
-            twitter_match = re.search(r'(?:twitter\.com|x\.com)/([A-Za-z0-9_]+)', card_html, re.IGNORECASE)
-            if twitter_match:
-                rc_twitter = f'https://x.com/{twitter_match.group(1)}'
-
-    # Build result
-    if ol_coach:
-        result['ol_coach'] = {'name': ol_coach, 'email': ol_email, 'twitter': ol_twitter}
-    if rc_coach:
-        result['rc'] = {'name': rc_coach, 'email': rc_email, 'twitter': rc_twitter}
-
-    if ol_coach or rc_coach:
+    # Now scrape the staff page (static fetch, Chrome only if that has no staff)
+    if targets is None:
+        if html is None:
+            page = fetcher.fetch(staff_url, school=clean_name)
+            if page.html is None:
+                result['error'] = f'Failed to fetch staff page: {page.error}'
+                return result
+            html = page.html
+            result['fetch_tier'] = page.tier
+            validators = (page.etag, page.last_modified)
+        targets = extract_staff_targets(html)
+
+    result['all_emails_found'] = targets.get('all_emails_found') or []
+    result['ol_coach'] = targets.get('ol_coach')
+    result['rc'] = targets.get('rc')
+
+    found = bool(result['ol_coach'] or result['rc'])
+    url_cache.record_scrape(clean_name, targets, found, *validators)
+
+    if found:
         result['success'] = True
         result['needs_manual'] = False
     else:
@@ -1984,8 +1989,12 @@ HTML_TEMPLATE = '''
                 <div class="card">
                     <div class="card-header" style="display:flex;justify-content:space-between;align-items:center;">
                         School Requests
-                        <button class="btn btn-primary btn-sm" onclick="showAddSchool()">+ ADD SCHOOL</button>
+                        <div style="display:flex;gap:8px;">
+                            <button class="btn btn-secondary btn-sm" id="bulk-scrape-btn" onclick="startBulkScrape()">SCRAPE ALL PENDING</button>
+                            <button class="btn btn-primary btn-sm" onclick="showAddSchool()">+ ADD SCHOOL</button>
+                        </div>
                     </div>
+                    <div id="bulk-scrape-progress" style="display:none;padding:12px 12px 0;font-size:12px;"></div>
                     <div id="school-requests" style="padding:12px;">Loading...</div>
                 </div>
 
@@ -5066,6 +5075,9 @@ HTML_TEMPLATE = '''
         // ========== ADMIN PANEL ==========
         async function loadAdminPanel() {
             await Promise.all([loadAthletesList(), loadMissingCoaches(), loadSchoolRequests()]);
+            fetch('/api/admin/bulk-scrape').then(r => r.json()).then(d => {
+                if (d.job && d.job.running) watchBulkScrape();
+            }).catch(() => {});
         }
 
         async function loadAthletesList() {
@@ -5129,6 +5141,71 @@ HTML_TEMPLATE = '''
             return notes.replace(/\[SCRAPED_DATA\].*?\[\/SCRAPED_DATA\]/s, '').trim();
         }
 
+        async function startBulkScrape() {
+            try {
+                const res = await fetch('/api/admin/bulk-scrape', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({})
+                });
+                const data = await res.json();
+                if (!data.success && !data.job) {
+                    showToast(data.error || 'Could not start bulk scrape', 'error');
+                    return;
+                }
+                watchBulkScrape();
+            } catch(e) { showToast('Could not start bulk scrape', 'error'); }
+        }
+
+        function renderBulkScrape(job) {
+            const el = document.getElementById('bulk-scrape-progress');
+            const btn = document.getElementById('bulk-scrape-btn');
+            if (!job) { el.style.display = 'none'; return; }
+            el.style.display = 'block';
+            btn.disabled = job.running;
+            const pct = job.total ? Math.round(job.done / job.total * 100) : 0;
+            const eta = job.eta_s != null ? ` • ~${Math.ceil(job.eta_s / 60)} min left` : '';
+            const recent = (job.recent || []).slice(-5).reverse().map(r => {
+                const color = r.status === 'success' ? 'var(--success)' : 'var(--warn)';
+                const found = [r.ol_coach && `OL: ${r.ol_coach}`, r.rc && `RC: ${r.rc}`].filter(Boolean).join(', ');
+                return `<div style="color:${color};">${r.school_name} — ${found || r.error || r.status}</div>`;
+            }).join('');
+            el.innerHTML = `
+                <div><strong>${job.running ? 'Scraping' : (job.cancelled ? 'Stopped' : 'Finished')}:</strong>
+                    ${job.done}/${job.total} (${pct}%) • ${job.success} found • ${job.manual_needed} need manual • ${job.failed} failed${job.running ? eta : ` • ${Math.round(job.elapsed_s)}s`}
+                    ${job.running ? '<a href="#" onclick="cancelBulkScrape();return false;" style="margin-left:8px;color:var(--muted);">stop</a>' : ''}</div>
+                <div style="height:4px;background:var(--bg2);margin:6px 0;"><div style="height:4px;width:${pct}%;background:var(--success);"></div></div>
+                ${recent}
+            `;
+        }
+
+        // Polls the status endpoint: a held-open stream per admin tab would tie up
+        // one of the server's few worker threads for the whole job
+        let bulkScrapeTimer = null;
+        function watchBulkScrape() {
+            if (bulkScrapeTimer) return;
+            let finished = 0;
+            const poll = async () => {
+                let job = null;
+                try {
+                    const res = await fetch('/api/admin/bulk-scrape');
+                    job = (await res.json()).job;
+                } catch(e) {}
+                if (job) renderBulkScrape(job);
+                // Refresh the request list every few finished schools
+                if (job && (job.done - finished >= 10 || !job.running)) {
+                    finished = job.done;
+                    loadSchoolRequests();
+                }
+                bulkScrapeTimer = job && job.running ? setTimeout(poll, 2000) : null;
+            };
+            bulkScrapeTimer = setTimeout(poll, 500);
+        }
+
+        async function cancelBulkScrape() {
+            await fetch('/api/admin/bulk-scrape/cancel', {method: 'POST'});
+        }
+
         async function loadSchoolRequests() {
             try {
                 const res = await fetch('/api/admin/school-requests');
@@ -6834,84 +6911,9 @@ def api_coach_search():
     try:
         # Get current athlete ID for per-athlete filtering
         athlete_id = g.athlete_id if hasattr(g, 'athlete_id') else None
-        search_pattern = f'%{query}%'
-
-        # Search directly in database (much faster than loading all coaches)
-        # Search by coach name or email
-        coaches_by_name = (_supabase_db.client.table('coaches')
-                         .select('*, schools(name, division, conference)')
-                         .or_(f'name.ilike.{search_pattern},email.ilike.{search_pattern}')
-                         .limit(30)
-                         .execute().data or [])
-
-        # Search by school name
-        schools = (_supabase_db.client.table('schools')
-                  .select('id, name')
-                  .ilike('name', search_pattern)
-                  .limit(10)
-                  .execute().data or [])
-
-        coaches_by_school = []
-        if schools:
-            school_ids = [s['id'] for s in schools]
-            coaches_by_school = (_supabase_db.client.table('coaches')
-                                .select('*, schools(name, division, conference)')
-                                .in_('school_id', school_ids)
-                                .limit(30)
-                                .execute().data or [])
-
-        # Combine and dedupe
-        seen_ids = set()
-        all_coaches = []
-        for coach in coaches_by_name + coaches_by_school:
-            if coach['id'] not in seen_ids:
-                seen_ids.add(coach['id'])
-                all_coaches.append(coach)
-            if len(all_coaches) >= 30:
-                break
-
-        # Get outreach data for all coaches in one batch query
-        coach_emails = [c.get('email') for c in all_coaches if c.get('email')]
-        outreach_by_email = {}
-
-        if coach_emails and athlete_id:
-            all_outreach = (_supabase_db.client.table('outreach')
-                          .select('coach_email, email_type, status, sent_at, opened, open_count, replied, replied_at, reply_snippet, reply_sentiment')
-                          .eq('athlete_id', athlete_id)
-                          .in_('coach_email', coach_emails)
-                          .order('sent_at', desc=True)
-                          .execute().data or [])
-
-            for o in all_outreach:
-                ce = o.get('coach_email')
-                if ce not in outreach_by_email:
-                    outreach_by_email[ce] = []
-                outreach_by_email[ce].append(o)
-
-        # Build results
-        results = []
-        for coach in all_coaches[:20]:
-            email = coach.get('email', '')
-            school_info = coach.get('schools') or {}
-
-            outreach_list = outreach_by_email.get(email, [])
-            outreach_data = outreach_list[0] if outreach_list else None
-            has_replied = any(o.get('replied') for o in outreach_list)
-            replied_at = next((o.get('replied_at') for o in outreach_list if o.get('replied')), None)
-            reply_sentiment = next((o.get('reply_sentiment') for o in outreach_list if o.get('replied')), None)
 
-            results.append({
-                'id': coach.get('id'),
-                'name': coach.get('name', ''),
-                'email': email,
-                'role': coach.get('role', ''),
-                'school': school_info.get('name', '') if isinstance(school_info, dict) else '',
-                'division': school_info.get('division', '') if isinstance(school_info, dict) else '',
-                'responded': has_replied,
-                'responded_at': replied_at,
-                'response_sentiment': reply_sentiment,
-                'outreach': outreach_data,
-            })
+        # Ranked coach + school + latest-outreach rows in one round-trip
+        results = _supabase_db.search_coaches_with_status(query, athlete_id=athlete_id, limit=20)
 
         return jsonify({'success': True, 'results': results, 'count': len(results)})
     except Exception as e:
@@ -7212,7 +7214,8 @@ def api_email_tomorrow_preview():
 
         athlete_id = getattr(g, 'athlete_id', None) or (_supabase_db._athlete_id if _supabase_db else None)
         if athlete_id:
-            coaches_ready = _supabase_db.get_coaches_for_athlete_schools(athlete_id, limit=500, days_between=days_between)
+            plan = _supabase_db.get_send_plan(athlete_id, days_between=days_between)
+            coaches_ready = plan.due(limit=500, now=next_auto_send_at(settings))
         else:
             coaches_ready = _supabase_db.get_coaches_to_email(limit=500, days_between=days_between)
         total_ready = len(coaches_ready)
@@ -7575,7 +7578,7 @@ def api_sheet_cleanup():
                         unique_parts.append(p)
                 new_notes = '; '.join(unique_parts)
                 if new_notes != notes:
-                    _supabase_db.client.table('coaches').update({'notes': new_notes}).eq('id', coach['id']).execute()
+                    _supabase_db.update_coach(coach['id'], notes=new_notes)
                     fixes_made += 1
 
         return jsonify({
@@ -7776,7 +7779,7 @@ def api_email_send():
         # Use athlete-specific schools when logged in; fall back to legacy for auto-send (context set by scheduler)
         athlete_id = getattr(g, 'athlete_id', None) or (_supabase_db._athlete_id if _supabase_db else None)
         if athlete_id:
-            coaches_data = _supabase_db.get_coaches_for_athlete_schools(athlete_id, limit=limit * 2, days_between=days_between)
+            coaches_data = _supabase_db.get_send_plan(athlete_id, days_between=days_between).due(limit=limit * 2)
         else:
             coaches_data = _supabase_db.get_coaches_to_email(limit=limit * 2, days_between=days_between)
 
@@ -8030,10 +8033,7 @@ def api_twitter_mark_wrong():
             from enterprise.twitter_google_scraper import get_scraper
             scraper = get_scraper()
             # Clear cache for this school
-            cache_key = scraper._get_cache_key(data.get('coach_name', ''), school)
-            cache_file = scraper.config.cache_dir / f"{cache_key}.json"
-            if cache_file.exists():
-                cache_file.unlink()
+            if scraper.cache.delete(data.get('coach_name', ''), school):
                 logger.info(f"Cleared Twitter cache for {school}")
         except Exception as e:
             logger.warning(f"Could not clear Twitter cache: {e}")
@@ -8179,7 +8179,8 @@ def api_scraper_start():
     scraper_type = data.get('type', 'twitter')
     batch = data.get('batch', 10)
     
-    scraper_state = {'running': True, 'log': ['Starting Twitter scraper...'], 'processed': 0, 'total': 0, 'found': 0}
+    scraper_state = {'running': True, 'log': ['Starting Twitter scraper...'], 'processed': 0, 'total': 0, 'found': 0,
+                     'queries': 0, 'avg_latency_ms': 0}
     
     try:
         if not SUPABASE_AVAILABLE or not _supabase_db:
@@ -8191,21 +8192,27 @@ def api_scraper_start():
         all_coaches = _supabase_db.get_all_coaches_with_schools()
         scraper_state['log'].append(f'Found {len(all_coaches)} coaches')
 
-        # Find coaches needing Twitter handles
+        # Find coaches needing Twitter handles. One person can hold several rows
+        # (e.g. OL coach and RC): search each name once, update every row
         coaches_to_scrape = []
+        coach_ids = {}
         for c in all_coaches:
-            if len(coaches_to_scrape) >= batch:
-                break
             name = c.get('name', '').strip()
             school = c.get('school_name', '').strip()
             twitter = (c.get('twitter') or '').strip()
-            if name and school and not twitter:
+            if not (name and school and not twitter):
+                continue
+            key = (name.lower(), school.lower())
+            if key not in coach_ids:
+                if len(coaches_to_scrape) >= batch:
+                    continue
+                coach_ids[key] = []
                 coaches_to_scrape.append({
                     'name': name,
                     'school': school,
-                    'coach_id': c.get('id'),
                     'type': (c.get('role') or 'unknown').upper()
                 })
+            coach_ids[key].append(c.get('id'))
 
         scraper_state['total'] = len(coaches_to_scrape)
         scraper_state['log'].append(f'Found {len(coaches_to_scrape)} coaches needing Twitter handles')
@@ -8230,34 +8237,43 @@ def api_scraper_start():
             scraper_state['log'].append(f'ERROR: Could not load scraper: {e}')
             return jsonify({'success': False, 'error': str(e)})
 
-        found_count = 0
-        for i, coach in enumerate(coaches_to_scrape):
-            if not scraper_state['running']:
-                scraper_state['log'].append('Scraping stopped by user')
-                break
-
-            scraper_state['processed'] = i + 1
-            scraper_state['log'].append(f'[{i+1}/{len(coaches_to_scrape)}] Searching: "{coach["name"]} {coach["school"]}"')
-
+        searched = []
+
+        def on_lookup(lookup):
+            scraper_state['processed'] += 1
+            prefix = f'[{scraper_state["processed"]}/{len(coaches_to_scrape)}] {lookup.coach_name} ({lookup.school})'
+            cost = 'cached' if lookup.cached else f'{lookup.queries} queries, {lookup.latency_ms / 1000:.1f}s'
+            if not lookup.cached:
+                searched.append(lookup)
+                scraper_state['queries'] = sum(l.queries for l in searched)
+                scraper_state['avg_latency_ms'] = round(sum(l.latency_ms for l in searched) / len(searched))
+            if not lookup.handle:
+                scraper_state['log'].append(f'{prefix}: no Twitter found ({cost})')
+                return
+            ids = coach_ids[(lookup.coach_name.lower(), lookup.school.lower())]
             try:
-                handle = scraper.find_twitter_handle(coach['name'], coach['school'])
-                if handle:
-                    try:
-                        _supabase_db.update_coach(coach['coach_id'], twitter=f'@{handle}')
-                        scraper_state['log'].append(f'  Found @{handle} - saved to database')
-                        found_count += 1
-                        scraper_state['found'] = found_count
-                    except Exception as db_err:
-                        scraper_state['log'].append(f'  Found @{handle} but failed to save: {db_err}')
-                else:
-                    scraper_state['log'].append(f'  No Twitter found for {coach["name"]}')
-            except Exception as e:
-                scraper_state['log'].append(f'  ERROR: {e}')
+                for coach_id in ids:
+                    _supabase_db.update_coach(coach_id, twitter=f'@{lookup.handle}')
+                scraper_state['found'] += 1
+                rows = f' ({len(ids)} coach rows)' if len(ids) > 1 else ''
+                scraper_state['log'].append(f'{prefix}: found @{lookup.handle} ({cost}) - saved to database{rows}')
+            except Exception as db_err:
+                scraper_state['log'].append(f'{prefix}: found @{lookup.handle} but failed to save: {db_err}')
+
+        scraper_state['log'].append(f'Searching with {scraper.config.batch_workers} concurrent lookups...')
+        lookups = scraper.resolve_batch(coaches_to_scrape, callback=on_lookup,
+                                        should_stop=lambda: not scraper_state['running'])
+        if not scraper_state['running']:
+            scraper_state['log'].append(f'Scraping stopped by user after {len(lookups)} coaches')
+        found_count = scraper_state['found']
 
         scraper_state['running'] = False
         scraper_state['log'].append('')
         scraper_state['log'].append('=== DONE ===')
         scraper_state['log'].append(f'Found {found_count} Twitter handles out of {len(coaches_to_scrape)} coaches')
+        if searched:
+            scraper_state['log'].append(f'{scraper_state["queries"]} searches, '
+                                        f'{scraper_state["avg_latency_ms"] / 1000:.1f}s average per searched coach')
 
         return jsonify({'success': True, 'found': found_count, 'total': len(coaches_to_scrape)})
         
@@ -8785,6 +8801,7 @@ def start_auto_send_scheduler():
         last_send_date = None
         last_reminder_date = None
         last_response_check = None
+        last_recrawl_date = None
 
         # Get timezone offset from environment (default to Eastern Time: UTC-5 or UTC-4)
         # Railway runs on UTC, so we need to offset for user's timezone
@@ -8907,6 +8924,13 @@ def start_auto_send_scheduler():
                         except Exception as e:
                             logger.error(f"Response check error: {e}")
                     last_response_check = now
+                
+                # Refresh stale staff pages once a day (own thread, runs can take minutes)
+                if last_recrawl_date != today and SUPABASE_AVAILABLE and _supabase_db:
+                    from scrapers.recrawl import recrawl_enabled
+                    if recrawl_enabled():
+                        threading.Thread(target=run_staff_recrawl, daemon=True).start()
+                    last_recrawl_date = today
                     
             except Exception as e:
                 logger.error(f"Scheduler error: {e}")
@@ -8921,6 +8945,25 @@ def start_auto_send_scheduler():
 # Track if scheduler has been started
 _scheduler_started = False
 
+def next_auto_send_at(current_settings: Dict) -> datetime:
+    """Next scheduled auto-send time (stored send time, default 9:00 AM) as an aware UTC datetime."""
+    stored_time = current_settings.get('email', {}).get('auto_send_time', '')
+    try:
+        if stored_time and ':' in stored_time:
+            h, m = stored_time.split(':')[:2]
+            h, m = int(h), int(m)
+        else:
+            h, m = 9, 0  # Default to 9:00 AM
+        now = datetime.now()
+        send_today = now.replace(hour=h, minute=m, second=0, microsecond=0)
+    except ValueError:
+        now = send_today = datetime.now()
+    if now >= send_today:
+        # Already past send time today, use tomorrow
+        send_today += timedelta(days=1)
+    return send_today.astimezone(timezone.utc)
+
+
 def ensure_scheduler_started():
     """Ensure scheduler is started (called once)."""
     global _scheduler_started
@@ -8936,20 +8979,9 @@ def api_auto_send_status():
     enabled = current_settings.get('email', {}).get('auto_send_enabled', False)
 
     # Compute next_run based on stored send time (default to 9:00 AM if not set)
-    stored_time = current_settings.get('email', {}).get('auto_send_time', '')
     next_run_str = None
     try:
-        if stored_time and ':' in stored_time:
-            h, m = stored_time.split(':')[:2]
-            h, m = int(h), int(m)
-        else:
-            h, m = 9, 0  # Default to 9:00 AM
-        now = datetime.now()
-        send_today = now.replace(hour=h, minute=m, second=0, microsecond=0)
-        if now >= send_today:
-            # Already past send time today, show tomorrow
-            send_today += timedelta(days=1)
-        next_run_str = send_today.isoformat()
+        next_run_str = next_auto_send_at(current_settings).astimezone().replace(tzinfo=None).isoformat()
     except:
         pass
 
@@ -8985,10 +9017,11 @@ def api_tomorrow_preview():
         limit = current_settings.get('email', {}).get('auto_send_count', 100)
         days_between = current_settings.get('email', {}).get('days_between_emails', 3)
 
-        # Use athlete-specific function to get coaches from selected schools only
+        # Read from the athlete's precomputed send plan (same one the sender uses)
         athlete_id = g.athlete_id if hasattr(g, 'athlete_id') else None
         if athlete_id:
-            coaches = _supabase_db.get_coaches_for_athlete_schools(athlete_id, limit=500, days_between=days_between)
+            plan = _supabase_db.get_send_plan(athlete_id, days_between=days_between)
+            coaches = plan.due(limit=500, now=next_auto_send_at(current_settings))
         else:
             coaches = _supabase_db.get_coaches_to_email(limit=500, days_between=days_between)
 
@@ -9425,6 +9458,97 @@ def api_admin_athlete_credentials(athlete_id):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/admin/replica')
+@admin_required
+def api_admin_replica():
+    """Coach/school replica freshness and sync stats (admin only)."""
+    try:
+        return jsonify({'success': True, 'replica': _supabase_db.get_replica_metrics()})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/admin/replica/refresh', methods=['POST'])
+@admin_required
+def api_admin_replica_refresh():
+    """Force a full reload of the coach/school replica (admin only)."""
+    try:
+        full = (request.get_json(silent=True) or {}).get('full', True)
+        return jsonify({'success': True, 'replica': _supabase_db.refresh_replica(full=bool(full))})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/admin/fetcher')
+@admin_required
+def api_admin_fetcher():
+    """Staff page fetch tiers and staff URL discovery cache (admin only)."""
+    try:
+        from browser.fetcher import get_fetcher
+        from scrapers.discovery_cache import get_staff_url_cache
+        return jsonify({
+            'success': True,
+            'fetcher': get_fetcher().get_stats(),
+            'discovery': get_staff_url_cache().get_stats(),
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+# Staff page recrawl: one run at a time, from the daily scheduler or an admin
+_recrawl_lock = threading.Lock()
+_recrawl_state = {'running': False, 'started_at': None, 'last_summary': None, 'last_error': None}
+
+
+def run_staff_recrawl(budget=None):
+    """Refetch the most overdue staff pages and update changed coaches. Returns the summary."""
+    if not _recrawl_lock.acquire(blocking=False):
+        logger.info("Staff recrawl already running")
+        return None
+    try:
+        from scrapers.recrawl import RecrawlScheduler
+        _recrawl_state.update(running=True, started_at=datetime.now().isoformat(), last_error=None)
+        summary = RecrawlScheduler(_supabase_db).run(budget=budget)
+        _recrawl_state['last_summary'] = summary
+        return summary
+    except Exception as e:
+        logger.error(f"Staff recrawl error: {e}")
+        _recrawl_state['last_error'] = str(e)
+        return None
+    finally:
+        _recrawl_state['running'] = False
+        _recrawl_lock.release()
+
+
+@app.route('/api/admin/recrawl', methods=['GET'])
+@admin_required
+def api_admin_recrawl_status():
+    """Next staff pages due for a recrawl, recent changes and the last run (admin only)."""
+    try:
+        from scrapers.recrawl import RecrawlScheduler
+        budget = request.args.get('budget', type=int)
+        plan = RecrawlScheduler(_supabase_db).plan(budget=budget)
+        return jsonify({
+            'success': True,
+            'plan': [task.to_dict() for task in plan],
+            'recent_changes': _supabase_db.get_staff_page_changes(limit=25),
+            **_recrawl_state,
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/admin/recrawl', methods=['POST'])
+@admin_required
+def api_admin_recrawl_run():
+    """Start a staff page recrawl in the background (admin only)."""
+    if _recrawl_state['running']:
+        return jsonify({'success': False, 'error': 'Recrawl already running'}), 409
+    budget = (request.json or {}).get('budget') if request.is_json else None
+    threading.Thread(target=run_staff_recrawl, args=(budget,), daemon=True).start()
+    return jsonify({'success': True, 'message': 'Recrawl started'})
+
+
 @app.route('/api/admin/missing-coaches')
 @admin_required
 def api_admin_missing_coaches():
@@ -9553,6 +9677,74 @@ def api_admin_school_requests():
         return jsonify({'error': str(e)}), 500
 
 
+# Bulk auto-scrape of school requests (one job at a time)
+_bulk_scrape_job = None
+
+
+@app.route('/api/admin/bulk-scrape', methods=['POST'])
+@admin_required
+def api_admin_bulk_scrape():
+    """Auto-scrape pending school requests (or a selected list) in the background (admin only).
+
+    Body (all optional):
+        request_ids: only these school requests
+        school_names: schools to scrape that nobody requested (a request row is created for each)
+        rescrape: include requests that already scraped successfully
+    """
+    global _bulk_scrape_job
+    try:
+        from scrapers.bulk_scrape import BulkScrapeJob
+
+        if _bulk_scrape_job and _bulk_scrape_job.running:
+            return jsonify({'success': False, 'error': 'A bulk scrape is already running',
+                            'job': _bulk_scrape_job.snapshot()}), 409
+
+        data = request.json or {}
+        request_ids = list(data.get('request_ids') or [])
+        school_names = [n.strip() for n in data.get('school_names') or [] if n and n.strip()]
+
+        if school_names:
+            now = datetime.now(timezone.utc).isoformat()
+            created = _supabase_db.client.table('school_requests').insert([
+                {'athlete_name': 'Admin', 'school_name': name, 'status': 'pending', 'created_at': now}
+                for name in dict.fromkeys(school_names)
+            ]).execute()
+            request_ids += [r['id'] for r in created.data or []]
+
+        q = _supabase_db.client.table('school_requests').select('id, school_name, notes, scrape_status')
+        q = q.in_('id', request_ids) if request_ids else q.eq('status', 'pending')
+        requests_to_scrape = q.order('created_at').execute().data or []
+        if not data.get('rescrape'):
+            requests_to_scrape = [r for r in requests_to_scrape if r.get('scrape_status') != 'success']
+
+        if not requests_to_scrape:
+            return jsonify({'success': False, 'error': 'No school requests to scrape'}), 400
+
+        _bulk_scrape_job = BulkScrapeJob(_supabase_db, requests_to_scrape, auto_scrape_school)
+        _bulk_scrape_job.start()
+        return jsonify({'success': True, 'job': _bulk_scrape_job.snapshot()})
+    except Exception as e:
+        logger.error(f"Bulk scrape start error: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/admin/bulk-scrape', methods=['GET'])
+@admin_required
+def api_admin_bulk_scrape_status():
+    """Progress of the current (or last) bulk scrape (admin only)."""
+    return jsonify({'success': True, 'job': _bulk_scrape_job.snapshot() if _bulk_scrape_job else None})
+
+
+@app.route('/api/admin/bulk-scrape/cancel', methods=['POST'])
+@admin_required
+def api_admin_bulk_scrape_cancel():
+    """Stop starting new schools; in-flight ones finish and are saved (admin only)."""
+    if not _bulk_scrape_job or not _bulk_scrape_job.running:
+        return jsonify({'success': False, 'error': 'No bulk scrape running'}), 400
+    _bulk_scrape_job.cancel()
+    return jsonify({'success': True})
+
+
 @app.route('/api/admin/add-school', methods=['POST'])
 @admin_required
 def api_admin_add_school():
@@ -9577,6 +9769,9 @@ def api_admin_add_school():
             state=state or None,
             staff_url=staff_url or None
         )
+        if staff_url:
+            from scrapers.discovery_cache import get_staff_url_cache
+            get_staff_url_cache().store(school_name, staff_url, 'manual')
 
         # Get the school to return its ID
         school = _supabase_db.get_school(school_name)
@@ -9653,26 +9848,20 @@ def api_admin_scrape_school():
             return jsonify({'error': 'school_name required'}), 400
 
         # Try to scrape the page
-        import requests
-        from bs4 import BeautifulSoup
+        from browser.fetcher import get_fetcher
+        from extraction.parser_backend import make_soup
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-
-        try:
-            resp = requests.get(staff_url, headers=headers, timeout=15)
-            resp.raise_for_status()
-            html = resp.text
-        except Exception as e:
+        page = get_fetcher().fetch(staff_url, school=school_name)
+        if page.html is None:
             return jsonify({
                 'success': False,
-                'error': f'Failed to fetch URL: {str(e)}',
+                'error': f'Failed to fetch URL: {page.error}',
                 'staff_url': staff_url,
                 'needs_manual': True
             })
+        html = page.html
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         page_text = soup.get_text(' ', strip=True).lower()
 
         # Look for OL coach
@@ -9735,7 +9924,11 @@ def api_admin_scrape_school():
         # Update school with staff URL
         school = _supabase_db.get_school(school_name)
         if school:
-            _supabase_db.client.table('schools').update({'staff_url': staff_url}).eq('id', school['id']).execute()
+            _supabase_db.update_school(school['id'], staff_url=staff_url)
+
+        # An admin-supplied URL outranks anything auto-discovery found
+        from scrapers.discovery_cache import get_staff_url_cache
+        get_staff_url_cache().store(school_name, staff_url, 'manual')
 
         return jsonify({
             'success': True,
@@ -1,23 +1,55 @@
 """
 browser/__init__.py - Browser Module
 ============================================================================
-Selenium browser management components.
+Page fetching: the static-first TieredFetcher, the AsyncCrawler for bulk
+refreshes and the Selenium browser management the fetcher escalates to.
 
 Author: Coach Outreach System
-Version: 2.0.0
+Version: 2.1.0
 ============================================================================
 """
 
-from browser.manager import (
-    BrowserManager,
-    BrowserConfig,
-    smart_delay,
-    long_break,
+from browser.fetcher import (
+    TieredFetcher,
+    FetchResult,
+    get_fetcher,
 )
+from browser.crawler import (
+    AsyncCrawler,
+    CrawlerConfig,
+    CrawlResult,
+    crawl_urls,
+)
+
+# Selenium is only needed for the browser tier
+try:
+    from browser.manager import (
+        BrowserManager,
+        BrowserConfig,
+        smart_delay,
+        long_break,
+    )
+    from browser.pool import BrowserPool, PoolTimeout
+except ImportError:
+    BrowserManager = None
+    BrowserConfig = None
+    smart_delay = None
+    long_break = None
+    BrowserPool = None
+    PoolTimeout = None
 
 __all__ = [
+    'TieredFetcher',
+    'FetchResult',
+    'get_fetcher',
+    'AsyncCrawler',
+    'CrawlerConfig',
+    'CrawlResult',
+    'crawl_urls',
     'BrowserManager',
     'BrowserConfig',
     'smart_delay',
     'long_break',
+    'BrowserPool',
+    'PoolTimeout',
 ]
@@ -0,0 +1,374 @@
+"""
+browser/crawler.py - Async Staff Page Crawler
+============================================================================
+Refreshes many schools' staff pages concurrently. auto_scrape_school
+fetches one page at a time on a fresh connection; AsyncCrawler keeps one
+pooled aiohttp session and runs every URL at once under:
+
+- a global concurrency cap and per-host connection cap (TCPConnector)
+- a global token-bucket rate limit (requests/second)
+- retries with full-jitter exponential backoff on timeouts, connection
+  errors and 429/5xx (Retry-After is honoured when given)
+
+Conditional GETs: the ETag / Last-Modified of every fetched URL is stored
+in a small SQLite table, and the next crawl sends If-None-Match /
+If-Modified-Since, so an unchanged page comes back as a bodyless 304.
+Each result also carries the page's content hash (compute_html_hash, the
+same hash ExtractionResult uses) and whether it changed since last time.
+
+scripts/benchmark_crawler.py runs it against a local fixture server.
+
+Config (env):
+- CRAWL_VALIDATORS_PATH: validator database (default ~/.coach_outreach/crawl_validators.db)
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import time
+import random
+import sqlite3
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from extraction.dom_parser import compute_html_hash
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_VALIDATORS_PATH = Path.home() / '.coach_outreach' / 'crawl_validators.db'
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    status INTEGER,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CrawlerConfig:
+    """Limits and retry policy for AsyncCrawler."""
+    # Concurrency
+    max_connections: int = 64
+    per_host: int = 4
+
+    # Global rate limit (requests/second, with this much burst)
+    rate_per_second: float = 20.0
+    burst: int = 20
+
+    # Timeouts (seconds)
+    total_timeout: float = 20.0
+    connect_timeout: float = 10.0
+
+    # Retries: full-jitter exponential backoff, capped
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 15.0
+
+    # Send If-None-Match / If-Modified-Since from the validator store
+    conditional: bool = True
+
+    user_agent: str = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                       '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+
+@dataclass
+class CrawlResult:
+    """
+    Outcome of crawling one URL.
+
+    Attributes:
+        url: Requested URL
+        status: Final HTTP status (None if no response)
+        html: Body for 200 responses (None for 304s and failures)
+        not_modified: Server answered 304 to the conditional GET
+        changed: Content hash differs from the previous crawl (False for 304s)
+        content_hash: compute_html_hash of the body, or the stored hash on 304
+        etag / last_modified: Validators returned by the server
+        attempts: Requests made, including retries
+        elapsed_ms: Wall time including backoff
+        error: Last error if the URL could not be fetched
+    """
+    url: str
+    status: Optional[int] = None
+    html: Optional[str] = None
+    not_modified: bool = False
+    changed: bool = False
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    attempts: int = 0
+    elapsed_ms: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.html is not None or self.not_modified
+
+
+# ============================================================================
+# VALIDATOR STORE
+# ============================================================================
+
+class ValidatorStore:
+    """ETag / Last-Modified / content hash per URL, in SQLite."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.environ.get('CRAWL_VALIDATORS_PATH') or DEFAULT_VALIDATORS_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, content_hash, status, fetched_at '
+                'FROM crawl_validators WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('etag', 'last_modified', 'content_hash', 'status', 'fetched_at'), row))
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str],
+            content_hash: Optional[str], status: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO crawl_validators '
+                '(url, etag, last_modified, content_hash, status, fetched_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (url, etag, last_modified, content_hash, status, time.time()),
+            )
+
+    def touch(self, url: str, status: int) -> None:
+        with self._lock:
+            self._conn.execute('UPDATE crawl_validators SET status = ?, fetched_at = ? WHERE url = ?',
+                               (status, time.time(), url))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM crawl_validators')
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens/second, up to `burst` banked."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# ============================================================================
+# CRAWLER
+# ============================================================================
+
+class AsyncCrawler:
+    """
+    Pooled, rate-limited, conditional-GET crawler.
+
+    Usage:
+        async with AsyncCrawler() as crawler:
+            results = await crawler.crawl(urls)
+
+        # From synchronous code
+        results = crawl_urls(urls)
+        changed = [r for r in results if r.changed]
+    """
+
+    def __init__(self, config: Optional[CrawlerConfig] = None,
+                 validators: Optional[ValidatorStore] = None):
+        if aiohttp is None:
+            raise RuntimeError("AsyncCrawler needs aiohttp (pip install aiohttp)")
+        self.config = config or CrawlerConfig()
+        self.validators = validators if validators is not None else ValidatorStore()
+        self._session = None
+        self._bucket: Optional[TokenBucket] = None
+        self.stats = {
+            'requests': 0,
+            'fetched': 0,
+            'not_modified': 0,
+            'changed': 0,
+            'failed': 0,
+            'retries': 0,
+            'bytes': 0,
+        }
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self) -> None:
+        if self._session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_connections,
+            limit_per_host=self.config.per_host,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.config.total_timeout,
+                                        connect=self.config.connect_timeout)
+        self._session = aiohttp.ClientSession(
+            connector=connector, timeout=timeout,
+            headers={'User-Agent': self.config.user_agent,
+                     'Accept': 'text/html,application/xhtml+xml,*/*;q=0.8'},
+        )
+        self._bucket = TokenBucket(self.config.rate_per_second, self.config.burst)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def crawl(self, urls: Iterable[str]) -> List[CrawlResult]:
+        """Fetch every URL concurrently; results are in input order."""
+        await self.start()
+        return list(await asyncio.gather(*(self.fetch(url) for url in urls)))
+
+    async def fetch(self, url: str) -> CrawlResult:
+        """GET one URL (conditionally, when validators are stored), with retries."""
+        await self.start()
+        start = time.perf_counter()
+        result = CrawlResult(url=url)
+        previous = self.validators.get(url) if self.config.conditional else None
+        headers = {}
+        if previous:
+            if previous['etag']:
+                headers['If-None-Match'] = previous['etag']
+            if previous['last_modified']:
+                headers['If-Modified-Since'] = previous['last_modified']
+
+        for attempt in range(self.config.max_retries + 1):
+            await self._bucket.acquire()
+            result.attempts += 1
+            self.stats['requests'] += 1
+            retry_after = None
+            try:
+                async with self._session.get(url, headers=headers, allow_redirects=True) as resp:
+                    result.status = resp.status
+                    if resp.status == 304 and previous:
+                        result.not_modified = True
+                        result.content_hash = previous['content_hash']
+                        result.etag = previous['etag']
+                        result.last_modified = previous['last_modified']
+                        result.error = None
+                        break
+                    if resp.status in RETRY_STATUSES:
+                        retry_after = resp.headers.get('Retry-After')
+                        result.error = f'HTTP {resp.status}'
+                    elif resp.status >= 400:
+                        result.error = f'HTTP {resp.status}'
+                        break
+                    else:
+                        body = await resp.read()
+                        result.html = body.decode(resp.charset or 'utf-8', errors='replace')
+                        result.etag = resp.headers.get('ETag')
+                        result.last_modified = resp.headers.get('Last-Modified')
+                        result.error = None
+                        self.stats['bytes'] += len(body)
+                        break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                result.error = f'{type(e).__name__}: {e}'
+
+            if attempt < self.config.max_retries:
+                self.stats['retries'] += 1
+                await asyncio.sleep(self._backoff(attempt, retry_after))
+
+        self._record(result, previous)
+        result.elapsed_ms = int((time.perf_counter() - start) * 1000)
+        return result
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Full-jitter exponential backoff, or the server's Retry-After seconds."""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.config.backoff_max)
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def _record(self, result: CrawlResult, previous: Optional[Dict[str, Any]]) -> None:
+        if result.not_modified:
+            self.stats['not_modified'] += 1
+            self.validators.touch(result.url, 304)
+            return
+        if result.html is None:
+            self.stats['failed'] += 1
+            logger.debug(f"Crawl failed for {result.url}: {result.error}")
+            return
+        self.stats['fetched'] += 1
+        result.content_hash = compute_html_hash(result.html)
+        result.changed = previous is None or previous['content_hash'] != result.content_hash
+        if result.changed:
+            self.stats['changed'] += 1
+        self.validators.put(result.url, result.etag, result.last_modified,
+                            result.content_hash, result.status or 200)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+
+def crawl_urls(urls: Iterable[str], config: Optional[CrawlerConfig] = None,
+               validators: Optional[ValidatorStore] = None) -> List[CrawlResult]:
+    """Crawl URLs from synchronous code (runs its own event loop)."""
+    async def run():
+        async with AsyncCrawler(config, validators) as crawler:
+            return await crawler.crawl(urls)
+    return asyncio.run(run())
+
+
+__all__ = [
+    'AsyncCrawler',
+    'CrawlerConfig',
+    'CrawlResult',
+    'ValidatorStore',
+    'TokenBucket',
+    'crawl_urls',
+]
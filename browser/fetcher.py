@@ -0,0 +1,398 @@
+"""
+browser/fetcher.py - Tiered Staff Page Fetcher
+============================================================================
+Most athletics staff pages (Sidearm, Presto, WordPress) ship their staff
+list in the initial HTML, yet BrowserManager.get_page drives Chrome for
+every page: a 2-5 s human delay, ten scroll steps and a dozen expand-button
+probes. TieredFetcher tries a pooled HTTP GET first and only escalates to
+the browser when the static response was a 2xx page with no usable staff
+content; HTTP errors (404, 410, 5xx) and network failures are returned as
+failures. Schools remembered as browser-tier get a HEAD first for the same
+reason.
+
+Tiers:
+- static: requests.Session with a pooled, retrying HTTPAdapter
+- browser: a BrowserPool of warm Selenium drivers, started on the first
+  escalation (BROWSER_POOL_SIZE pages load at once)
+
+"Usable staff content" is judged by DOMParser itself: the static page must
+yield an OL coach, an RC or at least MIN_STATIC_STAFF staff members. The
+parse result lands in the extraction cache, so the caller's own parse of
+the same HTML is a cache hit.
+
+The tier that worked is remembered per school, so schools that need the
+browser skip the static attempt until the decision is re-probed.
+
+Config (env):
+- FETCH_BROWSER_TIER: 'false' never escalates to the browser (default: on
+  when selenium is installed)
+- FETCH_TIER_PATH: tier memory file (default ~/.coach_outreach/fetch_tiers.json)
+- FETCH_TIER_TTL_DAYS: days before a remembered browser tier is re-probed
+  with a static fetch (default 14)
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from extraction.dom_parser import DOMParser
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+STATIC = 'static'
+BROWSER = 'browser'
+
+DEFAULT_TIER_PATH = Path.home() / '.coach_outreach' / 'fetch_tiers.json'
+DEFAULT_TIER_TTL_DAYS = 14
+
+# A static page with fewer staff than this (and no OL/RC) escalates
+MIN_STATIC_STAFF = 5
+
+STATIC_TIMEOUT = 15
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+STATIC_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of fetching one staff page.
+
+    Attributes:
+        url: Requested URL
+        html: Page HTML (None if every tier failed)
+        tier: Tier that produced the HTML ('static' or 'browser')
+        has_staff: Whether the HTML passed the staff-content check
+        status_code: HTTP status of the static fetch, if one was made
+        elapsed_ms: Total time across tiers
+        escalated: Whether the static tier was tried and fell through
+        error: Last error seen, if any
+        etag / last_modified: Validators from the static response, for
+            conditional re-fetches (None for browser pages)
+    """
+    url: str
+    html: Optional[str] = None
+    tier: str = STATIC
+    has_staff: bool = False
+    status_code: Optional[int] = None
+    elapsed_ms: int = 0
+    escalated: bool = False
+    error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _browser_tier_enabled() -> bool:
+    if os.environ.get('FETCH_BROWSER_TIER', 'true').lower() in ('false', '0', 'no', 'off'):
+        return False
+    try:
+        import selenium  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# ============================================================================
+# TIERED FETCHER
+# ============================================================================
+
+class TieredFetcher:
+    """
+    Static-first page fetcher that escalates to Selenium when needed.
+
+    Usage:
+        fetcher = TieredFetcher()
+        page = fetcher.fetch("https://gopack.com/sports/football/coaches", school="NC State")
+        if page.html:
+            result = DOMParser().parse(page.html, page.url)
+        print(fetcher.get_stats()['static_share'])
+    """
+
+    def __init__(
+        self,
+        browser_tier: Optional[bool] = None,
+        tier_path: Optional[Path] = None,
+        tier_ttl_days: Optional[float] = None,
+        parser: Optional[DOMParser] = None,
+    ):
+        self.browser_tier = _browser_tier_enabled() if browser_tier is None else browser_tier
+        self.tier_path = Path(tier_path or os.environ.get('FETCH_TIER_PATH') or DEFAULT_TIER_PATH).expanduser()
+        ttl_days = tier_ttl_days if tier_ttl_days is not None else float(
+            os.environ.get('FETCH_TIER_TTL_DAYS', DEFAULT_TIER_TTL_DAYS))
+        self.tier_ttl = ttl_days * 86400
+        self.parser = parser or DOMParser()
+
+        self.session = requests.Session()
+        self.session.headers.update(STATIC_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=('GET', 'HEAD')),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._tiers: Dict[str, Dict[str, Any]] = self._load_tiers()
+        self.stats = {
+            'pages': 0,
+            'static': 0,
+            'browser': 0,
+            'failed': 0,
+            'static_attempts': 0,
+            'static_misses': 0,
+            'remembered_browser': 0,
+            'static_ms': 0,
+            'browser_ms': 0,
+        }
+
+    # ------------------------------------------
+    # Fetching
+    # ------------------------------------------
+
+    def fetch(self, url: str, school: Optional[str] = None) -> FetchResult:
+        """
+        Fetch a staff page through the cheapest tier that yields staff.
+
+        Args:
+            url: Staff page URL
+            school: School name the tier decision is remembered under
+                (defaults to the URL's host)
+        """
+        start = time.perf_counter()
+        key = self._tier_key(url, school)
+
+        if self.browser_tier and self._remembered_tier(key) == BROWSER:
+            self._count('remembered_browser')
+            # Chrome can't see the HTTP status: a HEAD keeps a 404/410/5xx from
+            # coming back as the rendered error page
+            error = self._probe_error(url)
+            if error is not None:
+                return self._finish(error, start)
+            result = self._fetch_browser(url, school)
+            if result.html is None:
+                # Browser unavailable: the static page beats nothing
+                result = self._fetch_static(url, school)
+            return self._finish(result, start)
+
+        result = self._fetch_static(url, school)
+        if result.has_staff:
+            self._remember(key, STATIC)
+            return self._finish(result, start)
+        if not self.browser_tier or result.html is None:
+            # Only a 2xx page without staff is worth rendering; 404/410/5xx and
+            # network errors are reported as failures, not as the rendered error page
+            return self._finish(result, start)
+
+        browser_result = self._fetch_browser(url, school)
+        browser_result.status_code = result.status_code
+        browser_result.escalated = True
+        if browser_result.has_staff:
+            self._remember(key, BROWSER)
+        if browser_result.html is not None:
+            result = browser_result
+        else:
+            result.escalated = True
+            result.error = browser_result.error
+        return self._finish(result, start)
+
+    def _fetch_static(self, url: str, school: Optional[str]) -> FetchResult:
+        start = time.perf_counter()
+        result = FetchResult(url=url, tier=STATIC)
+        self._count('static_attempts')
+        try:
+            resp = self.session.get(url, timeout=STATIC_TIMEOUT)
+            result.status_code = resp.status_code
+            resp.raise_for_status()
+            result.html = resp.text
+            result.etag = resp.headers.get('ETag')
+            result.last_modified = resp.headers.get('Last-Modified')
+            result.has_staff = self.has_staff_content(result.html, url, school)
+        except requests.RequestException as e:
+            result.error = f'Static fetch failed: {e}'
+            logger.debug(f"Static fetch failed for {url}: {e}")
+
+        if not result.has_staff:
+            self._count('static_misses')
+        self._count('static_ms', int((time.perf_counter() - start) * 1000))
+        return result
+
+    def _probe_error(self, url: str) -> Optional[FetchResult]:
+        """HEAD the URL; a failed FetchResult for 404/410/5xx, else None (also when HEAD itself fails)."""
+        try:
+            resp = self.session.head(url, timeout=STATIC_TIMEOUT, allow_redirects=True)
+        except requests.RequestException as e:
+            logger.debug(f"Status probe failed for {url}: {e}")
+            return None
+        if resp.status_code in (404, 410) or (resp.status_code >= 500 and resp.status_code != 501):
+            return FetchResult(url=url, tier=BROWSER, status_code=resp.status_code,
+                               error=f'HTTP {resp.status_code} for {url}')
+        return None
+
+    def _fetch_browser(self, url: str, school: Optional[str]) -> FetchResult:
+        start = time.perf_counter()
+        result = FetchResult(url=url, tier=BROWSER)
+        try:
+            result.html = self._get_pool().get_page(url)
+            if result.html is None:
+                result.error = 'Browser fetch failed'
+        except Exception as e:
+            result.error = f'Browser fetch failed: {e}'
+            logger.warning(f"Browser fetch failed for {url}: {e}")
+        if result.html is not None:
+            result.has_staff = self.has_staff_content(result.html, url, school)
+        self._count('browser_ms', int((time.perf_counter() - start) * 1000))
+        return result
+
+    def _get_pool(self):
+        """BrowserPool for the browser tier, created on first escalation."""
+        with self._pool_lock:
+            if self._pool is None:
+                from browser.pool import BrowserPool
+                self._pool = BrowserPool()
+            return self._pool
+
+    def has_staff_content(self, html: str, url: str = '', school: Optional[str] = None) -> bool:
+        """Whether the HTML already holds a usable staff list."""
+        if not html or 'coach' not in html.lower():
+            return False
+        result = self.parser.parse(html, url, school or '')
+        return result.found_ol or result.found_rc or len(result.staff) >= MIN_STATIC_STAFF
+
+    def _finish(self, result: FetchResult, start: float) -> FetchResult:
+        result.elapsed_ms = int((time.perf_counter() - start) * 1000)
+        self._count('pages')
+        self._count(result.tier if result.html is not None else 'failed')
+        return result
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    # ------------------------------------------
+    # Tier memory
+    # ------------------------------------------
+
+    @staticmethod
+    def _tier_key(url: str, school: Optional[str]) -> str:
+        if school and school.strip():
+            return ' '.join(school.lower().split())
+        return urlparse(url).netloc.lower()
+
+    def _remembered_tier(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._tiers.get(key)
+        if not entry:
+            return None
+        # Browser decisions expire so a site that moved to static markup is re-probed
+        if entry['tier'] == BROWSER and time.time() - entry['updated_at'] > self.tier_ttl:
+            return None
+        return entry['tier']
+
+    def _remember(self, key: str, tier: str) -> None:
+        with self._lock:
+            entry = self._tiers.get(key)
+            if entry and entry['tier'] == tier and tier == STATIC:
+                return
+            self._tiers[key] = {'tier': tier, 'updated_at': time.time()}
+            self._save_tiers()
+
+    def _load_tiers(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.tier_path, encoding='utf-8') as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Fetch tier memory unreadable ({self.tier_path}): {e}")
+            return {}
+
+    def _save_tiers(self) -> None:
+        """Write the tier memory atomically (lock held)."""
+        try:
+            self.tier_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.tier_path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                json.dump(self._tiers, fh)
+            os.replace(tmp, self.tier_path)
+        except OSError as e:
+            logger.warning(f"Could not save fetch tier memory: {e}")
+
+    # ------------------------------------------
+    # Stats / lifecycle
+    # ------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus the share of pages served without the browser."""
+        with self._lock:
+            stats = dict(self.stats)
+            tiers = [entry['tier'] for entry in self._tiers.values()]
+        served = stats['static'] + stats['browser']
+        stats['static_share'] = round(stats['static'] / served, 3) if served else 0.0
+        stats['schools_static'] = tiers.count(STATIC)
+        stats['schools_browser'] = tiers.count(BROWSER)
+        stats['browser_tier'] = self.browser_tier
+        stats['browser_pool'] = self._pool.get_stats() if self._pool is not None else None
+        return stats
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_shared: Optional[TieredFetcher] = None
+_shared_lock = threading.Lock()
+
+
+def get_fetcher() -> TieredFetcher:
+    """Process-wide fetcher (one connection pool, one tier memory)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = TieredFetcher()
+        return _shared
+
+
+__all__ = [
+    'TieredFetcher',
+    'FetchResult',
+    'get_fetcher',
+]
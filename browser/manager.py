@@ -7,7 +7,10 @@ This module provides:
 - Stealth browser configuration
 - Anti-detection measures
 - Page loading and scrolling
-- Hidden content expansion
+- Hidden content expansion, waiting on DOM stability (MutationObserver)
+  rather than fixed sleeps
+- Resource blocking (images, media, fonts, trackers) via CDP, with a
+  per-domain allowlist, and per-page bytes / load-time metrics
 - Error handling and recovery
 - Resource management
 
@@ -26,10 +29,12 @@ import os
 import time
 import random
 import logging
-from typing import Optional, List, Callable, Any
-from dataclasses import dataclass
+from collections import deque
+from typing import Optional, List, Callable, Any, Dict, Tuple
+from dataclasses import dataclass, field
 from contextlib import contextmanager
 from datetime import datetime
+from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -88,11 +93,23 @@ class BrowserConfig:
     disable_javascript: bool = False
     block_ads: bool = True
     
+    # Resource blocking via CDP Network.setBlockedURLs (see RESOURCE_BLOCK_PATTERNS)
+    block_resources: bool = False
+    blocked_categories: Tuple[str, ...] = ('images', 'media', 'fonts', 'trackers')
+    # Domain -> categories to let through on that site (and its subdomains)
+    resource_allowlist: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    
     # Delays
     min_page_delay: float = 2.0
     max_page_delay: float = 5.0
-    min_scroll_delay: float = 0.2
-    max_scroll_delay: float = 0.5
+    
+    # Adaptive loading: wait for the DOM to go quiet instead of fixed sleeps
+    dom_quiet_ms: int = 500           # No new nodes for this long = stable
+    dom_settle_timeout_ms: int = 5000  # Give up waiting after this long
+    scroll_step_ms: int = 60          # Pause between viewport steps of a sweep
+    max_scroll_rounds: int = 8        # Sweeps to the bottom while nodes keep appearing
+    max_expand_clicks: int = 10
+    dom_phase_budget_ms: int = 12000  # Total settle waiting for each of scrolling and expanding
     
     # Retries
     max_retries: int = 3
@@ -109,6 +126,126 @@ DEFAULT_USER_AGENTS = [
 ]
 
 
+def _extension_patterns(*extensions: str) -> List[str]:
+    """Patterns for URLs ending in an extension, with or without a query
+    string (Sidearm/WMT headshots are served as ...jpg?width=300). Only '*'
+    is a wildcard in setBlockedURLs patterns; '?' matches itself."""
+    return [p for ext in extensions for p in (f'*.{ext}', f'*.{ext}?*')]
+
+
+# URL patterns blocked per category when BrowserConfig.block_resources is on.
+# Staff pages only need the DOM text; 'css' is available but not blocked by
+# default because expand buttons hidden by CSS would then look clickable.
+RESOURCE_BLOCK_PATTERNS: Dict[str, List[str]] = {
+    'images': _extension_patterns('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'media': _extension_patterns('mp4', 'webm', 'm3u8', 'ts', 'mp3', 'm4a', 'mov'),
+    'fonts': _extension_patterns('woff', 'woff2', 'ttf', 'otf', 'eot') + ['*fonts.googleapis.com*', '*use.typekit.net*'],
+    'css': _extension_patterns('css'),
+    'trackers': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googlesyndication.com*', '*adservice.google.com*', '*facebook.net*',
+        '*connect.facebook.com*', '*hotjar.com*', '*quantserve.com*', '*scorecardresearch.com*',
+        '*chartbeat.com*', '*newrelic.com*', '*nr-data.net*', '*taboola.com*', '*outbrain.com*',
+        '*adsrvr.org*', '*amazon-adsystem.com*', '*criteo.com*', '*segment.com*', '*tiktok.com/i18n/pixel*',
+    ],
+}
+
+def resource_allowlist_from_env() -> Dict[str, Tuple[str, ...]]:
+    """
+    Parse BROWSER_RESOURCE_ALLOWLIST ("site.edu:images,fonts;other.com:css")
+    into BrowserConfig.resource_allowlist.
+    """
+    allowlist = {}
+    for entry in os.environ.get('BROWSER_RESOURCE_ALLOWLIST', '').split(';'):
+        domain, _, categories = entry.partition(':')
+        if domain.strip() and categories.strip():
+            allowlist[domain.strip().lower()] = tuple(
+                c.strip() for c in categories.split(',') if c.strip())
+    return allowlist
+
+
+# Resource Timing totals for the loaded page
+_PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? (nav.transferSize || 0) : 0;
+for (const r of resources) { bytes += r.transferSize || 0; }
+return {bytes: bytes, resources: resources.length};
+"""
+
+# Counts added nodes and stamps the last DOM mutation; installed once per page
+_DOM_OBSERVER_SCRIPT = """
+if (!window.__coDom) {
+    const state = {added: 0, last: performance.now()};
+    new MutationObserver(records => {
+        for (const r of records) { state.added += r.addedNodes.length; }
+        state.last = performance.now();
+    }).observe(document.documentElement, {childList: true, subtree: true});
+    window.__coDom = state;
+}
+return window.__coDom.added;
+"""
+
+# Async: resolves once no node has been added for quietMs (counted from the
+# call, so a loader triggered by the preceding action gets a chance to fire)
+_WAIT_DOM_STABLE_SCRIPT = """
+const [quietMs, timeoutMs, done] = arguments;
+const state = window.__coDom;
+const start = performance.now();
+(function check() {
+    const now = performance.now();
+    if (!state || now - Math.max(state.last, start) >= quietMs || now - start >= timeoutMs) {
+        done(state ? state.added : 0);
+    } else {
+        setTimeout(check, Math.min(50, quietMs));
+    }
+})();
+"""
+
+# Async: scroll from the current position to the bottom one viewport at a time;
+# returns [viewport steps actually scrolled, scrollHeight at the end]
+_SWEEP_SCRIPT = """
+const [stepMs, done] = arguments;
+const step = Math.max(200, Math.floor(window.innerHeight * 0.9));
+let steps = 0;
+const finish = () => done([steps, document.documentElement.scrollHeight]);
+(function next() {
+    const bottom = document.documentElement.scrollHeight - window.innerHeight;
+    const before = window.scrollY;
+    if (before >= bottom - 1 || steps >= 200) { finish(); return; }
+    window.scrollTo(0, Math.min(before + step, bottom));
+    if (window.scrollY === before) { finish(); return; }
+    steps++;
+    setTimeout(next, stepMs);
+})();
+"""
+
+# One query for every kind of expand / load-more control
+EXPAND_XPATH = ' | '.join([
+    # Load more buttons
+    "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'load more')]",
+    "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]",
+    "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show all')]",
+    "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'view all')]",
+    "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'expand')]",
+    
+    # Links that expand
+    "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'view all')]",
+    "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'see all')]",
+    "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show all')]",
+    
+    # Class-based selectors
+    "//button[contains(@class, 'load-more')]",
+    "//button[contains(@class, 'show-more')]",
+    "//button[contains(@class, 'expand')]",
+    "//*[contains(@class, 'accordion')]//button",
+    "//*[contains(@class, 'collapsible')]//button",
+])
+
+# Per-page metrics kept for inspection (most recent last)
+PAGE_METRICS_HISTORY = 200
+
+
 # ============================================================================
 # BROWSER MANAGER
 # ============================================================================
@@ -150,6 +287,10 @@ class BrowserManager:
         self._is_running = False
         self._pages_loaded = 0
         self._errors_count = 0
+        self._blocked_patterns: Optional[Tuple[str, ...]] = None
+        self._bytes_total = 0
+        self._load_ms_total = 0
+        self.page_metrics: deque = deque(maxlen=PAGE_METRICS_HISTORY)
         
         # Initialize user agent generator
         if HAS_FAKE_UA and self.config.randomize_user_agent:
@@ -172,6 +313,11 @@ class BrowserManager:
             'is_running': self.is_running,
             'pages_loaded': self._pages_loaded,
             'errors_count': self._errors_count,
+            'bytes_transferred': self._bytes_total,
+            'load_ms_total': self._load_ms_total,
+            'avg_page_bytes': self._bytes_total // self._pages_loaded if self._pages_loaded else 0,
+            'avg_load_ms': self._load_ms_total // self._pages_loaded if self._pages_loaded else 0,
+            'blocking_resources': self.config.block_resources,
         }
     
     def start(self) -> bool:
@@ -205,6 +351,7 @@ class BrowserManager:
         
         self.driver = None
         self._is_running = False
+        self._blocked_patterns = None
         logger.info("Browser stopped")
     
     @contextmanager
@@ -242,6 +389,10 @@ class BrowserManager:
         if self.config.use_stealth:
             self._apply_stealth(driver)
         
+        # Request interception for resource blocking
+        if self.config.block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+        
         # Configure timeouts
         driver.set_page_load_timeout(self.config.page_load_timeout)
         driver.implicitly_wait(self.config.implicit_wait)
@@ -374,7 +525,10 @@ class BrowserManager:
                 logger.debug(f"Loading page (attempt {attempt + 1}): {url}")
                 
                 # Load the page
+                self._apply_resource_blocking(url)
+                load_start = time.perf_counter()
                 self.driver.get(url)
+                load_ms = int((time.perf_counter() - load_start) * 1000)
                 
                 # Random delay to appear human
                 delay = random.uniform(self.config.min_page_delay, self.config.max_page_delay)
@@ -392,6 +546,7 @@ class BrowserManager:
                 html = self.driver.page_source
                 
                 self._pages_loaded += 1
+                self._record_page_metrics(url, load_ms)
                 return html
                 
             except TimeoutException:
@@ -412,83 +567,146 @@ class BrowserManager:
         
         return None
     
+    def _blocked_patterns_for(self, url: str) -> Tuple[str, ...]:
+        """Blocked URL patterns for a page, minus its domain's allowlisted categories."""
+        host = urlparse(url).netloc.lower().split(':')[0]
+        allowed = set()
+        for domain, categories in self.config.resource_allowlist.items():
+            domain = domain.lower()
+            if host == domain or host.endswith('.' + domain):
+                allowed.update(categories)
+        return tuple(
+            pattern
+            for category in self.config.blocked_categories if category not in allowed
+            for pattern in RESOURCE_BLOCK_PATTERNS.get(category, [])
+        )
+    
+    def _apply_resource_blocking(self, url: str) -> None:
+        """Point Network.setBlockedURLs at this page's block list (only when it changes)."""
+        if not self.config.block_resources or not self.driver:
+            return
+        patterns = self._blocked_patterns_for(url)
+        if patterns == self._blocked_patterns:
+            return
+        try:
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+            self._blocked_patterns = patterns
+        except Exception as e:
+            logger.debug(f"Could not set blocked URLs: {e}")
+    
+    def _record_page_metrics(self, url: str, load_ms: int) -> None:
+        """Bytes transferred (Resource Timing) and load time for the page just loaded."""
+        try:
+            totals = self.driver.execute_script(_PAGE_METRICS_SCRIPT) or {}
+        except Exception:
+            totals = {}
+        page_bytes = int(totals.get('bytes') or 0)
+        self._bytes_total += page_bytes
+        self._load_ms_total += load_ms
+        self.page_metrics.append({
+            'url': url,
+            'load_ms': load_ms,
+            'bytes': page_bytes,
+            'resources': int(totals.get('resources') or 0),
+            'blocked_patterns': len(self._blocked_patterns or ()),
+        })
+    
+    def _install_dom_observer(self) -> int:
+        """Start counting added nodes on the current page; returns the count so far."""
+        return self.driver.execute_script(_DOM_OBSERVER_SCRIPT) or 0
+    
+    def _wait_for_dom_stable(self, deadline: Optional[float] = None) -> int:
+        """Block until no nodes have been added for dom_quiet_ms (or the phase
+        deadline, a time.monotonic() value, passes); returns total added."""
+        timeout_ms = self.config.dom_settle_timeout_ms
+        if deadline is not None:
+            timeout_ms = max(0, min(timeout_ms, int((deadline - time.monotonic()) * 1000)))
+        return self.driver.execute_async_script(
+            _WAIT_DOM_STABLE_SCRIPT, self.config.dom_quiet_ms, timeout_ms
+        ) or 0
+    
     def _scroll_page(self) -> None:
-        """Scroll the page to trigger lazy loading."""
+        """
+        Scroll the page to trigger lazy loading.
+        
+        Each round sweeps from the current position to the bottom, a viewport
+        at a time, then waits for the DOM to settle. Rounds continue only
+        while the previous one added nodes and made the page taller (infinite
+        scroll, lazy sections); pages that never stop changing (carousels,
+        tickers, ad slots) end when the sweep can't scroll or the page stops
+        growing, and the whole phase is capped at dom_phase_budget_ms.
+        """
         if not self.driver:
             return
         
         try:
-            # Get page height
-            page_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            # Scroll in increments
-            scroll_positions = [
-                300, 600, 900, 1200, 1500, 2000, 2500, 3000,
-                page_height // 2, page_height
-            ]
-            
-            for pos in scroll_positions:
-                if pos > page_height:
+            deadline = time.monotonic() + self.config.dom_phase_budget_ms / 1000
+            added = self._install_dom_observer()
+            for round_no in range(self.config.max_scroll_rounds):
+                steps, height = self.driver.execute_async_script(_SWEEP_SCRIPT, self.config.scroll_step_ms)
+                # The first round always settles (content rendered after load);
+                # later ones only if the sweep found more page below
+                if (round_no and not steps) or time.monotonic() >= deadline:
                     break
-                    
-                self.driver.execute_script(f"window.scrollTo(0, {pos})")
-                delay = random.uniform(
-                    self.config.min_scroll_delay, 
-                    self.config.max_scroll_delay
-                )
-                time.sleep(delay)
-            
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(0.5)
+                now_added = self._wait_for_dom_stable(deadline)
+                grown = self.driver.execute_script("return document.documentElement.scrollHeight")
+                if now_added == added or grown <= height:
+                    break
+                added = now_added
             
             # Scroll back to top (some sites load content differently)
             self.driver.execute_script("window.scrollTo(0, 0)")
-            time.sleep(0.3)
             
         except Exception as e:
             logger.debug(f"Error during scroll: {e}")
     
     def _expand_content(self) -> None:
-        """Try to click buttons that expand hidden content."""
+        """
+        Click buttons that expand hidden content.
+        
+        Controls are found with one combined XPath query; nothing is waited
+        on unless something was clicked. After clicking, the DOM is given
+        time to settle and the query re-runs for newly revealed controls
+        (each element is clicked at most once, so accordions aren't closed;
+        only visible controls that were clicked count toward max_expand_clicks).
+        Settle waits share dom_phase_budget_ms.
+        """
         if not self.driver:
             return
         
-        # XPath selectors for expand buttons
-        expand_selectors = [
-            # Load more buttons
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'load more')]",
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]",
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show all')]",
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'view all')]",
-            "//button[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'expand')]",
-            
-            # Links that expand
-            "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'view all')]",
-            "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'see all')]",
-            "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show all')]",
-            
-            # Class-based selectors
-            "//button[contains(@class, 'load-more')]",
-            "//button[contains(@class, 'show-more')]",
-            "//button[contains(@class, 'expand')]",
-            "//*[contains(@class, 'accordion')]//button",
-            "//*[contains(@class, 'collapsible')]//button",
-        ]
-        
-        for selector in expand_selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                for elem in elements[:3]:  # Click at most 3 per selector
-                    if elem.is_displayed() and elem.is_enabled():
-                        try:
+        clicked = set()
+        try:
+            deadline = time.monotonic() + self.config.dom_phase_budget_ms / 1000
+            added = self._install_dom_observer()
+            while len(clicked) < self.config.max_expand_clicks and time.monotonic() < deadline:
+                elements = [e for e in self.driver.find_elements(By.XPATH, EXPAND_XPATH)
+                            if e.id not in clicked]
+                if not elements:
+                    break
+                
+                clicks = 0
+                for elem in elements:
+                    if len(clicked) >= self.config.max_expand_clicks:
+                        break
+                    try:
+                        # Hidden matches (e.g. inside a collapsed accordion) are left
+                        # for a later pass, once an earlier click reveals them
+                        if elem.is_displayed() and elem.is_enabled():
                             elem.click()
-                            time.sleep(0.5)
+                            clicked.add(elem.id)
+                            clicks += 1
                             logger.debug("Clicked expand button")
-                        except (ElementClickInterceptedException, StaleElementReferenceException):
-                            pass
-            except Exception:
-                pass
+                    except (ElementClickInterceptedException, StaleElementReferenceException):
+                        pass
+                if not clicks:
+                    break
+                
+                now_added = self._wait_for_dom_stable(deadline)
+                if now_added == added:
+                    break
+                added = now_added
+        except Exception as e:
+            logger.debug(f"Error expanding content: {e}")
     
     def wait_for_element(
         self, 
@@ -583,6 +801,8 @@ def long_break(min_sec: float = 15.0, max_sec: float = 30.0) -> None:
 __all__ = [
     'BrowserManager',
     'BrowserConfig',
+    'RESOURCE_BLOCK_PATTERNS',
+    'resource_allowlist_from_env',
     'smart_delay',
     'long_break',
 ]
@@ -0,0 +1,357 @@
+"""
+browser/pool.py - Pool of Warm Browser Sessions
+============================================================================
+BrowserManager owns one Chrome, and every session() launches and quits it,
+so Chrome startup dominates short jobs and only one page loads at a time.
+BrowserPool keeps up to N started BrowserManagers and hands them out
+through a context manager; callers beyond N queue until one is returned.
+
+- Warm: start() launches the drivers in parallel up front (otherwise they
+  are launched on first demand)
+- Health: a driver idle for longer than health_check_idle seconds must
+  answer a trivial script before it is handed out
+- Recycling: a driver is quit and replaced after max_pages page loads, when
+  its JS heap exceeds max_memory_mb, or when it fails a health check or
+  raises a WebDriverException during a lease
+- Lightweight: pooled drivers are scraping sessions, so images, media,
+  fonts and trackers are blocked (BrowserConfig.block_resources)
+- Stats: utilization, leases, queue wait times, launches and recycles
+
+Config (env):
+- BROWSER_POOL_SIZE: drivers per pool (default 2)
+- BROWSER_POOL_MAX_PAGES: page loads before a driver is recycled (default 50)
+- BROWSER_POOL_MAX_MEMORY_MB: JS heap limit before recycling (default 512)
+- BROWSER_BLOCK_RESOURCES: 'false' loads every resource (default: block)
+- BROWSER_RESOURCE_ALLOWLIST: per-domain categories to let through,
+  e.g. "site.edu:images,fonts;other.com:css"
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from browser.manager import BrowserManager, BrowserConfig, resource_allowlist_from_env
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', '2'))
+DEFAULT_MAX_PAGES = int(os.environ.get('BROWSER_POOL_MAX_PAGES', '50'))
+DEFAULT_MAX_MEMORY_MB = int(os.environ.get('BROWSER_POOL_MAX_MEMORY_MB', '512'))
+BLOCK_RESOURCES = os.environ.get('BROWSER_BLOCK_RESOURCES', 'true').lower() not in ('false', '0', 'no', 'off')
+
+# Seconds a driver may sit idle before it is health-checked on checkout
+HEALTH_CHECK_IDLE = 30.0
+
+
+class PoolTimeout(Exception):
+    """No browser became free within the lease timeout."""
+
+
+class _Slot:
+    """One pooled BrowserManager and its bookkeeping."""
+
+    def __init__(self, manager: BrowserManager):
+        self.manager = manager
+        self.started_at = time.monotonic()
+        self.last_used = self.started_at
+        self.pages_at_start = manager.stats['pages_loaded']
+
+    @property
+    def pages(self) -> int:
+        return self.manager.stats['pages_loaded'] - self.pages_at_start
+
+
+class BrowserPool:
+    """
+    Bounded pool of warm, health-checked BrowserManagers.
+
+    Usage:
+        with BrowserPool(size=4) as pool:
+            with pool.lease() as browser:
+                html = browser.get_page(url)
+
+            # Or just
+            html = pool.get_page(url)
+
+            print(pool.get_stats()['utilization'])
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        config: Optional[BrowserConfig] = None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_memory_mb: int = DEFAULT_MAX_MEMORY_MB,
+    ):
+        self.size = max(1, size)
+        self.config = config or BrowserConfig(
+            headless=True,
+            block_resources=BLOCK_RESOURCES,
+            resource_allowlist=resource_allowlist_from_env(),
+        )
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+
+        self._idle: List[_Slot] = []
+        self._alive = 0       # Started or starting drivers (idle + leased)
+        self._busy = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._created_at = time.monotonic()
+        self._busy_seconds = 0.0
+        self.stats = {
+            'leases': 0,
+            'waits': 0,
+            'wait_ms_total': 0,
+            'max_wait_ms': 0,
+            'launches': 0,
+            'launch_failures': 0,
+            'launch_ms_total': 0,
+            'recycles': 0,
+            'recycled_pages': 0,
+            'recycled_memory': 0,
+            'recycled_unhealthy': 0,
+            'recycled_error': 0,
+            'pages': 0,
+            'bytes_transferred': 0,
+            'load_ms_total': 0,
+        }
+
+    # ------------------------------------------
+    # Lifecycle
+    # ------------------------------------------
+
+    def start(self) -> int:
+        """Launch every driver up front, in parallel. Returns how many started."""
+        with self._cond:
+            missing = self.size - self._alive
+            self._alive += missing
+        if missing <= 0:
+            return 0
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            slots = list(executor.map(lambda _: self._launch(), range(missing)))
+        with self._cond:
+            for slot in slots:
+                if slot is None:
+                    self._alive -= 1
+                else:
+                    self._idle.append(slot)
+            self._cond.notify_all()
+        return sum(1 for slot in slots if slot is not None)
+
+    def close(self) -> None:
+        """Quit idle drivers now; leased ones are quit when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._alive -= len(idle)
+            self._cond.notify_all()
+        for slot in idle:
+            slot.manager.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------
+    # Leasing
+    # ------------------------------------------
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """
+        Borrow a started BrowserManager, queueing until one is free.
+
+        Raises:
+            PoolTimeout: nothing became free within `timeout` seconds
+            RuntimeError: the pool is closed or Chrome failed to launch
+        """
+        slot = self._acquire(timeout)
+        leased_at = time.monotonic()
+        before = slot.manager.stats
+        failed = False
+        try:
+            yield slot.manager
+        except WebDriverException:
+            failed = True
+            raise
+        finally:
+            self._add_page_metrics(before, slot.manager.stats)
+            self._release(slot, time.monotonic() - leased_at, failed)
+
+    def get_page(self, url: str, timeout: Optional[float] = None, **kwargs) -> Optional[str]:
+        """Load one page on a pooled browser (see BrowserManager.get_page)."""
+        with self.lease(timeout) as browser:
+            return browser.get_page(url, **kwargs)
+
+    def _acquire(self, timeout: Optional[float]) -> _Slot:
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        waited = False
+        while True:
+            launch = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+                    if self._idle:
+                        slot = self._idle.pop()
+                        self._busy += 1
+                        break
+                    if self._alive < self.size:
+                        self._alive += 1
+                        self._busy += 1
+                        launch = True
+                        slot = None
+                        break
+                    waited = True
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise PoolTimeout(f"No browser free within {timeout}s")
+                    self._cond.wait(remaining)
+
+            if launch:
+                slot = self._launch()
+                if slot is None:
+                    with self._cond:
+                        self._alive -= 1
+                        self._busy -= 1
+                        self._cond.notify()
+                    raise RuntimeError("Failed to launch browser")
+            elif not self._healthy(slot):
+                self._count('recycled_unhealthy')
+                self._discard(slot)
+                continue
+
+            wait_ms = int((time.monotonic() - start) * 1000)
+            with self._cond:
+                self.stats['leases'] += 1
+                if waited:
+                    self.stats['waits'] += 1
+                    self.stats['wait_ms_total'] += wait_ms
+                    self.stats['max_wait_ms'] = max(self.stats['max_wait_ms'], wait_ms)
+            return slot
+
+    def _release(self, slot: _Slot, busy_seconds: float, failed: bool) -> None:
+        slot.last_used = time.monotonic()
+        reason = 'recycled_error' if failed else self._recycle_reason(slot)
+        with self._cond:
+            self._busy -= 1
+            self._busy_seconds += busy_seconds
+            keep = reason is None and not self._closed
+            if keep:
+                self._idle.append(slot)
+                self._cond.notify()
+        if not keep:
+            if reason:
+                self._count(reason)
+            self._discard(slot, leased=False)
+
+    # ------------------------------------------
+    # Driver management
+    # ------------------------------------------
+
+    def _launch(self) -> Optional[_Slot]:
+        start = time.monotonic()
+        manager = BrowserManager(self.config)
+        started = manager.start()
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        with self._cond:
+            if started:
+                self.stats['launches'] += 1
+                self.stats['launch_ms_total'] += elapsed_ms
+            else:
+                self.stats['launch_failures'] += 1
+        return _Slot(manager) if started else None
+
+    def _discard(self, slot: _Slot, leased: bool = True) -> None:
+        """Quit a driver and free its place in the pool."""
+        slot.manager.stop()
+        with self._cond:
+            self._alive -= 1
+            if leased:
+                self._busy -= 1
+            self._cond.notify()
+
+    def _healthy(self, slot: _Slot) -> bool:
+        if time.monotonic() - slot.last_used < HEALTH_CHECK_IDLE:
+            return True
+        try:
+            return slot.manager.driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def _recycle_reason(self, slot: _Slot) -> Optional[str]:
+        if self.max_pages and slot.pages >= self.max_pages:
+            return 'recycled_pages'
+        if self.max_memory_mb and self._memory_mb(slot) > self.max_memory_mb:
+            return 'recycled_memory'
+        return None
+
+    @staticmethod
+    def _memory_mb(slot: _Slot) -> float:
+        """JS heap in use by the driver's current page (Chrome only)."""
+        try:
+            used = slot.manager.driver.execute_script(
+                'return performance.memory ? performance.memory.usedJSHeapSize : 0')
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def _add_page_metrics(self, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+        """Fold one lease's page loads, bytes and load time into the pool totals."""
+        pages = after['pages_loaded'] - before['pages_loaded']
+        if pages <= 0:
+            return
+        with self._cond:
+            self.stats['pages'] += pages
+            self.stats['bytes_transferred'] += after['bytes_transferred'] - before['bytes_transferred']
+            self.stats['load_ms_total'] += after['load_ms_total'] - before['load_ms_total']
+
+    def _count(self, key: str) -> None:
+        with self._cond:
+            self.stats[key] += 1
+            if key.startswith('recycled_'):
+                self.stats['recycles'] += 1
+
+    # ------------------------------------------
+    # Stats
+    # ------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus utilization (busy driver-seconds / pool-seconds so far)."""
+        with self._cond:
+            stats = dict(self.stats)
+            elapsed = time.monotonic() - self._created_at
+            stats.update({
+                'size': self.size,
+                'alive': self._alive,
+                'busy': self._busy,
+                'idle': len(self._idle),
+                'utilization': round(self._busy_seconds / (elapsed * self.size), 3) if elapsed else 0.0,
+                'avg_wait_ms': round(stats['wait_ms_total'] / stats['waits']) if stats['waits'] else 0,
+                'avg_launch_ms': round(stats['launch_ms_total'] / stats['launches']) if stats['launches'] else 0,
+            })
+            stats['avg_page_bytes'] = stats['bytes_transferred'] // stats['pages'] if stats['pages'] else 0
+            stats['avg_load_ms'] = round(stats['load_ms_total'] / stats['pages']) if stats['pages'] else 0
+        return stats
+
+
+__all__ = [
+    'BrowserPool',
+    'PoolTimeout',
+]
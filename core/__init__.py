@@ -50,6 +50,7 @@ from core.normalizer import (
 from core.classifier import (
     RoleClassifier,
     classify_role,
+    classify_many,
     is_ol_coach,
     is_recruiting_coordinator,
     get_classifier,
@@ -87,6 +88,7 @@ __all__ = [
     # Classifier
     'RoleClassifier',
     'classify_role',
+    'classify_many',
     'is_ol_coach',
     'is_recruiting_coordinator',
     'get_classifier',
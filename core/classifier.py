@@ -19,12 +19,12 @@ Design Principles:
 - Full audit trail for debugging
 
 Author: Coach Outreach System
-Version: 2.0.0
+Version: 2.1.0
 ============================================================================
 """
 
 import re
-from typing import List, Dict, Optional, Tuple, Set, Pattern
+from typing import List, Dict, Iterable, Optional, Tuple, Set, Pattern
 from dataclasses import dataclass
 from functools import lru_cache
 
@@ -110,6 +110,15 @@ ABBREVIATIONS: Dict[str, Tuple[str, bool]] = {
 }
 
 
+# One alternation over every abbreviation, longest first, so a title is
+# scanned once instead of once per abbreviation
+_ABBREVIATION_RE: Pattern = re.compile(
+    '|'.join(r'\b' + re.escape(abbrev) + r'\b'
+             for abbrev in sorted(ABBREVIATIONS.keys(), key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
 def expand_abbreviations(text: str) -> str:
     """
     Expand known abbreviations in text.
@@ -125,18 +134,9 @@ def expand_abbreviations(text: str) -> str:
     if not text:
         return ""
     
-    result = text.lower()
-    
-    # Sort by length (longest first) to handle overlapping patterns
-    sorted_abbrevs = sorted(ABBREVIATIONS.keys(), key=len, reverse=True)
-    
-    for abbrev in sorted_abbrevs:
-        expansion, _ = ABBREVIATIONS[abbrev]
-        # Use word boundary matching
-        pattern = r'\b' + re.escape(abbrev) + r'\b'
-        result = re.sub(pattern, expansion, result, flags=re.IGNORECASE)
-    
-    return result
+    return _ABBREVIATION_RE.sub(
+        lambda m: ABBREVIATIONS[m.group(0).lower()][0], text.lower()
+    )
 
 
 # ============================================================================
@@ -497,6 +497,11 @@ EXCLUSION_PATTERNS: List[Pattern] = [
     re.compile(r'\bsecurity\b', re.I),
 ]
 
+# Any exclusion at all; most titles miss, so the per-pattern loop is skipped
+_ANY_EXCLUSION_RE: Pattern = re.compile(
+    '|'.join(f'(?:{p.pattern})' for p in EXCLUSION_PATTERNS), re.IGNORECASE
+)
+
 
 def is_excluded_role(title: str) -> Tuple[bool, Optional[str]]:
     """
@@ -506,6 +511,8 @@ def is_excluded_role(title: str) -> Tuple[bool, Optional[str]]:
         Tuple of (is_excluded, matched_pattern)
     """
     title_lower = title.lower()
+    if not _ANY_EXCLUSION_RE.search(title_lower):
+        return False, None
     
     for pattern in EXCLUSION_PATTERNS:
         if pattern.search(title_lower):
@@ -518,6 +525,14 @@ def is_excluded_role(title: str) -> Tuple[bool, Optional[str]]:
 # MAIN CLASSIFICATION ENGINE
 # ============================================================================
 
+# Normalized titles whose classification is kept in memory per classifier;
+# staff directories repeat the same few hundred titles
+TITLE_CACHE_SIZE = 10000
+
+# (role, confidence, pattern, segment, inference chain or None) per match
+_Match = Tuple[CanonicalRole, int, RolePattern, str, Optional[List[str]]]
+
+
 class RoleClassifier:
     """
     Enterprise-grade role classification engine.
@@ -530,18 +545,37 @@ class RoleClassifier:
     5. Validation: Apply exclusion rules and sanity checks
     6. Ranking: Select best matches
     
+    Matching is fingerprinted: each pattern group (OL, RC) is compiled into
+    one alternation, and a segment only runs the group's individual patterns
+    when that alternation hits. Matches are cached per normalized title, and
+    the inference chain is only built when audit output is requested.
+    
     Usage:
         classifier = RoleClassifier()
         results = classifier.classify("Run Game Coordinator / Offensive Line Coach")
         
         for result in results:
             print(f"{result.role}: {result.confidence}%")
+        
+        # With the reasoning behind each match
+        results = classifier.classify("OL / Recruiting Coordinator", audit=True)
     """
     
-    def __init__(self):
-        """Initialize the classifier with default configuration."""
+    def __init__(self, audit: bool = False, cache_size: int = TITLE_CACHE_SIZE):
+        """
+        Initialize the classifier.
+        
+        Args:
+            audit: Fill RoleClassification.inference_chain by default
+            cache_size: Normalized titles to keep classified in memory (0 disables)
+        """
         self.normalizer = get_normalizer()
+        self.audit = audit
         self._compile_patterns()
+        # Raw titles differ only in case/whitespace/separators far more often
+        # than in wording, so both steps are cached
+        self._normalize = lru_cache(maxsize=cache_size)(normalize_title) if cache_size else normalize_title
+        self._cached_matches = lru_cache(maxsize=cache_size)(self._match_title) if cache_size else None
     
     def _compile_patterns(self) -> None:
         """Pre-compile all regex patterns for performance."""
@@ -554,8 +588,18 @@ class RoleClassifier:
         self._rc_patterns: List[Tuple[Pattern, RolePattern]] = [
             (p.compiled, p) for p in RC_PATTERNS
         ]
+        
+        # Group fingerprints: matches iff some pattern in the group matches
+        self._pattern_groups: List[Tuple[Pattern, List[Tuple[Pattern, RolePattern]]]] = [
+            (self._combine(OL_PATTERNS), self._ol_patterns),
+            (self._combine(RC_PATTERNS), self._rc_patterns),
+        ]
+    
+    @staticmethod
+    def _combine(patterns: List[RolePattern]) -> Pattern:
+        return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns), re.IGNORECASE)
     
-    def classify(self, title: str) -> List[RoleClassification]:
+    def classify(self, title: str, audit: Optional[bool] = None) -> List[RoleClassification]:
         """
         Classify a title into canonical roles.
         
@@ -563,6 +607,7 @@ class RoleClassifier:
         
         Args:
             title: The job title to classify
+            audit: Fill inference_chain on each result (default: self.audit)
             
         Returns:
             List of RoleClassification results, sorted by confidence (highest first)
@@ -570,81 +615,152 @@ class RoleClassifier:
         if not title or not title.strip():
             return []
         
-        results: List[RoleClassification] = []
-        inference_chain: List[str] = []
+        return self._results(title, self._matches(title, audit))
+    
+    def classify_many(
+        self,
+        titles: Iterable[str],
+        audit: Optional[bool] = None,
+    ) -> Dict[str, List[RoleClassification]]:
+        """
+        Classify a batch of titles, e.g. every title in a staff directory.
+        
+        Each distinct normalized title is matched once, however many raw
+        variants or repeats of it the batch contains (and regardless of the
+        LRU cache size).
+        
+        Args:
+            titles: Titles to classify
+            audit: Fill inference_chain on each result (default: self.audit)
+            
+        Returns:
+            Mapping of each distinct input title to its classify() result
+        """
+        results: Dict[str, List[RoleClassification]] = {}
+        by_normalized: Dict[str, Tuple[_Match, ...]] = {}
+        audit = audit if audit is not None else self.audit
+        
+        for title in titles:
+            if title in results:
+                continue
+            if not title or not title.strip():
+                results[title] = []
+                continue
+            if audit:
+                # Chains start with the raw title, so they aren't shared
+                results[title] = self._results(title, self._matches(title, True))
+                continue
+            normalized = self._normalize(title)
+            matches = by_normalized.get(normalized)
+            if matches is None:
+                matches = by_normalized[normalized] = self._matches(title, False, normalized)
+            results[title] = self._results(title, matches)
         
-        # Step 1: Store original
-        original_title = title
-        inference_chain.append(f"Original: '{title}'")
+        return results
+    
+    def _matches(
+        self,
+        title: str,
+        audit: Optional[bool],
+        normalized: Optional[str] = None,
+    ) -> Tuple[_Match, ...]:
+        normalized = normalized if normalized is not None else self._normalize(title)
+        if audit if audit is not None else self.audit:
+            return self._match_title(normalized, [f"Original: '{title}'"])
+        if self._cached_matches is not None:
+            return self._cached_matches(normalized)
+        return self._match_title(normalized)
+    
+    @staticmethod
+    def _results(title: str, matches: Tuple[_Match, ...]) -> List[RoleClassification]:
+        # Fresh results per call: callers attach them to StaffMembers
+        return [
+            RoleClassification(
+                role=role,
+                confidence=confidence,
+                matched_pattern=pattern_def.pattern,
+                matched_segment=segment,
+                original_title=title,
+                inference_chain=chain if chain is not None else [],
+            )
+            for role, confidence, pattern_def, segment, chain in matches
+        ]
+    
+    def _match_title(
+        self,
+        normalized: str,
+        inference_chain: Optional[List[str]] = None,
+    ) -> Tuple[_Match, ...]:
+        """
+        Best match per role for a normalized title, highest confidence first.
         
-        # Step 2: Normalize
-        normalized = normalize_title(title)
-        inference_chain.append(f"Normalized: '{normalized}'")
+        Args:
+            normalized: Output of normalize_title()
+            inference_chain: Audit trail to extend, or None to skip building it
+        """
+        audit = inference_chain is not None
+        if audit:
+            inference_chain.append(f"Normalized: '{normalized}'")
         
-        # Step 3: Check exclusions first
+        # Check exclusions first
         is_excluded, exclusion_pattern = is_excluded_role(normalized)
         if is_excluded:
-            inference_chain.append(f"EXCLUDED: Matched exclusion pattern '{exclusion_pattern}'")
-            return []  # Return empty - this is not a coaching role
+            if audit:
+                inference_chain.append(f"EXCLUDED: Matched exclusion pattern '{exclusion_pattern}'")
+            return ()  # Not a coaching role
         
-        # Step 4: Expand abbreviations
+        # Expand abbreviations
         expanded = expand_abbreviations(normalized)
-        if expanded != normalized:
+        if audit and expanded != normalized:
             inference_chain.append(f"Expanded: '{expanded}'")
         
-        # Step 5: Split multi-role titles
+        # Split multi-role titles
         segments = split_multi_role_title(expanded)
-        inference_chain.append(f"Segments: {segments}")
+        if audit:
+            inference_chain.append(f"Segments: {segments}")
         
-        # Step 6: Classify each segment
+        # Classify each segment
+        matches: List[_Match] = []
         for segment in segments:
             # Skip very short segments
             if len(segment) < 2:
                 continue
             
-            segment_chain = list(inference_chain)
-            segment_chain.append(f"Processing segment: '{segment}'")
+            segment_chain = None
+            if audit:
+                segment_chain = list(inference_chain)
+                segment_chain.append(f"Processing segment: '{segment}'")
             
-            # Try OL patterns
-            ol_matches = self._match_patterns(segment, self._ol_patterns, segment_chain)
-            results.extend(ol_matches)
-            
-            # Try RC patterns
-            rc_matches = self._match_patterns(segment, self._rc_patterns, segment_chain)
-            results.extend(rc_matches)
-        
-        # Step 7: Deduplicate and sort
-        results = self._deduplicate_results(results)
-        results.sort(key=lambda r: r.confidence, reverse=True)
-        
-        # Step 8: Set original title on all results
-        for result in results:
-            result.original_title = original_title
+            for fingerprint, patterns in self._pattern_groups:
+                if fingerprint.search(segment):
+                    matches.extend(self._match_patterns(segment, patterns, segment_chain))
         
-        return results
+        # Deduplicate and sort
+        matches = self._deduplicate_results(matches)
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return tuple(matches)
     
     def _match_patterns(
         self, 
         text: str, 
         patterns: List[Tuple[Pattern, RolePattern]],
-        inference_chain: List[str]
-    ) -> List[RoleClassification]:
+        inference_chain: Optional[List[str]] = None,
+    ) -> List[_Match]:
         """
         Match text against a list of patterns.
         
         Args:
             text: Text to match
             patterns: List of (compiled_pattern, RolePattern) tuples
-            inference_chain: Audit trail
+            inference_chain: Audit trail, or None
             
         Returns:
             List of matches
         """
-        matches: List[RoleClassification] = []
+        matches: List[_Match] = []
         
         for compiled, pattern_def in patterns:
-            match = compiled.search(text)
-            if match:
+            if compiled.search(text):
                 # Calculate confidence with adjustments
                 confidence = pattern_def.base_confidence
                 
@@ -652,41 +768,36 @@ class RoleClassifier:
                 if pattern_def.requires_context and not pattern_def.is_primary:
                     confidence = min(confidence, 60)  # Cap context-dependent matches
                 
-                # Create result
-                result_chain = list(inference_chain)
-                result_chain.append(
-                    f"MATCH: Pattern '{pattern_def.pattern}' -> "
-                    f"{pattern_def.role.value} ({confidence}%)"
-                )
-                result_chain.append(f"Description: {pattern_def.description}")
+                result_chain = None
+                if inference_chain is not None:
+                    result_chain = list(inference_chain)
+                    result_chain.append(
+                        f"MATCH: Pattern '{pattern_def.pattern}' -> "
+                        f"{pattern_def.role.value} ({confidence}%)"
+                    )
+                    result_chain.append(f"Description: {pattern_def.description}")
                 
-                matches.append(RoleClassification(
-                    role=pattern_def.role,
-                    confidence=confidence,
-                    matched_pattern=pattern_def.pattern,
-                    matched_segment=text,
-                    original_title="",  # Will be set by caller
-                    inference_chain=result_chain
-                ))
+                matches.append((pattern_def.role, confidence, pattern_def, text, result_chain))
         
         return matches
     
-    def _deduplicate_results(
-        self, 
-        results: List[RoleClassification]
-    ) -> List[RoleClassification]:
+    def _deduplicate_results(self, results: List[_Match]) -> List[_Match]:
         """
         Deduplicate results, keeping highest confidence for each role.
         """
-        best_by_role: Dict[CanonicalRole, RoleClassification] = {}
+        best_by_role: Dict[CanonicalRole, _Match] = {}
         
         for result in results:
-            existing = best_by_role.get(result.role)
-            if existing is None or result.confidence > existing.confidence:
-                best_by_role[result.role] = result
+            existing = best_by_role.get(result[0])
+            if existing is None or result[1] > existing[1]:
+                best_by_role[result[0]] = result
         
         return list(best_by_role.values())
     
+    def cache_info(self):
+        """functools cache statistics for the normalized-title cache, or None."""
+        return self._cached_matches.cache_info() if self._cached_matches is not None else None
+    
     def classify_as_ol(self, title: str) -> Tuple[bool, int, Optional[RoleClassification]]:
         """
         Check if title indicates an Offensive Line Coach.
@@ -765,6 +876,11 @@ def classify_role(title: str) -> List[RoleClassification]:
     return get_classifier().classify(title)
 
 
+def classify_many(titles: Iterable[str]) -> Dict[str, List[RoleClassification]]:
+    """Convenience function for bulk classification; see RoleClassifier.classify_many."""
+    return get_classifier().classify_many(titles)
+
+
 def is_ol_coach(title: str) -> Tuple[bool, int]:
     """Check if title indicates OL coach. Returns (is_ol, confidence)."""
     is_ol, conf, _ = get_classifier().classify_as_ol(title)
@@ -784,7 +900,9 @@ def is_recruiting_coordinator(title: str) -> Tuple[bool, int]:
 __all__ = [
     'RoleClassifier',
     'RolePattern',
+    'TITLE_CACHE_SIZE',
     'classify_role',
+    'classify_many',
     'is_ol_coach',
     'is_recruiting_coordinator',
     'get_classifier',
@@ -90,6 +90,7 @@ class ExtractionStrategy(Enum):
     TABLE_PARSING = auto()      # HTML table structures
     TEXT_PATTERN = auto()       # Raw text pattern matching
     FALLBACK_SCAN = auto()      # Last-resort full-page scan
+    VENDOR_LAYOUT = auto()      # Known CMS vendor markup (Sidearm, Presto, WMT)
     
     def __str__(self) -> str:
         return self.name.lower().replace('_', ' ').title()
@@ -299,6 +300,12 @@ class StaffMember:
     # Internal tracking
     _id: str = field(default="", repr=False)
     
+    # (roles list, its length, {role: confidence}); rebuilt when roles is
+    # reassigned or appended to
+    _role_confidence: Optional[Tuple[List[RoleClassification], int, Dict[CanonicalRole, int]]] = field(
+        default=None, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Generate unique ID and validate data."""
         # Generate deterministic ID
@@ -361,10 +368,13 @@ class StaffMember:
     
     def get_role_confidence(self, role: CanonicalRole) -> int:
         """Get confidence score for a specific role (0 if not found)."""
-        for r in self.roles:
-            if r.role == role:
-                return r.confidence
-        return 0
+        cached = self._role_confidence
+        if cached is None or cached[0] is not self.roles or cached[1] != len(self.roles):
+            confidences: Dict[CanonicalRole, int] = {}
+            for r in self.roles:
+                confidences.setdefault(r.role, r.confidence)
+            cached = self._role_confidence = (self.roles, len(self.roles), confidences)
+        return cached[2].get(role, 0)
     
     def is_ol_coach(self) -> Tuple[bool, int]:
         """Check if this is an OL coach. Returns (is_ol, confidence)."""
@@ -423,6 +433,7 @@ class ExtractionResult:
         errors: Any errors encountered
         warnings: Non-fatal issues
         html_hash: Hash of source HTML (for cache validation)
+        vendor: Athletics CMS vendor detected from the markup ('' if none)
         needs_review: Whether manual review is needed
         review_reasons: Why review is needed
     """
@@ -448,6 +459,7 @@ class ExtractionResult:
     
     # Validation
     html_hash: str = ""
+    vendor: str = ""
     extracted_at: datetime = field(default_factory=datetime.now)
     
     # Review status
@@ -530,6 +542,7 @@ class ExtractionResult:
             'warnings': self.warnings,
             'needs_review': self.needs_review,
             'review_reasons': self.review_reasons,
+            'vendor': self.vendor,
             'extracted_at': self.extracted_at.isoformat(),
         }
     
@@ -1 +1,2 @@
 from .supabase_client import get_db, SupabaseDB
+from .sqlite_client import SQLiteDB
@@ -0,0 +1,106 @@
+"""
+RecruitSignal — Coach search ranking
+Python twin of the search_coaches() RPC in supabase_migration_coach_search.sql.
+The replica, the SQLite backend and the PostgREST fallback rank with these
+functions so every backend returns the same order for the same query.
+"""
+
+import re
+
+_WORD_RE = re.compile(r'[0-9a-z]+')
+
+# Match tiers: coach name/email contains the query, or only the school does
+TIER_COACH = 0
+TIER_SCHOOL = 1
+
+OUTREACH_FIELDS = ('coach_email', 'email_type', 'status', 'sent_at', 'opened', 'open_count',
+                   'replied', 'replied_at', 'reply_snippet', 'reply_sentiment')
+
+
+def trigrams(text):
+    """pg_trgm's show_trgm(): lowercase words padded with two leading spaces and one trailing."""
+    grams = set()
+    for word in _WORD_RE.findall((text or '').lower()):
+        padded = f'  {word} '
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+def similarity(query_grams, text):
+    """pg_trgm's similarity(): shared trigrams over the union of both sets."""
+    return gram_similarity(query_grams, trigrams(text))
+
+
+def gram_similarity(query_grams, grams):
+    """similarity() against an already computed trigram set."""
+    if not query_grams or not grams:
+        return 0.0
+    shared = len(query_grams & grams)
+    return shared / (len(query_grams) + len(grams) - shared)
+
+
+def match_tier(needle, coach, school_name):
+    """TIER_COACH / TIER_SCHOOL for a substring match on the lowercased needle, else None."""
+    if needle in (coach.get('name') or '').lower() or needle in (coach.get('email') or '').lower():
+        return TIER_COACH
+    if needle in (school_name or '').lower():
+        return TIER_SCHOOL
+    return None
+
+
+def rank_key(query_grams, tier, coach, school_name):
+    score = max(similarity(query_grams, coach.get('name')),
+                similarity(query_grams, coach.get('email')),
+                similarity(query_grams, school_name))
+    return (tier, -score, coach.get('name') or '')
+
+
+def rank_coaches(query, coaches, limit=None):
+    """Order coaches (with embedded 'schools') the way the RPC does, dropping non-matches."""
+    needle = query.lower()
+    query_grams = trigrams(query)
+    ranked = []
+    for coach in coaches:
+        school_name = (coach.get('schools') or {}).get('name')
+        tier = match_tier(needle, coach, school_name)
+        if tier is not None:
+            ranked.append((rank_key(query_grams, tier, coach, school_name), coach))
+    ranked.sort(key=lambda pair: pair[0])
+    coaches = [coach for _, coach in ranked]
+    return coaches[:limit] if limit is not None else coaches
+
+
+def search_result(coach, outreach_rows):
+    """API row for /api/coach/search from a coach and its outreach (newest first)."""
+    school_info = coach.get('schools') or {}
+    latest = outreach_rows[0] if outreach_rows else None
+    replied = next((o for o in outreach_rows if o.get('replied')), None)
+    return {
+        'id': coach.get('id'),
+        'name': coach.get('name', ''),
+        'email': coach.get('email', ''),
+        'role': coach.get('role', ''),
+        'school': school_info.get('name', '') if isinstance(school_info, dict) else '',
+        'division': school_info.get('division', '') if isinstance(school_info, dict) else '',
+        'responded': replied is not None,
+        'responded_at': replied.get('replied_at') if replied else None,
+        'response_sentiment': replied.get('reply_sentiment') if replied else None,
+        'outreach': latest,
+    }
+
+
+def rpc_result(row):
+    """API row from a search_coaches() RPC row."""
+    return {
+        'id': row.get('id'),
+        'name': row.get('name') or '',
+        'email': row.get('email') or '',
+        'role': row.get('role') or '',
+        'school': row.get('school_name') or '',
+        'division': row.get('division') or '',
+        'responded': bool(row.get('responded')),
+        'responded_at': row.get('responded_at'),
+        'response_sentiment': row.get('response_sentiment'),
+        'outreach': row.get('outreach'),
+    }
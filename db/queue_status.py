@@ -0,0 +1,265 @@
+"""
+RecruitSignal — Per-athlete email queue status summary
+Keeps the /api/email/queue-status counters up to date incrementally instead
+of re-reading schools, coaches and outreach on every request.
+"""
+
+import threading
+
+# Map athlete position to coach role (same table the DB layer uses)
+POSITION_TO_ROLE = {
+    'OL': 'ol', 'WR': 'wr', 'QB': 'qb', 'RB': 'rb', 'TE': 'te',
+    'DL': 'dl', 'LB': 'lb', 'DB': 'db', 'K': 'st', 'P': 'st', 'LS': 'st', 'ATH': 'ath'
+}
+
+COUNT_KEYS = ('new', 'followup_1', 'followup_2', 'done', 'replied')
+
+# Only the most recent N outreach rows per coach decide the stage
+OUTREACH_WINDOW = 5
+
+
+def position_role_for(athlete):
+    """Return the coach role matching an athlete row's position."""
+    position = (athlete.get('positions') or athlete.get('position') or 'OL').upper() if athlete else 'OL'
+    return POSITION_TO_ROLE.get(position, 'ol')
+
+
+def coach_matches_preference(role, preference, position_role):
+    """Check a coach role against a school's coach_preference."""
+    role = (role or '').lower()
+    if preference == 'position_coach':
+        return role == position_role
+    if preference == 'rc':
+        return role == 'rc'
+    if preference == 'both':
+        return role in ('rc', position_role)
+    return True
+
+
+def compute_email_stage(outreach_records):
+    """Given a coach's outreach history, return their next email stage."""
+    if not outreach_records:
+        return 'new'
+    sent = [r for r in outreach_records if r.get('status') == 'sent']
+    if not sent:
+        return 'new'
+    types_sent = [r.get('email_type', '') for r in sent]
+    if 'followup_2' in types_sent:
+        return 'done'
+    if 'followup_1' in types_sent:
+        return 'followup_2'
+    return 'followup_1'  # 'intro' or any other sent email
+
+
+class AthleteQueueStatus:
+    """Queue-status counters for one athlete plus the per-coach state behind them.
+
+    coaches:  coach_id -> (email, school_id) for every coach that passes the
+              athlete's school preferences and position filter.
+    outreach: coach_email -> most recent outreach rows (newest first).
+    """
+
+    def __init__(self, athlete_id, position_role, school_prefs):
+        self.athlete_id = athlete_id
+        self.position_role = position_role
+        self.school_prefs = dict(school_prefs)
+        self.coaches = {}
+        self.outreach = {}
+        self._email_refs = {}
+        self._outreach_ids = {}
+        self.counts = {k: 0 for k in COUNT_KEYS}
+        self.counts['total_with_email'] = 0
+
+    # ------------------------------------------
+    # Classification
+    # ------------------------------------------
+
+    def _bucket(self, email):
+        records = self.outreach.get(email, [])[:OUTREACH_WINDOW]
+        if any(r.get('replied') for r in records):
+            return 'replied'
+        return compute_email_stage(records)
+
+    def _shift(self, email, bucket, delta):
+        refs = self._email_refs.get(email, 0)
+        if refs:
+            self.counts[bucket] += delta * refs
+
+    def _update_email(self, email, mutate):
+        """Apply mutate() to an email's outreach and move its counters."""
+        before = self._bucket(email)
+        mutate()
+        after = self._bucket(email)
+        if before != after:
+            self._shift(email, before, -1)
+            self._shift(email, after, 1)
+
+    # ------------------------------------------
+    # Coaches / schools
+    # ------------------------------------------
+
+    def add_coach(self, coach):
+        """Track a coach row if it matches this athlete's filters."""
+        email = (coach.get('email') or '').strip()
+        school_id = coach.get('school_id')
+        if not email or school_id not in self.school_prefs:
+            return False
+        if not coach_matches_preference(coach.get('role'), self.school_prefs[school_id], self.position_role):
+            return False
+        if coach['id'] in self.coaches:
+            self.remove_coach(coach['id'])
+        self.coaches[coach['id']] = (email, school_id)
+        self._email_refs[email] = self._email_refs.get(email, 0) + 1
+        self.counts['total_with_email'] += 1
+        self.counts[self._bucket(email)] += 1
+        return True
+
+    def remove_coach(self, coach_id):
+        entry = self.coaches.pop(coach_id, None)
+        if not entry:
+            return False
+        email = entry[0]
+        self.counts['total_with_email'] -= 1
+        self.counts[self._bucket(email)] -= 1
+        self._email_refs[email] -= 1
+        if not self._email_refs[email]:
+            del self._email_refs[email]
+            self._drop_outreach(email)
+        return True
+
+    def has_email(self, email):
+        return email in self._email_refs
+
+    def load(self, coaches, outreach_rows):
+        """Bulk-add coaches with their outreach rows (ordered newest first)."""
+        fresh = {}
+        for row in outreach_rows:
+            email = row.get('coach_email')
+            # Rows already tracked for another school are authoritative
+            if email and not self.has_email(email):
+                fresh.setdefault(email, []).append(dict(row))
+        for email, rows in fresh.items():
+            self.outreach[email] = rows[:OUTREACH_WINDOW]
+            self._index_rows(email)
+        for coach in coaches:
+            self.add_coach(coach)
+        # Drop outreach fetched for coaches that did not pass the filters
+        for email in [e for e in self.outreach if e not in self._email_refs]:
+            self._drop_outreach(email)
+
+    def add_school(self, school_id, preference, coaches, outreach_rows):
+        """Start tracking a school with its coaches and their outreach rows."""
+        self.remove_school(school_id)
+        self.school_prefs[school_id] = preference
+        self.load(coaches, outreach_rows)
+
+    def remove_school(self, school_id):
+        if school_id not in self.school_prefs:
+            return
+        for coach_id in [cid for cid, (_, sid) in self.coaches.items() if sid == school_id]:
+            self.remove_coach(coach_id)
+        del self.school_prefs[school_id]
+
+    # ------------------------------------------
+    # Outreach events
+    # ------------------------------------------
+
+    def _index_rows(self, email):
+        for row in self.outreach.get(email, []):
+            if row.get('id'):
+                self._outreach_ids[row['id']] = email
+
+    def _drop_outreach(self, email):
+        for row in self.outreach.pop(email, []):
+            self._outreach_ids.pop(row.get('id'), None)
+
+    def record_outreach(self, row):
+        """A new outreach row was created (newest first, like sent_at DESC NULLS FIRST)."""
+        email = row.get('coach_email')
+        if not self.has_email(email):
+            return
+
+        def mutate():
+            rows = self.outreach.setdefault(email, [])
+            rows.insert(0, dict(row))
+            for old in rows[OUTREACH_WINDOW:]:
+                self._outreach_ids.pop(old.get('id'), None)
+            del rows[OUTREACH_WINDOW:]
+            self._index_rows(email)
+        self._update_email(email, mutate)
+
+    def update_outreach(self, outreach_id, **fields):
+        """Update a tracked outreach row (status changes, replies)."""
+        email = self._outreach_ids.get(outreach_id)
+        if email is None:
+            return False
+        for row in self.outreach.get(email, []):
+            if row.get('id') == outreach_id:
+                self._update_email(email, lambda: row.update(fields))
+                return True
+        return False
+
+    def has_outreach(self, outreach_id):
+        return outreach_id in self._outreach_ids
+
+    def snapshot(self):
+        return dict(self.counts)
+
+
+class QueueStatusStore:
+    """Thread-safe registry of AthleteQueueStatus summaries (one per athlete).
+
+    Every change that could affect an athlete's counts bumps a generation
+    (per athlete, or global when the athlete isn't known). A summary built
+    from unlocked reads is only installed if no bump happened meanwhile, so
+    a change that had no live summary to patch can't be overwritten by an
+    older snapshot."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_athlete = {}
+        self._generation = 0
+        self._athlete_generations = {}
+
+    @property
+    def lock(self):
+        return self._lock
+
+    def get(self, athlete_id):
+        return self._by_athlete.get(athlete_id)
+
+    def put(self, summary):
+        with self._lock:
+            self._by_athlete[summary.athlete_id] = summary
+
+    def generation(self, athlete_id):
+        with self._lock:
+            return self._generation, self._athlete_generations.get(athlete_id, 0)
+
+    def bump(self, athlete_id=None):
+        """Record a change for one athlete, or for all of them when athlete_id is None."""
+        with self._lock:
+            if athlete_id is None:
+                self._generation += 1
+            else:
+                self._athlete_generations[athlete_id] = self._athlete_generations.get(athlete_id, 0) + 1
+
+    def put_if_current(self, summary, generation):
+        """Install a summary built since `generation`; False if something changed meanwhile."""
+        with self._lock:
+            if self.generation(summary.athlete_id) != generation:
+                return False
+            self._by_athlete[summary.athlete_id] = summary
+            return True
+
+    def all(self):
+        return list(self._by_athlete.values())
+
+    def invalidate(self, athlete_id=None):
+        """Drop one athlete's summary, or all of them when athlete_id is None."""
+        with self._lock:
+            if athlete_id is None:
+                self._by_athlete.clear()
+            else:
+                self._by_athlete.pop(athlete_id, None)
+            self.bump(athlete_id)
@@ -0,0 +1,259 @@
+"""
+RecruitSignal — In-process replica of the coaches and schools tables
+Loads both tables once, then pulls rows changed since the last sync (by
+updated_at) on a short interval. Writes made through SupabaseDB are applied
+immediately, so the app's read paths never wait on PostgREST for them.
+"""
+
+import os
+import time
+import heapq
+import logging
+import threading
+from datetime import datetime, timezone
+
+from .coach_search import TIER_COACH, TIER_SCHOOL, gram_similarity, trigrams
+
+logger = logging.getLogger(__name__)
+
+# Seconds between delta pulls, and between full reloads (which also drop deleted rows)
+REPLICA_SYNC_INTERVAL = int(os.environ.get('REPLICA_SYNC_INTERVAL', '30'))
+REPLICA_FULL_RELOAD_INTERVAL = int(os.environ.get('REPLICA_FULL_RELOAD_INTERVAL', '3600'))
+
+PAGE_SIZE = 1000
+
+
+class CoachReplica:
+    """Read replica of coaches/schools kept in sync with the database."""
+
+    def __init__(self, client):
+        self.client = client
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self.schools = {}
+        self.coaches = {}
+        self._school_by_name = {}
+        self._coaches_by_school = {}
+        # id -> (lowercased name, lowercased email, name trigrams, email trigrams) for search
+        self._search_terms = {}
+        self._school_terms = {}
+        self._watermark = {'schools': None, 'coaches': None}
+        self.loaded = False
+        self.stats = {
+            'full_loads': 0,
+            'delta_syncs': 0,
+            'rows_pulled': 0,
+            'local_writes': 0,
+            'errors': 0,
+            'last_full_load_at': None,
+            'last_sync_at': None,
+            'last_sync_ms': None,
+            'last_error': None,
+        }
+        self._last_full_load = 0.0
+        self._last_sync = 0.0
+
+    # ------------------------------------------
+    # Loading / syncing
+    # ------------------------------------------
+
+    def _fetch_all(self, table, since=None):
+        rows = []
+        offset = 0
+        while True:
+            q = self.client.table(table).select('*')
+            if since:
+                q = q.gte('updated_at', since)
+            batch = q.order('updated_at').range(offset, offset + PAGE_SIZE - 1).execute().data or []
+            rows.extend(batch)
+            if len(batch) < PAGE_SIZE:
+                return rows
+            offset += PAGE_SIZE
+
+    def refresh(self, full=False):
+        """Pull changes now (full=True reloads both tables from scratch)."""
+        with self._sync_lock:
+            started = time.monotonic()
+            try:
+                if full or not self.loaded:
+                    schools = self._fetch_all('schools')
+                    coaches = self._fetch_all('coaches')
+                    with self._lock:
+                        self.schools, self.coaches = {}, {}
+                        self._school_by_name, self._coaches_by_school = {}, {}
+                        self._search_terms, self._school_terms = {}, {}
+                        self._watermark = {'schools': None, 'coaches': None}
+                        self._apply('schools', schools)
+                        self._apply('coaches', coaches)
+                        self.loaded = True
+                    self._last_full_load = time.monotonic()
+                    self.stats['full_loads'] += 1
+                    self.stats['last_full_load_at'] = datetime.now(timezone.utc).isoformat()
+                    pulled = len(schools) + len(coaches)
+                    logger.info("Coach replica loaded: %d schools, %d coaches", len(schools), len(coaches))
+                else:
+                    schools = self._fetch_all('schools', since=self._watermark['schools'])
+                    coaches = self._fetch_all('coaches', since=self._watermark['coaches'])
+                    with self._lock:
+                        self._apply('schools', schools)
+                        self._apply('coaches', coaches)
+                    self.stats['delta_syncs'] += 1
+                    pulled = len(schools) + len(coaches)
+                self.stats['rows_pulled'] += pulled
+                self._last_sync = time.monotonic()
+                self.stats['last_sync_at'] = datetime.now(timezone.utc).isoformat()
+                self.stats['last_sync_ms'] = round((time.monotonic() - started) * 1000, 1)
+                return True
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.stats['last_error'] = str(e)
+                logger.warning("Coach replica sync failed: %s", e)
+                return False
+
+    def ensure_fresh(self):
+        """Load on first use, then sync when the interval has passed.
+        Returns False when the replica can't serve reads (never loaded)."""
+        now = time.monotonic()
+        if not self.loaded:
+            return self.refresh(full=True)
+        if now - self._last_full_load >= REPLICA_FULL_RELOAD_INTERVAL:
+            self.refresh(full=True)
+        elif now - self._last_sync >= REPLICA_SYNC_INTERVAL and not self._sync_lock.locked():
+            self.refresh()
+        return True
+
+    # ------------------------------------------
+    # Applying rows (sync results and local writes)
+    # ------------------------------------------
+
+    def _apply(self, table, rows, advance_watermark=True):
+        """Merge rows into the maps. Only rows pulled by a sync move the watermark:
+        a local write stamped after the last sync would otherwise make the next
+        delta skip remote changes made in between."""
+        for row in rows:
+            if table == 'schools':
+                self._put_school(row)
+            else:
+                self._put_coach(row)
+            updated = row.get('updated_at')
+            if advance_watermark and updated and (self._watermark[table] is None or updated > self._watermark[table]):
+                self._watermark[table] = updated
+
+    def _put_school(self, row):
+        old = self.schools.get(row['id'])
+        if old and old.get('name') != row.get('name'):
+            self._school_by_name.pop(old.get('name'), None)
+        merged = {**old, **row} if old else dict(row)
+        self.schools[row['id']] = merged
+        self._school_by_name[merged.get('name')] = merged
+        self._school_terms[row['id']] = self._terms(merged)
+
+    def _put_coach(self, row):
+        old = self.coaches.get(row['id'])
+        merged = {**old, **row} if old else dict(row)
+        if old and old.get('school_id') != merged.get('school_id'):
+            self._coaches_by_school.get(old.get('school_id'), {}).pop(row['id'], None)
+        self.coaches[row['id']] = merged
+        self._coaches_by_school.setdefault(merged.get('school_id'), {})[row['id']] = merged
+        self._search_terms[row['id']] = self._terms(merged)
+
+    @staticmethod
+    def _terms(row):
+        name, email = row.get('name') or '', row.get('email') or ''
+        return name.lower(), email.lower(), trigrams(name), trigrams(email)
+
+    def apply_write(self, table, rows):
+        """Apply rows returned by an insert/update/upsert made by this process."""
+        if not self.loaded or not rows:
+            return
+        with self._lock:
+            self._apply(table, [r for r in rows if r.get('id')], advance_watermark=False)
+        self.stats['local_writes'] += len(rows)
+
+    # ------------------------------------------
+    # Reads
+    # ------------------------------------------
+
+    def _with_school(self, coach, fields):
+        school = self.schools.get(coach.get('school_id'))
+        embedded = {f: school.get(f) for f in fields} if school else None
+        return {**coach, 'schools': embedded}
+
+    def get_school(self, name):
+        with self._lock:
+            school = self._school_by_name.get(name)
+            return dict(school) if school else None
+
+    def all_schools(self):
+        with self._lock:
+            return sorted((dict(s) for s in self.schools.values()), key=lambda s: s.get('name') or '')
+
+    def coaches_for_schools(self, school_ids, with_email=False, school_fields=None):
+        results = []
+        with self._lock:
+            for school_id in school_ids:
+                for coach in self._coaches_by_school.get(school_id, {}).values():
+                    if with_email and not coach.get('email'):
+                        continue
+                    results.append(self._with_school(coach, school_fields) if school_fields else dict(coach))
+        return results
+
+    def coaches_with_schools(self, school_fields, limit=None, order_by='name'):
+        with self._lock:
+            coaches = sorted(self.coaches.values(), key=lambda c: (c.get(order_by) is None, c.get(order_by) or ''))
+            if limit is not None:
+                coaches = coaches[:limit]
+            return [self._with_school(c, school_fields) for c in coaches]
+
+    def find_coach_by_email(self, email, school_fields):
+        with self._lock:
+            for coach in self.coaches.values():
+                if coach.get('email') == email:
+                    return self._with_school(coach, school_fields)
+        return None
+
+    def search_coaches(self, query, school_fields, limit=30):
+        """Coaches whose name/email or school name contains query, ranked like the
+        search RPC (db/coach_search.py) using trigram sets computed at load time."""
+        needle = query.lower()
+        query_grams = trigrams(query)
+        ranked = []
+        with self._lock:
+            school_score = {}
+            for school_id, school in self.schools.items():
+                school_name, _, school_grams, _ = self._school_terms[school_id]
+                school_score[school_id] = (needle in school_name, gram_similarity(query_grams, school_grams))
+            for coach_id, coach in self.coaches.items():
+                name, email, name_grams, email_grams = self._search_terms[coach_id]
+                school_hit, score = school_score.get(coach.get('school_id'), (False, 0.0))
+                if needle in name or needle in email:
+                    tier = TIER_COACH
+                elif school_hit:
+                    tier = TIER_SCHOOL
+                else:
+                    continue
+                score = max(score, gram_similarity(query_grams, name_grams),
+                            gram_similarity(query_grams, email_grams))
+                ranked.append((tier, -score, coach.get('name') or '', coach_id))
+            top = heapq.nsmallest(limit, ranked)
+            return [self._with_school(self.coaches[entry[3]], school_fields) for entry in top]
+
+    # ------------------------------------------
+    # Metrics
+    # ------------------------------------------
+
+    def metrics(self):
+        now = time.monotonic()
+        with self._lock:
+            counts = {'schools': len(self.schools), 'coaches': len(self.coaches)}
+            watermark = dict(self._watermark)
+        return {
+            **self.stats,
+            **counts,
+            'loaded': self.loaded,
+            'seconds_since_sync': round(now - self._last_sync, 1) if self.loaded else None,
+            'seconds_since_full_load': round(now - self._last_full_load, 1) if self.loaded else None,
+            'sync_interval': REPLICA_SYNC_INTERVAL,
+            'full_reload_interval': REPLICA_FULL_RELOAD_INTERVAL,
+            'watermark': watermark,
+        }
@@ -0,0 +1,102 @@
+"""
+RecruitSignal — Daily send plan
+Materializes each athlete's ordered list of outreach candidates once so the
+tomorrow-preview endpoints and the sender share a single due-coach selection.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+# A plan is rebuilt at least this often to pick up changes made outside the app
+SEND_PLAN_TTL = timedelta(hours=24)
+
+# Upper bound on candidates kept per plan (previews look at 500)
+SEND_PLAN_SIZE = 500
+
+_EARLIEST = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def earliest_due(candidates, size=SEND_PLAN_SIZE):
+    """Keep the `size` candidates that come due first, in their original order.
+
+    Capping in selection order would let not-yet-due follow-ups crowd out
+    coaches that are due now further down the list."""
+    if len(candidates) <= size:
+        return list(candidates)
+    ranked = sorted(range(len(candidates)),
+                    key=lambda i: candidates[i].get('due_at') or _EARLIEST)
+    return [candidates[i] for i in sorted(ranked[:size])]
+
+
+class SendPlan:
+    """Ordered outreach candidates for one athlete.
+
+    Each entry is the dict returned by get_coaches_for_athlete_schools plus a
+    'due_at' datetime (None = due now). Keeping not-yet-due follow-ups lets one
+    plan answer "who is due" at any point until it expires.
+    """
+
+    def __init__(self, athlete_id, days_between, entries, built_at=None):
+        self.athlete_id = athlete_id
+        self.days_between = days_between
+        self.entries = list(entries)
+        self.built_at = built_at or datetime.now(timezone.utc)
+
+    def is_fresh(self, days_between, now=None):
+        now = now or datetime.now(timezone.utc)
+        return self.days_between == days_between and now - self.built_at < SEND_PLAN_TTL
+
+    def due(self, limit=None, now=None):
+        """Return entries due at `now`, in plan order, without the due_at field."""
+        now = now or datetime.now(timezone.utc)
+        results = []
+        for entry in self.entries:
+            due_at = entry.get('due_at')
+            if due_at is not None and due_at > now:
+                continue
+            results.append({k: v for k, v in entry.items() if k != 'due_at'})
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def discard(self, coach_email=None, coach_id=None):
+        """Drop entries for a coach that was just emailed, bounced or removed."""
+        before = len(self.entries)
+        self.entries = [e for e in self.entries
+                        if not ((coach_email and e.get('coach_email') == coach_email)
+                                or (coach_id and e.get('coach_id') == coach_id))]
+        return before - len(self.entries)
+
+
+class SendPlanStore:
+    """Thread-safe registry of SendPlans keyed by athlete."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._plans = {}
+
+    def get(self, athlete_id, days_between):
+        plan = self._plans.get(athlete_id)
+        if plan and plan.is_fresh(days_between):
+            return plan
+        return None
+
+    def put(self, plan):
+        with self._lock:
+            self._plans[plan.athlete_id] = plan
+
+    def discard(self, athlete_id=None, coach_email=None, coach_id=None):
+        """Remove a coach from one athlete's plan, or from every plan."""
+        with self._lock:
+            plans = [self._plans.get(athlete_id)] if athlete_id else list(self._plans.values())
+            for plan in plans:
+                if plan:
+                    plan.discard(coach_email=coach_email, coach_id=coach_id)
+
+    def invalidate(self, athlete_id=None):
+        """Drop one athlete's plan, or all of them when athlete_id is None."""
+        with self._lock:
+            if athlete_id is None:
+                self._plans.clear()
+            else:
+                self._plans.pop(athlete_id, None)
@@ -0,0 +1,721 @@
+"""
+RecruitSignal — Local SQLite backend
+Drop-in replacement for SupabaseDB for single-tenant and offline deployments.
+Enable with DB_BACKEND=sqlite (file from SQLITE_DB_PATH, default coaches.db).
+
+LocalClient mimics the part of the supabase-py / PostgREST query builder the
+app uses (table().select().eq()...execute()), so every SupabaseDB method and
+the direct `.client.table(...)` calls in app.py run unchanged on a local file.
+"""
+
+import os
+import re
+import json
+import uuid
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime, date
+
+from .supabase_client import SupabaseDB
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = Path(__file__).resolve().parent.parent / 'coaches.db'
+
+_NOW = "(strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))"
+
+# Mirrors supabase_schema.sql plus the later migrations. Columns the code
+# writes that aren't listed here are added on first use (see _ensure_columns).
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS schools (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    division TEXT,
+    conference TEXT,
+    state TEXT,
+    staff_url TEXT,
+    last_scraped_at TEXT,
+    staff_content_hash TEXT,
+    staff_scrape_count INTEGER DEFAULT 0,
+    staff_change_count INTEGER DEFAULT 0,
+    staff_changed_at TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+
+CREATE TABLE IF NOT EXISTS coaches (
+    id TEXT PRIMARY KEY,
+    school_id TEXT,
+    name TEXT NOT NULL,
+    title TEXT,
+    role TEXT,
+    email TEXT,
+    twitter TEXT,
+    phone TEXT,
+    verified BOOLEAN DEFAULT 0,
+    contacted_date TEXT,
+    notes TEXT,
+    responded BOOLEAN DEFAULT 0,
+    responded_at TEXT,
+    response_sentiment TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+CREATE INDEX IF NOT EXISTS idx_coaches_school ON coaches(school_id);
+CREATE INDEX IF NOT EXISTS idx_coaches_email ON coaches(email);
+CREATE INDEX IF NOT EXISTS idx_coaches_role ON coaches(role);
+CREATE INDEX IF NOT EXISTS idx_coaches_updated ON coaches(updated_at);
+
+CREATE TABLE IF NOT EXISTS athletes (
+    id TEXT PRIMARY KEY,
+    auth_user_id TEXT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE,
+    phone TEXT,
+    grad_year TEXT,
+    height TEXT,
+    weight TEXT,
+    positions TEXT,
+    gpa TEXT,
+    school TEXT,
+    state TEXT,
+    highlight_link TEXT,
+    profile_image TEXT,
+    password_hash TEXT,
+    is_admin BOOLEAN DEFAULT 0,
+    is_active BOOLEAN DEFAULT 1,
+    last_login TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+
+CREATE TABLE IF NOT EXISTS outreach (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT,
+    school_id TEXT,
+    coach_id TEXT,
+    coach_name TEXT,
+    coach_email TEXT,
+    coach_role TEXT,
+    school_name TEXT,
+    email_type TEXT DEFAULT 'intro',
+    subject TEXT,
+    body TEXT,
+    status TEXT DEFAULT 'pending',
+    tracking_id TEXT,
+    is_ai_generated BOOLEAN DEFAULT 0,
+    sent_at TEXT,
+    opened BOOLEAN DEFAULT 0,
+    opened_at TEXT,
+    open_count INTEGER DEFAULT 0,
+    replied BOOLEAN DEFAULT 0,
+    replied_at TEXT,
+    reply_sentiment TEXT,
+    reply_snippet TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+CREATE INDEX IF NOT EXISTS idx_outreach_athlete_coach_email ON outreach(athlete_id, coach_email);
+CREATE INDEX IF NOT EXISTS idx_outreach_athlete_status ON outreach(athlete_id, status);
+CREATE INDEX IF NOT EXISTS idx_outreach_coach_email ON outreach(coach_email);
+CREATE INDEX IF NOT EXISTS idx_outreach_tracking ON outreach(tracking_id);
+CREATE INDEX IF NOT EXISTS idx_outreach_sent_at ON outreach(sent_at);
+
+CREATE TABLE IF NOT EXISTS dm_queue (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT,
+    coach_id TEXT,
+    coach_name TEXT,
+    coach_twitter TEXT,
+    school_name TEXT,
+    message TEXT,
+    status TEXT DEFAULT 'pending',
+    sent_at TEXT,
+    followed_at TEXT,
+    marked_wrong_at TEXT,
+    notes TEXT,
+    needs_rescrape BOOLEAN DEFAULT 0,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+CREATE INDEX IF NOT EXISTS idx_dm_queue_athlete_status ON dm_queue(athlete_id, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_dm_queue_twitter ON dm_queue(coach_twitter);
+
+CREATE TABLE IF NOT EXISTS templates (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT,
+    name TEXT NOT NULL,
+    subject TEXT,
+    body TEXT NOT NULL,
+    template_type TEXT DEFAULT 'email',
+    coach_type TEXT,
+    is_active BOOLEAN DEFAULT 1,
+    usage_count INTEGER DEFAULT 0,
+    tone TEXT DEFAULT 'professional',
+    mode TEXT DEFAULT 'advanced',
+    description TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+CREATE INDEX IF NOT EXISTS idx_templates_athlete_id ON templates(athlete_id, template_type);
+
+CREATE TABLE IF NOT EXISTS settings (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT UNIQUE,
+    auto_send_enabled BOOLEAN DEFAULT 0,
+    auto_send_count INTEGER DEFAULT 25,
+    paused_until TEXT,
+    delay_between_emails INTEGER DEFAULT 3,
+    days_between_followups INTEGER DEFAULT 7,
+    max_followups INTEGER DEFAULT 3,
+    send_hour INTEGER DEFAULT 9,
+    timezone_offset INTEGER DEFAULT -5,
+    notifications_enabled BOOLEAN DEFAULT 0,
+    ntfy_channel TEXT,
+    auto_send_time TEXT,
+    email_sequence TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+
+CREATE TABLE IF NOT EXISTS athlete_credentials (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT UNIQUE,
+    gmail_client_id TEXT,
+    gmail_client_secret TEXT,
+    gmail_refresh_token TEXT,
+    gmail_email TEXT,
+    created_at TEXT DEFAULT {_NOW},
+    updated_at TEXT DEFAULT {_NOW}
+);
+
+CREATE TABLE IF NOT EXISTS athlete_schools (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT,
+    school_id TEXT,
+    coach_preference TEXT DEFAULT 'both',
+    added_at TEXT DEFAULT {_NOW},
+    UNIQUE(athlete_id, school_id)
+);
+CREATE INDEX IF NOT EXISTS idx_athlete_schools_school ON athlete_schools(school_id);
+
+CREATE TABLE IF NOT EXISTS school_requests (
+    id TEXT PRIMARY KEY,
+    athlete_id TEXT,
+    athlete_name TEXT,
+    school_name TEXT NOT NULL,
+    notes TEXT,
+    status TEXT DEFAULT 'pending',
+    created_at TEXT DEFAULT {_NOW},
+    completed_at TEXT,
+    completed_by TEXT,
+    staff_url TEXT,
+    scraped_data JSON,
+    scrape_status TEXT DEFAULT 'pending',
+    scrape_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_school_requests_status ON school_requests(status);
+CREATE INDEX IF NOT EXISTS idx_school_requests_athlete ON school_requests(athlete_id);
+
+CREATE TABLE IF NOT EXISTS email_queue_status (
+    athlete_id TEXT PRIMARY KEY,
+    counts JSON,
+    stale BOOLEAN DEFAULT 0,
+    updated_at TEXT DEFAULT {_NOW}
+);
+
+CREATE TABLE IF NOT EXISTS staff_page_changes (
+    id TEXT PRIMARY KEY,
+    school_id TEXT,
+    staff_url TEXT,
+    content_hash TEXT,
+    previous_hash TEXT,
+    coaches_updated INTEGER DEFAULT 0,
+    changes JSON,
+    detected_at TEXT DEFAULT {_NOW}
+);
+CREATE INDEX IF NOT EXISTS idx_staff_page_changes_school ON staff_page_changes(school_id, detected_at);
+"""
+
+_UPDATED_AT_TABLES = ['schools', 'coaches', 'athletes', 'outreach', 'dm_queue',
+                      'templates', 'settings', 'athlete_credentials']
+
+# Columns filled in Python when an insert doesn't provide them (gen_random_uuid() in Postgres)
+_UUID_DEFAULTS = {'outreach': ['tracking_id']}
+
+_IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def _ident(name):
+    if not _IDENT_RE.match(name or ''):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return f'"{name}"'
+
+
+def _split_top_level(text):
+    """Split on commas that aren't inside parentheses."""
+    parts, depth, current = [], 0, ''
+    for ch in text:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _to_sql(value):
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _infer_type(value):
+    if isinstance(value, bool):
+        return 'BOOLEAN'
+    if isinstance(value, int):
+        return 'INTEGER'
+    if isinstance(value, float):
+        return 'REAL'
+    if isinstance(value, (dict, list)):
+        return 'JSON'
+    return 'TEXT'
+
+
+class LocalResponse:
+    """Stand-in for postgrest's APIResponse (data + optional count)."""
+
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class LocalQuery:
+    """Chainable query builder. Like postgrest-py, filters mutate the builder."""
+
+    def __init__(self, client, table):
+        self._client = client
+        self._table = table
+        self._op = 'select'
+        self._columns = '*'
+        self._count = None
+        self._where = []
+        self._order = []
+        self._limit = None
+        self._offset = None
+        self._payload = None
+        self._on_conflict = None
+        self._negate = False
+
+    # ------------------------------------------
+    # Operations
+    # ------------------------------------------
+
+    def select(self, columns='*', count=None, **kwargs):
+        self._op = 'select'
+        self._columns = columns or '*'
+        self._count = count
+        return self
+
+    def insert(self, data, **kwargs):
+        self._op = 'insert'
+        self._payload = data
+        return self
+
+    def update(self, data, **kwargs):
+        self._op = 'update'
+        self._payload = data
+        return self
+
+    def upsert(self, data, on_conflict=None, **kwargs):
+        self._op = 'upsert'
+        self._payload = data
+        self._on_conflict = on_conflict
+        return self
+
+    def delete(self, **kwargs):
+        self._op = 'delete'
+        return self
+
+    # ------------------------------------------
+    # Filters
+    # ------------------------------------------
+
+    @property
+    def not_(self):
+        self._negate = True
+        return self
+
+    def _add(self, column, op, value):
+        clause, params = self._client._condition(self._table, column, op, value)
+        if self._negate:
+            clause = f'NOT ({clause})'
+            self._negate = False
+        self._where.append((clause, params))
+        return self
+
+    def eq(self, column, value):
+        return self._add(column, 'eq', value)
+
+    def neq(self, column, value):
+        return self._add(column, 'neq', value)
+
+    def gt(self, column, value):
+        return self._add(column, 'gt', value)
+
+    def gte(self, column, value):
+        return self._add(column, 'gte', value)
+
+    def lt(self, column, value):
+        return self._add(column, 'lt', value)
+
+    def lte(self, column, value):
+        return self._add(column, 'lte', value)
+
+    def like(self, column, pattern):
+        return self._add(column, 'like', pattern)
+
+    def ilike(self, column, pattern):
+        return self._add(column, 'ilike', pattern)
+
+    def in_(self, column, values):
+        return self._add(column, 'in', list(values))
+
+    def is_(self, column, value):
+        return self._add(column, 'is', value)
+
+    def or_(self, filters, **kwargs):
+        """PostgREST or-syntax: 'name.ilike.%x%,email.eq.y'."""
+        clauses, params = [], []
+        for part in _split_top_level(filters):
+            column, op, value = part.split('.', 2)
+            if op == 'in':
+                value = [v.strip() for v in value.strip('()').split(',')]
+            clause, p = self._client._condition(self._table, column, op, value)
+            clauses.append(clause)
+            params.extend(p)
+        clause = '(' + ' OR '.join(clauses) + ')'
+        if self._negate:
+            clause = f'NOT {clause}'
+            self._negate = False
+        self._where.append((clause, params))
+        return self
+
+    # ------------------------------------------
+    # Modifiers
+    # ------------------------------------------
+
+    def order(self, column, desc=False, nullsfirst=None, **kwargs):
+        self._client._ensure_columns(self._table, {column: None})
+        # Postgres defaults: NULLS LAST ascending, NULLS FIRST descending
+        if nullsfirst is None:
+            nullsfirst = desc
+        direction = 'DESC' if desc else 'ASC'
+        nulls = 'DESC' if nullsfirst else 'ASC'
+        self._order.append(f'{_ident(column)} IS NULL {nulls}, {_ident(column)} {direction}')
+        return self
+
+    def limit(self, size, **kwargs):
+        self._limit = size
+        return self
+
+    def range(self, start, end, **kwargs):
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def execute(self):
+        return self._client._execute(self)
+
+
+class LocalClient:
+    """SQLite-backed replacement for supabase.Client (tables only)."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if self.path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        for table in _UPDATED_AT_TABLES:
+            self._conn.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_updated_at AFTER UPDATE ON {table} '
+                f'FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at BEGIN '
+                f'UPDATE {table} SET updated_at = {_NOW} WHERE rowid = NEW.rowid; END'
+            )
+        self._conn.commit()
+        self._columns = {}
+
+    def table(self, name):
+        _ident(name)
+        return LocalQuery(self, name)
+
+    # ------------------------------------------
+    # Schema helpers
+    # ------------------------------------------
+
+    def _table_columns(self, table):
+        """column name -> declared type for a table (cached)."""
+        if table not in self._columns:
+            rows = self._conn.execute(f'PRAGMA table_info({_ident(table)})').fetchall()
+            if not rows:
+                raise ValueError(f"Unknown table: {table}")
+            self._columns[table] = {r['name']: (r['type'] or 'TEXT').upper() for r in rows}
+        return self._columns[table]
+
+    def _ensure_columns(self, table, samples):
+        """Add columns referenced by the app that the local schema doesn't have yet."""
+        with self._lock:
+            columns = self._table_columns(table)
+            for name, sample in samples.items():
+                if name not in columns:
+                    col_type = _infer_type(sample)
+                    self._conn.execute(f'ALTER TABLE {_ident(table)} ADD COLUMN {_ident(name)} {col_type}')
+                    columns[name] = col_type
+                    logger.info("SQLite: added column %s.%s (%s)", table, name, col_type)
+
+    def _decode(self, table, row):
+        columns = self._table_columns(table)
+        data = dict(row)
+        for key, value in data.items():
+            if value is None:
+                continue
+            col_type = columns.get(key)
+            if col_type == 'BOOLEAN':
+                data[key] = bool(value)
+            elif col_type == 'JSON' and isinstance(value, str):
+                try:
+                    data[key] = json.loads(value)
+                except ValueError:
+                    pass
+        return data
+
+    def _condition(self, table, column, op, value):
+        sample = value[0] if isinstance(value, list) and value else value
+        self._ensure_columns(table, {column: None if op in ('like', 'ilike', 'is') else sample})
+        col = _ident(column)
+        if op == 'eq':
+            return f'{col} = ?', [_to_sql(value)]
+        if op == 'neq':
+            return f'{col} != ?', [_to_sql(value)]
+        if op in ('gt', 'gte', 'lt', 'lte'):
+            sql_op = {'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}[op]
+            return f'{col} {sql_op} ?', [_to_sql(value)]
+        if op == 'ilike':
+            return f'{col} LIKE ?', [str(value).replace('*', '%')]
+        if op == 'like':
+            pattern = str(value).replace('*', '%').replace('%', '*').replace('_', '?')
+            return f'{col} GLOB ?', [pattern]
+        if op == 'in':
+            if not value:
+                return '0', []
+            return f"{col} IN ({', '.join('?' * len(value))})", [_to_sql(v) for v in value]
+        if op == 'is':
+            if value is None or value == 'null':
+                return f'{col} IS NULL', []
+            return f'{col} = ?', [1 if value in (True, 'true') else 0]
+        raise ValueError(f"Unsupported filter operator: {op}")
+
+    # ------------------------------------------
+    # Execution
+    # ------------------------------------------
+
+    def _where_sql(self, query):
+        if not query._where:
+            return '', []
+        params = []
+        for _, p in query._where:
+            params.extend(p)
+        return ' WHERE ' + ' AND '.join(c for c, _ in query._where), params
+
+    def _execute(self, query):
+        with self._lock:
+            try:
+                if query._op == 'select':
+                    return self._select(query)
+                if query._op == 'insert':
+                    result = LocalResponse(self._insert(query._table, query._payload))
+                elif query._op == 'upsert':
+                    result = LocalResponse(self._upsert(query._table, query._payload, query._on_conflict))
+                elif query._op == 'update':
+                    result = LocalResponse(self._update(query))
+                elif query._op == 'delete':
+                    result = LocalResponse(self._delete(query))
+                else:
+                    raise ValueError(f"Unsupported operation: {query._op}")
+                self._conn.commit()
+                return result
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _select(self, query):
+        table = query._table
+        plain, embeds = [], []
+        for item in _split_top_level(query._columns):
+            match = re.match(r'^(\w+)\((.*)\)$', item)
+            if match:
+                embeds.append((match.group(1), match.group(2)))
+            else:
+                plain.append(item)
+
+        fk_columns = [f"{name[:-1] if name.endswith('s') else name}_id" for name, _ in embeds]
+        if '*' in plain:
+            select_cols = ['*']
+            extra = []
+        else:
+            self._ensure_columns(table, {c: None for c in plain})
+            extra = [fk for fk in fk_columns if fk not in plain]
+            select_cols = [_ident(c) for c in plain + extra]
+        where, params = self._where_sql(query)
+
+        count = None
+        if query._count:
+            count = self._conn.execute(f'SELECT COUNT(*) FROM {_ident(table)}{where}', params).fetchone()[0]
+
+        sql = f"SELECT {', '.join(select_cols)} FROM {_ident(table)}{where}"
+        if query._order:
+            sql += ' ORDER BY ' + ', '.join(query._order)
+        if query._limit is not None or query._offset is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params = params + [query._limit if query._limit is not None else -1, query._offset or 0]
+        rows = [self._decode(table, r) for r in self._conn.execute(sql, params).fetchall()]
+
+        for (name, cols), fk in zip(embeds, fk_columns):
+            self._embed(rows, name, cols, fk)
+        for row in rows:
+            for fk in extra:
+                row.pop(fk, None)
+        return LocalResponse(rows, count)
+
+    def _embed(self, rows, related, columns, fk):
+        """Attach many-to-one related rows, e.g. coaches.school_id -> 'schools'."""
+        ids = list({r.get(fk) for r in rows if r.get(fk) is not None})
+        lookup = {}
+        if ids:
+            cols = [c.strip() for c in columns.split(',') if c.strip()] or ['*']
+            if cols != ['*']:
+                self._ensure_columns(related, {c: None for c in cols})
+            select = '*' if '*' in cols else ', '.join(_ident(c) for c in set(cols) | {'id'})
+            for i in range(0, len(ids), 500):
+                batch = ids[i:i+500]
+                found = self._conn.execute(
+                    f"SELECT {select} FROM {_ident(related)} WHERE id IN ({', '.join('?' * len(batch))})", batch
+                ).fetchall()
+                for r in found:
+                    data = self._decode(related, r)
+                    lookup[data['id']] = data if '*' in cols else {c: data.get(c) for c in cols}
+        for row in rows:
+            row[related] = lookup.get(row.get(fk))
+
+    def _prepare_row(self, table, row):
+        row = dict(row)
+        columns = self._table_columns(table)
+        if 'id' in columns and not row.get('id'):
+            row['id'] = str(uuid.uuid4())
+        for col in _UUID_DEFAULTS.get(table, []):
+            if not row.get(col):
+                row[col] = str(uuid.uuid4())
+        self._ensure_columns(table, row)
+        return row
+
+    def _fetch_rowids(self, table, rowids):
+        if not rowids:
+            return []
+        rows = self._conn.execute(
+            f"SELECT * FROM {_ident(table)} WHERE rowid IN ({', '.join('?' * len(rowids))})", rowids
+        ).fetchall()
+        return [self._decode(table, r) for r in rows]
+
+    def _insert_row(self, table, row):
+        row = self._prepare_row(table, row)
+        cols = list(row)
+        cursor = self._conn.execute(
+            f"INSERT INTO {_ident(table)} ({', '.join(_ident(c) for c in cols)}) "
+            f"VALUES ({', '.join('?' * len(cols))})",
+            [_to_sql(row[c]) for c in cols]
+        )
+        return cursor.lastrowid
+
+    def _insert(self, table, payload):
+        rows = payload if isinstance(payload, list) else [payload]
+        return self._fetch_rowids(table, [self._insert_row(table, r) for r in rows])
+
+    def _set_rowids(self, table, rowids, fields):
+        if not rowids or not fields:
+            return
+        self._ensure_columns(table, fields)
+        assignments = ', '.join(f'{_ident(c)} = ?' for c in fields)
+        self._conn.execute(
+            f"UPDATE {_ident(table)} SET {assignments} WHERE rowid IN ({', '.join('?' * len(rowids))})",
+            [_to_sql(v) for v in fields.values()] + list(rowids)
+        )
+
+    def _upsert(self, table, payload, on_conflict):
+        rows = payload if isinstance(payload, list) else [payload]
+        columns = self._table_columns(table)
+        default_key = 'id' if 'id' in columns else next(iter(columns))
+        keys = [k.strip() for k in (on_conflict or default_key).split(',')]
+        rowids = []
+        for row in rows:
+            existing = None
+            if all(row.get(k) is not None for k in keys):
+                existing = self._conn.execute(
+                    f"SELECT rowid FROM {_ident(table)} WHERE " + ' AND '.join(f'{_ident(k)} = ?' for k in keys),
+                    [_to_sql(row[k]) for k in keys]
+                ).fetchone()
+            if existing:
+                self._set_rowids(table, [existing[0]], {k: v for k, v in row.items() if k not in keys})
+                rowids.append(existing[0])
+            else:
+                rowids.append(self._insert_row(table, row))
+        return self._fetch_rowids(table, rowids)
+
+    def _matching_rowids(self, query):
+        where, params = self._where_sql(query)
+        return [r[0] for r in self._conn.execute(f'SELECT rowid FROM {_ident(query._table)}{where}', params)]
+
+    def _update(self, query):
+        rowids = self._matching_rowids(query)
+        self._set_rowids(query._table, rowids, query._payload)
+        return self._fetch_rowids(query._table, rowids)
+
+    def _delete(self, query):
+        rowids = self._matching_rowids(query)
+        rows = self._fetch_rowids(query._table, rowids)
+        if rowids:
+            self._conn.execute(
+                f"DELETE FROM {_ident(query._table)} WHERE rowid IN ({', '.join('?' * len(rowids))})", rowids
+            )
+        return rows
+
+
+class SQLiteDB(SupabaseDB):
+    """SupabaseDB with a local SQLite file in place of the PostgREST client."""
+
+    # Local reads are already sub-millisecond; no need for the coaches/schools replica
+    use_replica = False
+    # No RPCs locally; db/coach_search.py ranks the same way in Python
+    use_search_rpc = False
+
+    def __init__(self, path=None):
+        self.url = str(path or os.environ.get('SQLITE_DB_PATH') or DEFAULT_SQLITE_PATH)
+        self.key = ''
+        self.client = LocalClient(self.url)
+        self._init_state()
+        logger.info("SQLite database opened: %s", self.url)
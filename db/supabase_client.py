@@ -5,25 +5,68 @@ Replaces Google Sheets as primary data store.
 
 import os
 import re
+import time
 import logging
-from datetime import datetime, timezone
-from supabase import create_client, Client
+from datetime import datetime, timedelta, timezone
+
+try:
+    from supabase import create_client, Client
+except ImportError:  # SQLite-only deployments (DB_BACKEND=sqlite)
+    create_client, Client = None, None
+
+from .queue_status import (AthleteQueueStatus, QueueStatusStore, coach_matches_preference,
+                           compute_email_stage, position_role_for)
+from .send_plan import SendPlan, SendPlanStore, earliest_due
+from .replica import CoachReplica
+from .coach_search import OUTREACH_FIELDS, rank_coaches, rpc_result, search_result
 
 logger = logging.getLogger(__name__)
 
+# After a transient search_coaches RPC failure, use client-side search this long
+SEARCH_RPC_COOLDOWN = 60
+# After a transient email_queue_status read failure, skip persisted counts this long
+QUEUE_STATUS_COOLDOWN = 60
+
+
+def _schema_missing(error, codes, phrase):
+    """True when a PostgREST error says a schema object isn't there (not a transient failure)."""
+    code = str(getattr(error, 'code', '') or '')
+    text = str(error).lower()
+    return code in codes or any(c.lower() in text for c in codes) or phrase in text
+
+
+def _rpc_missing(error):
+    """True when a PostgREST error says the function isn't installed."""
+    return _schema_missing(error, ('PGRST202', '42883'), 'could not find the function')
+
+
+def _table_missing(error):
+    """True when a PostgREST error says the table doesn't exist."""
+    return _schema_missing(error, ('PGRST205', '42P01'), 'could not find the table')
+
+
 # Singleton
 _db_instance = None
 
 
 def get_db():
-    """Get or create the Supabase DB singleton."""
+    """Get or create the DB singleton (Supabase, or local SQLite when DB_BACKEND=sqlite)."""
     global _db_instance
     if _db_instance is None:
-        _db_instance = SupabaseDB()
+        if os.environ.get('DB_BACKEND', 'supabase').lower() == 'sqlite':
+            from .sqlite_client import SQLiteDB
+            _db_instance = SQLiteDB()
+        else:
+            _db_instance = SupabaseDB()
     return _db_instance
 
 
 class SupabaseDB:
+    # Serve coaches/schools reads from an in-process replica (COACH_REPLICA=false to disable)
+    use_replica = os.environ.get('COACH_REPLICA', 'true').lower() == 'true'
+    # Rank coach search in Postgres (supabase_migration_coach_search.sql)
+    use_search_rpc = True
+
     def __init__(self):
         self.url = os.environ.get('SUPABASE_URL', 'https://sdugzlvnlfejiwmrrysf.supabase.co')
         self.key = os.environ.get('SUPABASE_SERVICE_KEY', '')
@@ -31,10 +74,44 @@ class SupabaseDB:
             self.key = os.environ.get('SUPABASE_KEY', '')
         if not self.key:
             raise ValueError("SUPABASE_SERVICE_KEY environment variable required")
+        if create_client is None:
+            raise ImportError("supabase package not installed (set DB_BACKEND=sqlite for local mode)")
         self.client: Client = create_client(self.url, self.key)
-        self._athlete_id = None
+        self._init_state()
         logger.info("Supabase connected: %s", self.url)
 
+    def _init_state(self):
+        """Per-instance state shared by every backend."""
+        self._athlete_id = None
+        self._queue_status = QueueStatusStore()
+        self._queue_status_table = True  # False once email_queue_status turns out to be missing
+        self._queue_status_retry_at = 0.0
+        self._send_plans = SendPlanStore()
+        self._replica = CoachReplica(self.client) if self.use_replica else None
+        self._search_rpc = True  # False once search_coaches() turns out to be missing
+        self._search_rpc_retry_at = 0.0
+
+    def _fresh_replica(self):
+        """The coaches/schools replica if it can serve reads right now, else None."""
+        if self._replica and self._replica.ensure_fresh():
+            return self._replica
+        return None
+
+    def _replica_write(self, table, result):
+        """Mirror rows returned by a coaches/schools write into the replica."""
+        if self._replica and result is not None and getattr(result, 'data', None):
+            self._replica.apply_write(table, result.data)
+        return result
+
+    def get_replica_metrics(self):
+        return self._replica.metrics() if self._replica else {'enabled': False}
+
+    def refresh_replica(self, full=True):
+        """Force a replica sync (admin). Returns metrics after the refresh."""
+        if self._replica:
+            self._replica.refresh(full=full)
+        return self.get_replica_metrics()
+
     # ==========================================
     # ATHLETE (current user)
     # ==========================================
@@ -62,7 +139,11 @@ class SupabaseDB:
     def update_athlete(self, **fields):
         if not self._athlete_id:
             return None
-        return self.client.table('athletes').update(fields).eq('id', self._athlete_id).execute()
+        result = self.client.table('athletes').update(fields).eq('id', self._athlete_id).execute()
+        if 'positions' in fields or 'position' in fields:
+            self._invalidate_queue_status(self._athlete_id)
+            self._send_plans.invalidate(self._athlete_id)
+        return result
 
     # ==========================================
     # SCHOOLS
@@ -73,12 +154,15 @@ class SupabaseDB:
         data = {'name': name, 'division': division, 'conference': conference, 'state': state, 'staff_url': staff_url, **extra}
         data = {k: v for k, v in data.items() if v is not None}
         try:
-            return self.client.table('schools').upsert(data, on_conflict='name').execute()
+            return self._replica_write('schools', self.client.table('schools').upsert(data, on_conflict='name').execute())
         except Exception as e:
             logger.error("Failed to add school %s: %s", name, e)
             return None
 
     def get_school(self, name):
+        replica = self._fresh_replica()
+        if replica:
+            return replica.get_school(name)
         result = self.client.table('schools').select('*').eq('name', name).limit(1).execute()
         return result.data[0] if result.data else None
 
@@ -94,7 +178,13 @@ class SupabaseDB:
             q = q.ilike('conference', f'%{conference}%')
         return q.limit(limit).execute().data
 
+    def update_school(self, school_id, **fields):
+        return self._replica_write('schools', self.client.table('schools').update(fields).eq('id', school_id).execute())
+
     def get_all_schools(self):
+        replica = self._fresh_replica()
+        if replica:
+            return replica.all_schools()
         return self.client.table('schools').select('*').order('name').execute().data
 
     # ==========================================
@@ -150,11 +240,11 @@ class SupabaseDB:
                     cleaned = self.clean_email(raw)
                     if cleaned != raw:
                         if cleaned:
-                            self.client.table('coaches').update({'email': cleaned}).eq('id', coach['id']).execute()
+                            self._replica_write('coaches', self.client.table('coaches').update({'email': cleaned}).eq('id', coach['id']).execute())
                             fixed += 1
                             logger.info(f"Fixed email for coach {coach['id']}: '{raw}' -> '{cleaned}'")
                         else:
-                            self.client.table('coaches').update({'email': None}).eq('id', coach['id']).execute()
+                            self._replica_write('coaches', self.client.table('coaches').update({'email': None}).eq('id', coach['id']).execute())
                             nulled += 1
                             logger.warning(f"Nulled invalid email for coach {coach['id']}: '{raw}'")
                 if len(result.data) < batch_size:
@@ -163,6 +253,9 @@ class SupabaseDB:
         except Exception as e:
             logger.error(f"Email cleanup error: {e}")
         logger.info(f"Email cleanup: scanned {total}, fixed {fixed}, nulled {nulled}")
+        if fixed or nulled:
+            self._invalidate_queue_status()
+            self._send_plans.invalidate()
         return {'total': total, 'fixed': fixed, 'nulled': nulled}
 
     # ==========================================
@@ -183,18 +276,32 @@ class SupabaseDB:
             'title': title,
         }
         data = {k: v for k, v in data.items() if v is not None}
-        return self.client.table('coaches').insert(data).execute()
+        result = self._replica_write('coaches', self.client.table('coaches').insert(data).execute())
+        if email:
+            self._invalidate_queue_status()
+            self._send_plans.invalidate()
+        return result
 
     def get_coaches_for_school(self, school_name):
         school = self.get_school(school_name)
         if not school:
             return []
+        replica = self._fresh_replica()
+        if replica:
+            return replica.coaches_for_schools([school['id']])
         return self.client.table('coaches').select('*').eq('school_id', school['id']).execute().data
 
     def update_coach(self, coach_id, **fields):
-        return self.client.table('coaches').update(fields).eq('id', coach_id).execute()
+        result = self._replica_write('coaches', self.client.table('coaches').update(fields).eq('id', coach_id).execute())
+        if {'email', 'role', 'school_id'} & set(fields):
+            self._invalidate_queue_status()
+            self._send_plans.invalidate()
+        return result
 
     def find_coach_by_email(self, email):
+        replica = self._fresh_replica()
+        if replica:
+            return replica.find_coach_by_email(email, ('name', 'division', 'conference'))
         result = self.client.table('coaches').select('*, schools(name, division, conference)').eq('email', email).limit(1).execute()
         return result.data[0] if result.data else None
 
@@ -281,19 +388,7 @@ class SupabaseDB:
 
     def _compute_email_stage(self, outreach_records):
         """Given a coach's outreach history, return their next email stage."""
-        if not outreach_records:
-            return 'new'
-        sent = [r for r in outreach_records if r.get('status') == 'sent']
-        if not sent:
-            return 'new'
-        types_sent = [r.get('email_type', '') for r in sent]
-        if 'followup_2' in types_sent:
-            return 'done'
-        if 'followup_1' in types_sent:
-            return 'followup_2'
-        if 'intro' in types_sent:
-            return 'followup_1'
-        return 'followup_1'  # Default: at least one sent
+        return compute_email_stage(outreach_records)
 
     def get_coach_email_stage(self, coach_id):
         """Get the email stage for a specific coach."""
@@ -320,7 +415,7 @@ class SupabaseDB:
             if existing.data and existing.data[0].get('notes'):
                 old = existing.data[0]['notes'] + '; '
             update['notes'] = old + notes
-        return self.client.table('coaches').update(update).eq('id', coach_id).execute()
+        return self._replica_write('coaches', self.client.table('coaches').update(update).eq('id', coach_id).execute())
 
     def mark_coach_responded(self, coach_id, sentiment=None):
         """Mark coach as responded."""
@@ -330,7 +425,7 @@ class SupabaseDB:
         }
         if sentiment:
             update['response_sentiment'] = sentiment
-        return self.client.table('coaches').update(update).eq('id', coach_id).execute()
+        return self._replica_write('coaches', self.client.table('coaches').update(update).eq('id', coach_id).execute())
 
     def mark_coach_bounced(self, coach_id):
         """Clear email on bounce, add note."""
@@ -342,110 +437,251 @@ class SupabaseDB:
             old_email = existing.data[0].get('email', '')
             if old_notes:
                 old_notes += '; '
-        return self.client.table('coaches').update({
+        result = self._replica_write('coaches', self.client.table('coaches').update({
             'email': None,
             'notes': f"{old_notes}BOUNCED ({old_email})",
-        }).eq('id', coach_id).execute()
+        }).eq('id', coach_id).execute())
+        self._queue_status_coach_removed(coach_id)
+        self._send_plans.discard(coach_id=coach_id)
+        return result
 
     def get_email_queue_status(self):
-        """Get counts of coaches by email stage for current athlete's schools."""
+        """Get counts of coaches by email stage for current athlete's schools.
+        Served from the maintained per-athlete summary; only a cold miss
+        recomputes it from schools, coaches and outreach."""
         counts = {'new': 0, 'followup_1': 0, 'followup_2': 0, 'done': 0, 'replied': 0, 'total_with_email': 0}
 
         # If no athlete context, return zeros
         if not self._athlete_id:
             return counts
 
-        # Get athlete's selected schools with preferences
-        athlete_schools = self.get_athlete_schools(self._athlete_id)
-        if not athlete_schools:
-            return counts
-
-        # Get athlete's position to filter position coaches
-        athlete = self.get_athlete_by_id(self._athlete_id)
-        athlete_position = (athlete.get('positions') or athlete.get('position') or 'OL').upper() if athlete else 'OL'
-
-        # Map athlete position to coach role
-        position_to_role = {
-            'OL': 'ol', 'WR': 'wr', 'QB': 'qb', 'RB': 'rb', 'TE': 'te',
-            'DL': 'dl', 'LB': 'lb', 'DB': 'db', 'K': 'st', 'P': 'st', 'LS': 'st', 'ATH': 'ath'
-        }
-        position_role = position_to_role.get(athlete_position, 'ol')
-
-        # Build list of school_ids and their preferences
-        school_prefs = {as_row.get('school_id'): as_row.get('coach_preference', 'both')
-                       for as_row in athlete_schools}
-        school_ids = list(school_prefs.keys())
-
-        if not school_ids:
-            return counts
-
-        # Get coaches from these schools only
-        coaches = (self.client.table('coaches')
-                  .select('id, email, role, school_id')
-                  .in_('school_id', school_ids)
-                  .not_.is_('email', 'null')
-                  .execute().data)
-
-        # Filter by preference and athlete position
-        coach_emails = []
-        for coach in coaches:
-            email = (coach.get('email') or '').strip()
-            if not email:
-                continue
-            role = (coach.get('role') or '').lower()
-            pref = school_prefs.get(coach.get('school_id'), 'both')
+        summary = self._queue_status.get(self._athlete_id)
+        if summary:
+            return summary.snapshot()
+
+        stored = self._load_queue_status_row(self._athlete_id)
+        if stored is not None:
+            return {**counts, **stored}
+
+        # Writes during the (unlocked) build would be lost if an older snapshot
+        # were installed over them: install only if nothing changed, retry once
+        for _ in range(2):
+            generation = self._queue_status.generation(self._athlete_id)
+            summary = self._build_queue_status(self._athlete_id)
+            if self._queue_status.put_if_current(summary, generation):
+                self._save_queue_status(summary)
+                break
+        return summary.snapshot()
 
-            # Filter by preference using athlete's actual position
-            if pref == 'position_coach' and role != position_role:
-                continue
-            if pref == 'rc' and role != 'rc':
-                continue
-            if pref == 'both' and role not in ('rc', position_role):
-                continue
+    # ==========================================
+    # EMAIL QUEUE STATUS (maintained summary)
+    # ==========================================
 
-            coach_emails.append(email)
+    def _fetch_coaches_with_email(self, school_ids):
+        """Coaches with an email at the given schools (batched for .in_ limits)."""
+        replica = self._fresh_replica()
+        if replica:
+            return replica.coaches_for_schools(school_ids, with_email=True)
+        coaches = []
+        for i in range(0, len(school_ids), 100):
+            batch = (self.client.table('coaches')
+                     .select('id, email, role, school_id')
+                     .in_('school_id', school_ids[i:i+100])
+                     .not_.is_('email', 'null')
+                     .execute().data)
+            coaches.extend(batch or [])
+        return coaches
+
+    def _fetch_outreach_for_emails(self, athlete_id, emails):
+        """Athlete's outreach rows for the given coach emails, newest first."""
+        rows = []
+        for i in range(0, len(emails), 200):
+            batch = (self.client.table('outreach')
+                     .select('id, coach_email, email_type, status, replied')
+                     .eq('athlete_id', athlete_id)
+                     .in_('coach_email', emails[i:i+200])
+                     .order('sent_at', desc=True)
+                     .execute().data)
+            rows.extend(batch or [])
+        return rows
+
+    def _build_queue_status(self, athlete_id):
+        """Recompute an athlete's queue summary from scratch."""
+        athlete_schools = self.get_athlete_schools(athlete_id)
+        athlete = self.get_athlete_by_id(athlete_id) if athlete_schools else None
+        school_prefs = {row.get('school_id'): row.get('coach_preference', 'both')
+                        for row in athlete_schools if row.get('school_id')}
+        summary = AthleteQueueStatus(athlete_id, position_role_for(athlete), school_prefs)
+        if school_prefs:
+            coaches = self._fetch_coaches_with_email(list(school_prefs))
+            emails = list({(c.get('email') or '').strip() for c in coaches} - {''})
+            summary.load(coaches, self._fetch_outreach_for_emails(athlete_id, emails))
+        return summary
+
+    def _load_queue_status_row(self, athlete_id):
+        """Read persisted counts; None when missing, stale or the table doesn't exist."""
+        if not self._queue_status_table or time.monotonic() < self._queue_status_retry_at:
+            return None
+        try:
+            result = (self.client.table('email_queue_status')
+                      .select('counts, stale')
+                      .eq('athlete_id', athlete_id)
+                      .limit(1).execute())
+        except Exception as e:
+            if _table_missing(e):
+                logger.warning("email_queue_status missing, computing in-process only: %s", e)
+                self._queue_status_table = False
+            else:
+                # Network blips: rebuild in-process for now, read persisted counts again later
+                logger.warning("email_queue_status read failed, retrying in %ss: %s", QUEUE_STATUS_COOLDOWN, e)
+                self._queue_status_retry_at = time.monotonic() + QUEUE_STATUS_COOLDOWN
+            return None
+        if not result.data or result.data[0].get('stale'):
+            return None
+        return result.data[0].get('counts') or None
 
-        counts['total_with_email'] = len(coach_emails)
+    def _save_queue_status(self, summary):
+        if not self._queue_status_table:
+            return
+        try:
+            self.client.table('email_queue_status').upsert({
+                'athlete_id': summary.athlete_id,
+                'counts': summary.snapshot(),
+                'stale': False,
+                'updated_at': datetime.now(timezone.utc).isoformat(),
+            }, on_conflict='athlete_id').execute()
+        except Exception as e:
+            logger.warning("Failed to persist queue status for %s: %s", summary.athlete_id, e)
 
-        # Batch get outreach for all these coaches at once
-        if coach_emails:
-            all_outreach = (self.client.table('outreach')
-                          .select('coach_email, email_type, status, replied')
-                          .eq('athlete_id', self._athlete_id)
-                          .in_('coach_email', coach_emails)
-                          .order('sent_at', desc=True)
-                          .execute().data)
-
-            # Group by coach_email
-            outreach_by_coach = {}
-            for o in all_outreach:
-                ce = o.get('coach_email')
-                if ce not in outreach_by_coach:
-                    outreach_by_coach[ce] = []
-                if len(outreach_by_coach[ce]) < 5:
-                    outreach_by_coach[ce].append(o)
+    def _mark_queue_status_stale(self, athlete_id=None):
+        """Flag persisted counts as needing a rebuild (all athletes when athlete_id is None)."""
+        if not self._queue_status_table:
+            return
+        try:
+            q = self.client.table('email_queue_status').update({'stale': True})
+            q = q.eq('athlete_id', athlete_id) if athlete_id else q.eq('stale', False)
+            q.execute()
+        except Exception as e:
+            logger.warning("Failed to mark queue status stale: %s", e)
+
+    def _invalidate_queue_status(self, athlete_id=None):
+        """Drop summaries that can't be patched incrementally; next read rebuilds them."""
+        self._queue_status.invalidate(athlete_id)
+        self._mark_queue_status_stale(athlete_id)
+
+    def _queue_status_apply(self, athlete_id, change):
+        """Run change(summary) against an athlete's live summary and persist it.
+        Without a live summary the persisted row is marked stale instead."""
+        if not athlete_id:
+            return
+        with self._queue_status.lock:
+            self._queue_status.bump(athlete_id)
+            summary = self._queue_status.get(athlete_id)
+            if summary:
+                change(summary)
+        if summary:
+            self._save_queue_status(summary)
         else:
-            outreach_by_coach = {}
-
-        # Compute stages
-        for email in coach_emails:
-            outreach = outreach_by_coach.get(email, [])
-            if outreach and any(r.get('replied') for r in outreach):
-                counts['replied'] += 1
-                continue
-            stage = self._compute_email_stage(outreach)
-            counts[stage] = counts.get(stage, 0) + 1
-
-        return counts
+            self._mark_queue_status_stale(athlete_id)
+
+    def _queue_status_coach_removed(self, coach_id):
+        with self._queue_status.lock:
+            self._queue_status.bump()
+            touched = [s for s in self._queue_status.all() if s.remove_coach(coach_id)]
+        for summary in touched:
+            self._save_queue_status(summary)
+        # Athletes without a live summary may also track this coach
+        if self._queue_status_table:
+            live = [s.athlete_id for s in self._queue_status.all()]
+            try:
+                q = self.client.table('email_queue_status').update({'stale': True})
+                if live:
+                    q = q.not_.in_('athlete_id', live)
+                q.eq('stale', False).execute()
+            except Exception as e:
+                logger.warning("Failed to mark queue status stale: %s", e)
 
     def get_all_coaches_with_schools(self, limit=1000):
         """Get all coaches joined with school info."""
+        replica = self._fresh_replica()
+        if replica:
+            return replica.coaches_with_schools(('name', 'division', 'conference', 'state', 'staff_url'), limit=limit)
         return (self.client.table('coaches')
                 .select('*, schools(name, division, conference, state, staff_url)')
                 .order('name')
                 .limit(limit)
                 .execute().data)
 
+    def search_coaches_with_status(self, query, athlete_id=None, limit=20):
+        """Ranked coach search with the athlete's latest outreach and reply status.
+
+        One round-trip to the search_coaches() RPC when it's installed
+        (supabase_migration_coach_search.sql); otherwise search_coaches() plus
+        one outreach query, ranked identically (see db/coach_search.py).
+        """
+        if self.use_search_rpc and self._search_rpc and time.monotonic() >= self._search_rpc_retry_at:
+            try:
+                rows = self.client.rpc('search_coaches', {
+                    'p_query': query, 'p_athlete_id': athlete_id, 'p_limit': limit,
+                }).execute().data or []
+                return [rpc_result(r) for r in rows]
+            except Exception as e:
+                if _rpc_missing(e):
+                    logger.warning("search_coaches RPC not installed, using client-side search: %s", e)
+                    self._search_rpc = False
+                else:
+                    # Timeouts and network errors: fall back, retry the RPC after a cooldown
+                    logger.warning("search_coaches RPC failed, retrying in %ss: %s", SEARCH_RPC_COOLDOWN, e)
+                    self._search_rpc_retry_at = time.monotonic() + SEARCH_RPC_COOLDOWN
+
+        coaches = self.search_coaches(query, limit=limit)
+        emails = [c['email'] for c in coaches if c.get('email')]
+        outreach_by_email = {}
+        if emails and athlete_id:
+            rows = (self.client.table('outreach')
+                    .select(', '.join(OUTREACH_FIELDS))
+                    .eq('athlete_id', athlete_id)
+                    .in_('coach_email', emails)
+                    .order('sent_at', desc=True)
+                    .execute().data or [])
+            for row in rows:
+                outreach_by_email.setdefault(row.get('coach_email'), []).append(row)
+        return [search_result(c, outreach_by_email.get(c.get('email'), [])) for c in coaches]
+
+    def search_coaches(self, query, limit=30):
+        """Coaches whose name/email or school name contains query, with school
+        info embedded, ranked like the search_coaches() RPC."""
+        replica = self._fresh_replica()
+        if replica:
+            return replica.search_coaches(query, ('name', 'division', 'conference'), limit=limit)
+
+        search_pattern = f'%{query}%'
+        coaches_by_name = (self.client.table('coaches')
+                           .select('*, schools(name, division, conference)')
+                           .or_(f'name.ilike.{search_pattern},email.ilike.{search_pattern}')
+                           .limit(limit)
+                           .execute().data or [])
+        schools = (self.client.table('schools')
+                   .select('id, name')
+                   .ilike('name', search_pattern)
+                   .limit(10)
+                   .execute().data or [])
+        coaches_by_school = []
+        if schools:
+            coaches_by_school = (self.client.table('coaches')
+                                 .select('*, schools(name, division, conference)')
+                                 .in_('school_id', [s['id'] for s in schools])
+                                 .limit(limit)
+                                 .execute().data or [])
+
+        seen_ids = set()
+        results = []
+        for coach in coaches_by_name + coaches_by_school:
+            if coach['id'] not in seen_ids:
+                seen_ids.add(coach['id'])
+                results.append(coach)
+        return rank_coaches(query, results, limit=limit)
+
     # ==========================================
     # OUTREACH (email tracking — the big one)
     # ==========================================
@@ -471,18 +707,40 @@ class SupabaseDB:
         if tracking_id:
             data['tracking_id'] = tracking_id
         result = self.client.table('outreach').insert(data).execute()
-        return result.data[0] if result.data else None
+        row = result.data[0] if result.data else None
+        if row:
+            self._queue_status_apply(self._athlete_id, lambda summary: summary.record_outreach(row))
+            # Emailed coaches leave today's plan; their next email is days_between away
+            self._send_plans.discard(self._athlete_id, coach_email=coach_email)
+        return row
+
+    def _queue_status_outreach_updated(self, outreach_id, **fields):
+        with self._queue_status.lock:
+            owners = [s for s in self._queue_status.all() if s.has_outreach(outreach_id)]
+            if not owners:
+                # Owner unknown: a summary being built may have read the old row
+                self._queue_status.bump()
+        for summary in owners:
+            self._queue_status_apply(summary.athlete_id,
+                                     lambda s: s.update_outreach(outreach_id, **fields))
 
     def mark_sent(self, outreach_id):
-        return self.client.table('outreach').update({
+        update = {
             'status': 'sent',
             'sent_at': datetime.now(timezone.utc).isoformat(),
-        }).eq('id', outreach_id).execute()
+        }
+        result = self.client.table('outreach').update(update).eq('id', outreach_id).execute()
+        self._queue_status_outreach_updated(outreach_id, **update)
+        return result
 
     def mark_failed(self, outreach_id, reason=''):
-        return self.client.table('outreach').update({
+        result = self.client.table('outreach').update({
             'status': 'failed',
         }).eq('id', outreach_id).execute()
+        self._queue_status_outreach_updated(outreach_id, status='failed')
+        # A failed send leaves the coach due again
+        self._send_plans.invalidate(self._athlete_id)
+        return result
 
     def track_open(self, tracking_id):
         """Called when tracking pixel is hit. Increments open count."""
@@ -518,7 +776,12 @@ class SupabaseDB:
             update['reply_sentiment'] = sentiment
         if snippet:
             update['reply_snippet'] = snippet[:500]
-        return self.client.table('outreach').update(update).eq('id', result.data[0]['id']).execute()
+        outreach_id = result.data[0]['id']
+        updated = self.client.table('outreach').update(update).eq('id', outreach_id).execute()
+        self._queue_status_apply(self._athlete_id,
+                                 lambda summary: summary.update_outreach(outreach_id, replied=True))
+        self._send_plans.discard(self._athlete_id, coach_email=coach_email)
+        return updated
 
     def get_pending_outreach(self, limit=25):
         q = self.client.table('outreach').select('*').eq('status', 'pending')
@@ -824,6 +1087,7 @@ class SupabaseDB:
     def save_settings(self, **fields):
         if not self._athlete_id:
             return None
+        self._send_plans.invalidate(self._athlete_id)
         existing = self.get_settings()
         if existing:
             return self.client.table('settings').update(fields).eq('athlete_id', self._athlete_id).execute()
@@ -946,11 +1210,26 @@ class SupabaseDB:
             'school_id': school_id,
             'coach_preference': coach_preference,
         }
-        return self.client.table('athlete_schools').upsert(data, on_conflict='athlete_id,school_id').execute()
+        result = self.client.table('athlete_schools').upsert(data, on_conflict='athlete_id,school_id').execute()
+
+        if self._queue_status.get(athlete_id):
+            # Fetch the new school's coaches/outreach outside the lock, then patch the summary
+            coaches = self._fetch_coaches_with_email([school_id])
+            emails = list({(c.get('email') or '').strip() for c in coaches} - {''})
+            outreach = self._fetch_outreach_for_emails(athlete_id, emails)
+            self._queue_status_apply(athlete_id,
+                                     lambda summary: summary.add_school(school_id, coach_preference, coaches, outreach))
+        else:
+            self._mark_queue_status_stale(athlete_id)
+        self._send_plans.invalidate(athlete_id)
+        return result
 
     def remove_athlete_school(self, athlete_id, school_id):
         """Remove school from athlete's list."""
-        return self.client.table('athlete_schools').delete().eq('athlete_id', athlete_id).eq('school_id', school_id).execute()
+        result = self.client.table('athlete_schools').delete().eq('athlete_id', athlete_id).eq('school_id', school_id).execute()
+        self._queue_status_apply(athlete_id, lambda summary: summary.remove_school(school_id))
+        self._send_plans.invalidate(athlete_id)
+        return result
 
     def get_athlete_schools(self, athlete_id):
         """Get all schools selected by an athlete with school details."""
@@ -964,20 +1243,34 @@ class SupabaseDB:
         """Get coaches due for outreach from athlete's selected schools.
         Filters by coach_preference, athlete position, and outreach history.
         OPTIMIZED: Uses batch queries instead of N+1 queries."""
+        candidates = self._collect_outreach_candidates(athlete_id, days_between)
+        return SendPlan(athlete_id, days_between, candidates).due(limit)
+
+    def get_send_plan(self, athlete_id, days_between=7):
+        """Get the athlete's materialized send plan, building it on first use.
+        Shared by the tomorrow-preview endpoints and the sender; replies,
+        bounces, sends and settings changes patch or drop it."""
+        plan = self._send_plans.get(athlete_id, days_between)
+        if plan is None:
+            candidates = self._collect_outreach_candidates(athlete_id, days_between)
+            plan = SendPlan(athlete_id, days_between, earliest_due(candidates))
+            self._send_plans.put(plan)
+            logger.info("Built send plan for athlete %s: %d candidates", athlete_id, len(plan.entries))
+        return plan
+
+    def invalidate_send_plan(self, athlete_id=None):
+        self._send_plans.invalidate(athlete_id)
+
+    def _collect_outreach_candidates(self, athlete_id, days_between=7):
+        """All coaches from the athlete's schools that are still in the email
+        sequence, in selection order, each with the 'due_at' of its next email."""
         athlete_schools = self.get_athlete_schools(athlete_id)
         if not athlete_schools:
             return []
 
         # Get athlete's position to filter position coaches
         athlete = self.get_athlete_by_id(athlete_id)
-        athlete_position = (athlete.get('positions') or athlete.get('position') or 'OL').upper() if athlete else 'OL'
-
-        # Map athlete position to coach role
-        position_to_role = {
-            'OL': 'ol', 'WR': 'wr', 'QB': 'qb', 'RB': 'rb', 'TE': 'te',
-            'DL': 'dl', 'LB': 'lb', 'DB': 'db', 'K': 'st', 'P': 'st', 'LS': 'st', 'ATH': 'ath'
-        }
-        position_role = position_to_role.get(athlete_position, 'ol')
+        position_role = position_role_for(athlete)
 
         # Build lookup of school_id -> (school_info, preference)
         school_lookup = {}
@@ -994,17 +1287,21 @@ class SupabaseDB:
         if not school_ids:
             return []
 
-        # BATCH QUERY 1: Get all coaches for all schools at once
-        all_coaches = []
-        # Supabase .in_ filter has limits, batch in groups of 100
-        for i in range(0, len(school_ids), 100):
-            batch_ids = school_ids[i:i+100]
-            coaches_batch = (self.client.table('coaches')
-                           .select('*')
-                           .in_('school_id', batch_ids)
-                           .not_.is_('email', 'null')
-                           .execute().data)
-            all_coaches.extend(coaches_batch or [])
+        # BATCH QUERY 1: Get all coaches for all schools at once (replica when available)
+        replica = self._fresh_replica()
+        if replica:
+            all_coaches = replica.coaches_for_schools(school_ids, with_email=True)
+        else:
+            all_coaches = []
+            # Supabase .in_ filter has limits, batch in groups of 100
+            for i in range(0, len(school_ids), 100):
+                batch_ids = school_ids[i:i+100]
+                coaches_batch = (self.client.table('coaches')
+                               .select('*')
+                               .in_('school_id', batch_ids)
+                               .not_.is_('email', 'null')
+                               .execute().data)
+                all_coaches.extend(coaches_batch or [])
 
         if not all_coaches:
             return []
@@ -1040,15 +1337,9 @@ class SupabaseDB:
 
             school_data = school_lookup[school_id]
             school_info = school_data['info']
-            preference = school_data['preference']
-            role = (coach.get('role') or '').lower()
 
             # Filter by preference and athlete position
-            if preference == 'position_coach' and role != position_role:
-                continue
-            if preference == 'rc' and role != 'rc':
-                continue
-            if preference == 'both' and role not in ('rc', position_role):
+            if not coach_matches_preference(coach.get('role'), school_data['preference'], position_role):
                 continue
 
             email = coach.get('email')
@@ -1062,7 +1353,8 @@ class SupabaseDB:
             if stage == 'done':
                 continue
 
-            # Check timing
+            # Check timing: next email is due days_between after the latest one
+            due_at = None
             if outreach and stage != 'new':
                 latest = outreach[0]
                 if latest.get('replied'):
@@ -1070,10 +1362,8 @@ class SupabaseDB:
                 sent_at = latest.get('sent_at')
                 if sent_at:
                     try:
-                        from datetime import timedelta
                         sent_dt = datetime.fromisoformat(sent_at.replace('Z', '+00:00'))
-                        if (datetime.now(timezone.utc) - sent_dt).days < days_between:
-                            continue
+                        due_at = sent_dt + timedelta(days=days_between)
                     except (ValueError, TypeError):
                         pass
 
@@ -1088,12 +1378,57 @@ class SupabaseDB:
                 'email_stage': stage,
                 'division': school_info.get('division'),
                 'conference': school_info.get('conference'),
+                'due_at': due_at,
             })
 
-            if len(results) >= limit:
+        return results
+
+    # ==========================================
+    # STAFF PAGE RECRAWL
+    # ==========================================
+
+    def get_active_school_counts(self):
+        """{school_id: number of active athletes with the school on their list}."""
+        athletes = self.client.table('athletes').select('id').eq('is_active', True).execute().data
+        athlete_ids = [a['id'] for a in athletes]
+        counts = {}
+        if not athlete_ids:
+            return counts
+        offset = 0
+        batch_size = 1000
+        while True:
+            rows = (self.client.table('athlete_schools').select('school_id')
+                    .in_('athlete_id', athlete_ids)
+                    .range(offset, offset + batch_size - 1).execute()).data
+            for row in rows:
+                counts[row['school_id']] = counts.get(row['school_id'], 0) + 1
+            if len(rows) < batch_size:
                 break
+            offset += batch_size
+        return counts
 
-        return results
+    def record_staff_page_change(self, school_id, staff_url, content_hash, previous_hash=None, changes=None):
+        """Log a detected staff page change and the coach updates it caused."""
+        data = {
+            'school_id': school_id,
+            'staff_url': staff_url,
+            'content_hash': content_hash,
+            'previous_hash': previous_hash,
+            'coaches_updated': len(changes or []),
+            'changes': changes or [],
+        }
+        try:
+            return self.client.table('staff_page_changes').insert(data).execute()
+        except Exception as e:
+            logger.error("Failed to record staff page change for %s: %s", school_id, e)
+            return None
+
+    def get_staff_page_changes(self, school_id=None, limit=50):
+        """Most recent staff page changes, newest first."""
+        q = self.client.table('staff_page_changes').select('*, schools(name)')
+        if school_id:
+            q = q.eq('school_id', school_id)
+        return q.order('detected_at', desc=True).limit(limit).execute().data
 
     # ==========================================
     # ADMIN FUNCTIONS
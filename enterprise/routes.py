@@ -7,6 +7,7 @@ from flask import Blueprint, jsonify, request
 from datetime import datetime
 import uuid
 import os
+import time
 
 # Import enterprise modules
 from enterprise.crm import CRMManager, Contact, Interaction, PipelineStage, InteractionType
@@ -827,11 +828,19 @@ def search_twitter_batch():
         return jsonify({'success': False, 'error': 'coaches list required'}), 400
     
     scraper = GoogleTwitterScraper()
-    results = scraper.find_handles_batch(coaches)
+    started = time.time()
+    lookups = scraper.resolve_batch(coaches)
+    results = {lookup.coach_name: lookup.handle for lookup in lookups if lookup.handle}
+    searched = [lookup for lookup in lookups if not lookup.cached]
     
     return jsonify({
         'success': True,
         'results': results,
         'found': len(results),
-        'total': len(coaches)
+        'total': len(coaches),
+        'lookups': [lookup.to_dict() for lookup in lookups],
+        'cached': len(lookups) - len(searched),
+        'queries': sum(lookup.queries for lookup in searched),
+        'avg_latency_ms': round(sum(lookup.latency_ms for lookup in searched) / len(searched)) if searched else 0,
+        'elapsed_s': round(time.time() - started, 1),
     })
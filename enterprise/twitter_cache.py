@@ -0,0 +1,283 @@
+"""
+enterprise/twitter_cache.py - Twitter Handle Cache
+============================================================================
+GoogleTwitterScraper used to keep one <md5>.json file per coach in
+~/.coach_outreach/twitter_cache, opened and parsed on every lookup, and its
+stats/clear globbed and read the whole directory. TwitterHandleCache keeps
+the same records in one indexed SQLite table:
+
+- Rows keyed by the scraper's md5(coach|school) key, with created_at and
+  expires_at columns so expiry is a WHERE clause, not a file read
+- get_many / put_many: one query or transaction for a whole batch
+- sweep() deletes expired rows (run on open); vacuum() also compacts the file
+- The legacy JSON files are imported once on open and then removed
+
+Config (env):
+- TWITTER_CACHE_PATH: database file (default ~/.coach_outreach/twitter_cache.db)
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = Path.home() / '.coach_outreach' / 'twitter_cache.db'
+DEFAULT_TTL_DAYS = 7
+
+# Keys per IN (...) query, well under SQLite's bound-parameter limit
+QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS twitter_handles (
+    cache_key TEXT PRIMARY KEY,
+    coach_name TEXT NOT NULL,
+    school TEXT NOT NULL,
+    handle TEXT,
+    confidence REAL NOT NULL DEFAULT 0,
+    query_used TEXT,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_twitter_handles_expires ON twitter_handles(expires_at);
+"""
+
+_COLUMNS = ('cache_key', 'coach_name', 'school', 'handle', 'confidence', 'query_used', 'created_at', 'expires_at')
+
+
+def cache_key(coach_name: str, school: str) -> str:
+    """md5 of the normalized coach|school pair (the legacy file name)."""
+    raw = f"{coach_name.lower().strip()}|{school.lower().strip()}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+class TwitterHandleCache:
+    """
+    SQLite store of handle lookups, including misses (handle None).
+
+    Usage:
+        cache = get_twitter_handle_cache()
+        hits = cache.get_many([(name, school), ...])
+        cache.put_many([{'coach_name': name, 'school': school, 'handle': h, ...}])
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl_days: float = DEFAULT_TTL_DAYS,
+                 legacy_dir: Optional[Path] = None):
+        self.path = Path(path or os.environ.get('TWITTER_CACHE_PATH') or DEFAULT_CACHE_PATH).expanduser()
+        self.ttl = ttl_days * 86400
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'expired_removed': 0, 'migrated': 0}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+        if legacy_dir is not None:
+            self.migrate_legacy_dir(legacy_dir)
+        self.sweep()
+
+    # ------------------------------------------
+    # Reads
+    # ------------------------------------------
+
+    def get(self, coach_name: str, school: str) -> Optional[Dict[str, Any]]:
+        """Unexpired record for this coach, or None."""
+        return self.get_many([(coach_name, school)]).get(cache_key(coach_name, school))
+
+    def get_many(self, coaches: Iterable[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Unexpired records for (coach_name, school) pairs, keyed by cache_key()."""
+        keys = list(dict.fromkeys(cache_key(name, school) for name, school in coaches))
+        found: Dict[str, Dict[str, Any]] = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), QUERY_CHUNK):
+                chunk = keys[start:start + QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM twitter_handles "
+                    f"WHERE cache_key IN ({', '.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now),
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = dict(zip(_COLUMNS, row))
+            self.stats['hits'] += len(found)
+            self.stats['misses'] += len(keys) - len(found)
+        return found
+
+    # ------------------------------------------
+    # Writes
+    # ------------------------------------------
+
+    def put(self, coach_name: str, school: str, handle: Optional[str],
+            confidence: float = 0.0, query_used: str = '') -> None:
+        self.put_many([{
+            'coach_name': coach_name,
+            'school': school,
+            'handle': handle,
+            'confidence': confidence,
+            'query_used': query_used,
+        }])
+
+    def put_many(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Store lookups in one transaction.
+
+        Each record has coach_name, school, handle, confidence and query_used;
+        an optional created_at (epoch seconds) backdates the entry and its expiry.
+        """
+        now = time.time()
+        rows = []
+        for record in records:
+            created = record.get('created_at') or now
+            rows.append((
+                cache_key(record['coach_name'], record['school']),
+                record['coach_name'],
+                record['school'],
+                record.get('handle'),
+                record.get('confidence') or 0.0,
+                record.get('query_used') or '',
+                created,
+                created + self.ttl,
+            ))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO twitter_handles ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})", rows)
+                self._conn.execute('COMMIT')
+            except sqlite3.Error:
+                self._conn.execute('ROLLBACK')
+                raise
+            self.stats['stores'] += len(rows)
+
+    def delete(self, coach_name: str, school: str) -> bool:
+        with self._lock:
+            cur = self._conn.execute('DELETE FROM twitter_handles WHERE cache_key = ?',
+                                     (cache_key(coach_name, school),))
+        return cur.rowcount > 0
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number removed."""
+        with self._lock:
+            cur = self._conn.execute('DELETE FROM twitter_handles')
+        return cur.rowcount
+
+    # ------------------------------------------
+    # Maintenance
+    # ------------------------------------------
+
+    def sweep(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        with self._lock:
+            cur = self._conn.execute('DELETE FROM twitter_handles WHERE expires_at <= ?', (time.time(),))
+            self.stats['expired_removed'] += cur.rowcount
+        return cur.rowcount
+
+    def vacuum(self) -> int:
+        """Sweep expired entries, then compact the database file."""
+        removed = self.sweep()
+        with self._lock:
+            self._conn.execute('VACUUM')
+        return removed
+
+    def migrate_legacy_dir(self, legacy_dir: Path) -> int:
+        """Import <md5>.json files from the old per-file cache, then delete them."""
+        legacy_dir = Path(legacy_dir).expanduser()
+        if not legacy_dir.is_dir():
+            return 0
+        files = list(legacy_dir.glob('*.json'))
+        if not files:
+            return 0
+
+        records = []
+        for cache_file in files:
+            try:
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                records.append({
+                    'coach_name': data['coach_name'],
+                    'school': data['school'],
+                    'handle': data.get('handle'),
+                    'confidence': data.get('confidence', 0),
+                    'query_used': data.get('query_used', ''),
+                    'created_at': datetime.fromisoformat(data.get('timestamp', '2000-01-01')).timestamp(),
+                })
+            except Exception as e:
+                logger.debug(f"Skipping unreadable Twitter cache file {cache_file.name}: {e}")
+
+        self.put_many(records)
+        for cache_file in files:
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+        try:
+            legacy_dir.rmdir()
+        except OSError:
+            pass
+        self.stats['migrated'] += len(records)
+        logger.info(f"Twitter cache: migrated {len(records)}/{len(files)} legacy files into {self.path.name}")
+        return len(records)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            total, valid, with_handle = self._conn.execute(
+                'SELECT COUNT(*), '
+                'COALESCE(SUM(expires_at > ?), 0), '
+                'COALESCE(SUM(expires_at > ? AND handle IS NOT NULL), 0) '
+                'FROM twitter_handles', (now, now)).fetchone()
+        size = sum(p.stat().st_size for p in self.path.parent.glob(self.path.name + '*'))
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            'total_entries': total,
+            'valid_entries': valid,
+            'expired_entries': total - valid,
+            'entries_with_handle': with_handle,
+            'total_size_kb': round(size / 1024, 1),
+            'cache_path': str(self.path),
+            **self.stats,
+            'hit_ratio': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Dict[str, TwitterHandleCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_twitter_handle_cache(path: Optional[Path] = None, ttl_days: float = DEFAULT_TTL_DAYS,
+                             legacy_dir: Optional[Path] = None) -> TwitterHandleCache:
+    """Process-wide cache per database file (the legacy import runs on first open)."""
+    resolved = str(Path(path or os.environ.get('TWITTER_CACHE_PATH') or DEFAULT_CACHE_PATH).expanduser())
+    with _shared_lock:
+        if resolved not in _shared:
+            _shared[resolved] = TwitterHandleCache(resolved, ttl_days, legacy_dir)
+        return _shared[resolved]
+
+
+__all__ = [
+    'TwitterHandleCache',
+    'cache_key',
+    'get_twitter_handle_cache',
+]
@@ -5,9 +5,10 @@ Finds coach Twitter handles by searching Google instead of scraping staff pages.
 No API required - uses web scraping with anti-detection measures.
 
 Features:
-- Multiple search query variations per coach
-- Anti-detection: randomized delays, rotating user agents
-- Disk caching with TTL
+- Multiple search query variations per coach, stopping once one is confident
+- Anti-detection: per-engine token buckets with jitter, rotating user agents
+- Concurrent batch lookups over one pooled session (resolve_batch)
+- SQLite handle cache with TTL (enterprise/twitter_cache.py)
 - Confidence scoring based on name/school matching
 - Handles both twitter.com and x.com URLs
 
@@ -17,26 +18,34 @@ Strategy:
 3. Search: site:twitter.com "{coach_name}" "{school}"
 4. Parse results for twitter.com/x.com URLs
 5. Score and validate handles
-6. Cache results to disk
+6. Cache results (batches prefetch every cached coach in one query)
+
+Config (env):
+- TWITTER_BATCH_WORKERS: coaches looked up at once in a batch (default 4)
+- TWITTER_GOOGLE_RATE / TWITTER_DDG_RATE: searches per second per engine,
+  shared by all workers (default 1/min_delay and 1.0)
 
 Author: Coach Outreach System
 Version: 2.0.0 (Enterprise)
 ============================================================================
 """
 
+import os
 import re
 import time
 import random
 import logging
-import json
-import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import Callable, Optional, List, Dict, Tuple
+from dataclasses import dataclass, field
 from urllib.parse import quote_plus, urlparse, unquote
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from extraction.parser_backend import make_soup
+from .twitter_cache import cache_key, get_twitter_handle_cache
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +56,22 @@ logger = logging.getLogger(__name__)
 @dataclass 
 class TwitterSearchConfig:
     """Configuration for Twitter search"""
-    min_delay: float = 2.5  # Min seconds between searches
-    max_delay: float = 6.0  # Max seconds between searches
+    min_delay: float = 2.5  # Min seconds between searches on one engine
+    max_delay: float = 6.0  # Max seconds between searches (min_delay + jitter)
     max_retries: int = 3
     timeout: int = 12
     max_searches_per_session: int = 100
     cache_ttl_days: int = 7  # How long to cache results
     min_confidence: float = 0.3  # Minimum confidence to return result
+    early_exit_confidence: float = 0.5  # Skip remaining query variations at this confidence
+    batch_workers: int = field(default_factory=lambda: int(os.environ.get('TWITTER_BATCH_WORKERS', '4')))
+    cache_path: Optional[Path] = None  # SQLite cache (default: TWITTER_CACHE_PATH or ~/.coach_outreach/twitter_cache.db)
+    # Legacy one-JSON-file-per-coach cache, imported into cache_path once
     cache_dir: Path = field(default_factory=lambda: Path.home() / '.coach_outreach' / 'twitter_cache')
+    cache_write_batch: int = 10  # Batch lookups written per put_many
+
+# Handle score that maps to confidence 1.0
+MAX_SCORE = 30.0
 
 # User agents to rotate
 USER_AGENTS = [
@@ -118,6 +135,80 @@ def extract_handle_from_url(url: str) -> Optional[str]:
     return None
 
 
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class EngineBucket:
+    """
+    Thread-safe token bucket for one search engine: `rate` searches/second
+    across every worker, up to `burst` banked, plus random jitter per search.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, jitter: float = 0.0):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.jitter = max(0.0, jitter)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Take the token now (possibly going negative) so waiters queue in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            wait += random.uniform(0, self.jitter)
+            self.waited += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Push every waiter back, e.g. after a 429."""
+        with self._lock:
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+@dataclass
+class HandleLookup:
+    """Result of looking up one coach, with what it cost."""
+    coach_name: str
+    school: str
+    handle: Optional[str] = None
+    confidence: float = 0.0
+    query_used: str = ''
+    queries: int = 0
+    latency_ms: int = 0
+    cached: bool = False
+    complete: bool = True  # False when the search budget ran out mid-lookup (not cached)
+
+    def to_cache_record(self) -> Dict:
+        return {
+            'coach_name': self.coach_name,
+            'school': self.school,
+            'handle': self.handle,
+            'confidence': self.confidence,
+            'query_used': self.query_used,
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'coach_name': self.coach_name,
+            'school': self.school,
+            'handle': self.handle,
+            'confidence': round(self.confidence, 2),
+            'queries': self.queries,
+            'latency_ms': self.latency_ms,
+            'cached': self.cached,
+        }
+
+
 # ============================================================================
 # GOOGLE SEARCH SCRAPER
 # ============================================================================
@@ -129,68 +220,37 @@ class GoogleTwitterScraper:
     Features:
     - Multiple search query variations per coach
     - Anti-detection: randomized delays, rotating user agents
-    - Disk caching with configurable TTL
+    - SQLite caching with configurable TTL
     - Confidence scoring based on multiple signals
     - Handles both twitter.com and x.com URLs
     """
     
     def __init__(self, config: TwitterSearchConfig = None):
         self.config = config or TwitterSearchConfig()
-        self.session = requests.Session()
+        self.session = self._make_session()
         self.search_count = 0
+        self._count_lock = threading.Lock()
         self._memory_cache: Dict[str, Optional[str]] = {}
-        
-        # Initialize disk cache directory
-        self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+        jitter = max(0.0, self.config.max_delay - self.config.min_delay) / 2
+        self.buckets = {
+            'google': EngineBucket(float(os.environ.get('TWITTER_GOOGLE_RATE', 1 / self.config.min_delay)),
+                                   jitter=jitter),
+            'duckduckgo': EngineBucket(float(os.environ.get('TWITTER_DDG_RATE', '1.0')), jitter=jitter / 2),
+        }
+        self.cache = get_twitter_handle_cache(self.config.cache_path, self.config.cache_ttl_days,
+                                              legacy_dir=self.config.cache_dir)
+    
+    def _make_session(self) -> requests.Session:
+        """One keep-alive session shared by every batch worker."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(10, self.config.batch_workers * 2))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def _get_cache_key(self, coach_name: str, school: str) -> str:
         """Generate cache key from coach info."""
-        raw = f"{coach_name.lower().strip()}|{school.lower().strip()}"
-        return hashlib.md5(raw.encode()).hexdigest()
-    
-    def _load_from_disk_cache(self, coach_name: str, school: str) -> Optional[Dict]:
-        """Load result from disk cache if valid."""
-        cache_key = self._get_cache_key(coach_name, school)
-        cache_file = self.config.cache_dir / f"{cache_key}.json"
-        
-        if not cache_file.exists():
-            return None
-        
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            
-            # Check TTL
-            cached_time = datetime.fromisoformat(data.get('timestamp', '2000-01-01'))
-            if datetime.now() - cached_time > timedelta(days=self.config.cache_ttl_days):
-                return None  # Expired
-            
-            logger.debug(f"Cache hit for {coach_name}: @{data.get('handle')}")
-            return data
-        except Exception as e:
-            logger.warning(f"Cache read error: {e}")
-            return None
-    
-    def _save_to_disk_cache(self, coach_name: str, school: str, handle: Optional[str], 
-                            confidence: float, query_used: str) -> None:
-        """Save result to disk cache."""
-        cache_key = self._get_cache_key(coach_name, school)
-        cache_file = self.config.cache_dir / f"{cache_key}.json"
-        
-        try:
-            data = {
-                'handle': handle,
-                'confidence': confidence,
-                'query_used': query_used,
-                'coach_name': coach_name,
-                'school': school,
-                'timestamp': datetime.now().isoformat()
-            }
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
-            logger.debug(f"Cached result for {coach_name}")
-        except Exception as e:
-            logger.warning(f"Cache write error: {e}")
+        return cache_key(coach_name, school)
     
     def _get_headers(self) -> dict:
         """Get randomized headers with anti-detection measures."""
@@ -207,24 +267,24 @@ class GoogleTwitterScraper:
             "Sec-Fetch-Site": "none",
         }
     
-    def _random_delay(self):
-        """Wait random amount between requests"""
-        delay = random.uniform(self.config.min_delay, self.config.max_delay)
-        time.sleep(delay)
+    def _budget_exhausted(self) -> bool:
+        with self._count_lock:
+            return self.search_count >= self.config.max_searches_per_session
     
     def _search_google(self, query: str) -> Optional[str]:
         """
         Perform Google search and return HTML response.
         """
-        self.search_count += 1
-        
-        if self.search_count > self.config.max_searches_per_session:
-            logger.warning("Max searches per session reached")
-            return None
+        with self._count_lock:
+            self.search_count += 1
+            if self.search_count > self.config.max_searches_per_session:
+                logger.warning("Max searches per session reached")
+                return None
         
         logger.info(f"Searching Google: {query}")
         
         # Use Google Search
+        self.buckets['google'].acquire()
         try:
             url = f"https://www.google.com/search?q={quote_plus(query)}&num=20"
             response = self.session.get(
@@ -237,8 +297,8 @@ class GoogleTwitterScraper:
                 logger.info(f"Google success: {len(response.text)} chars")
                 return response.text
             elif response.status_code == 429:
-                logger.warning("Google rate limited, waiting...")
-                time.sleep(10)
+                logger.warning("Google rate limited, backing off")
+                self.buckets['google'].penalize(10)
             else:
                 logger.warning(f"Google returned {response.status_code}")
                 
@@ -246,6 +306,7 @@ class GoogleTwitterScraper:
             logger.warning(f"Google search failed: {e}")
         
         # Fallback to DuckDuckGo
+        self.buckets['duckduckgo'].acquire()
         try:
             url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
             response = self.session.get(
@@ -269,7 +330,7 @@ class GoogleTwitterScraper:
             return []
         
         urls = []
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # Find all links
         for link in soup.find_all('a', href=True):
@@ -331,16 +392,28 @@ class GoogleTwitterScraper:
         if not coach_name or not school:
             return None
         
-        # Check disk cache first
+        # Check persistent cache first
         if use_cache:
-            cached = self._load_from_disk_cache(coach_name, school)
+            cached = self.cache.get(coach_name, school)
             if cached:
+                logger.debug(f"Cache hit for {coach_name}: @{cached.get('handle')}")
                 return cached.get('handle')
         
         # Check memory cache
-        cache_key = f"{coach_name}|{school}".lower()
-        if cache_key in self._memory_cache:
-            return self._memory_cache[cache_key]
+        memory_key = f"{coach_name}|{school}".lower()
+        if memory_key in self._memory_cache:
+            return self._memory_cache[memory_key]
+        
+        lookup = self._search_handle(coach_name, school, title)
+        if lookup.complete:
+            self._memory_cache[memory_key] = lookup.handle
+            self.cache.put_many([lookup.to_cache_record()])
+        return lookup.handle
+    
+    def _search_handle(self, coach_name: str, school: str, title: str = "") -> HandleLookup:
+        """Run the search queries for one coach (handle None if not found)."""
+        started = time.monotonic()
+        lookup = HandleLookup(coach_name, school)
         
         # Get name parts
         name_parts = coach_name.split()
@@ -375,9 +448,13 @@ class GoogleTwitterScraper:
         best_query = ''
         
         for query in queries[:6]:  # Limit to 6 queries max
+            if self._budget_exhausted():
+                lookup.complete = False
+                break
             logger.info(f"Query: {query}")
             
             html = self._search_google(query)
+            lookup.queries += 1
             if html:
                 urls = self._parse_search_results(html)
                 logger.info(f"Found {len(urls)} Twitter URLs")
@@ -391,32 +468,27 @@ class GoogleTwitterScraper:
                         best_score = score
                         best_query = query
                         
-                        # High confidence - stop early
-                        if score >= 15:
+                        # High confidence - skip the remaining variations
+                        if score / MAX_SCORE >= self.config.early_exit_confidence:
                             logger.info(f"High confidence match @{handle} for {coach_name} (score: {score})")
                             break
-            
-            # Delay between searches
-            self._random_delay()
         
         # Try with all collected URLs if no high-confidence match
         if not best_handle and all_urls:
             best_handle, best_score = self._extract_best_handle_with_score(all_urls, coach_name, school)
         
         # Calculate confidence (0-1 scale)
-        confidence = min(best_score / 30.0, 1.0) if best_score > 0 else 0
+        confidence = min(best_score / MAX_SCORE, 1.0) if best_score > 0 else 0
         
         # Only return if confidence meets threshold
         if best_handle and confidence >= self.config.min_confidence:
             logger.info(f"Found @{best_handle} for {coach_name} ({school}) - confidence: {confidence:.2f}")
-            self._memory_cache[cache_key] = best_handle
-            self._save_to_disk_cache(coach_name, school, best_handle, confidence, best_query)
-            return best_handle
-        
-        logger.debug(f"No confident Twitter handle found for {coach_name} ({school})")
-        self._memory_cache[cache_key] = None
-        self._save_to_disk_cache(coach_name, school, None, 0, '')
-        return None
+            lookup.handle, lookup.confidence, lookup.query_used = best_handle, confidence, best_query
+            lookup.complete = True
+        else:
+            logger.debug(f"No confident Twitter handle found for {coach_name} ({school})")
+        lookup.latency_ms = int((time.monotonic() - started) * 1000)
+        return lookup
     
     def _extract_best_handle_with_score(self, urls: List[str], coach_name: str, 
                                          school: str) -> Tuple[Optional[str], int]:
@@ -471,10 +543,88 @@ class GoogleTwitterScraper:
         handles_with_scores.sort(key=lambda x: x[1], reverse=True)
         return handles_with_scores[0]
     
+    def resolve_batch(self, coaches: List[Dict[str, str]],
+                      callback: Optional[Callable[[HandleLookup], None]] = None,
+                      should_stop: Optional[Callable[[], bool]] = None,
+                      workers: Optional[int] = None) -> List[HandleLookup]:
+        """
+        Look up many coaches concurrently.
+        
+        Cached coaches are answered from one cache query; the rest run on
+        `workers` threads that share the session and the per-engine buckets,
+        so concurrency overlaps request latency without raising the search rate.
+        
+        Args:
+            coaches: List of dicts with 'name', 'school', 'title' keys (duplicates searched once)
+            callback: Optional callback(lookup) as each coach finishes (caller's thread)
+            should_stop: Optional check; coaches not yet started are skipped once it returns True
+            workers: Concurrent lookups (default config.batch_workers)
+        
+        Returns:
+            HandleLookup per coach that was looked up, in completion order
+        """
+        # One lookup per person: the same coach can appear once per role
+        unique = {}
+        for coach in coaches:
+            name, school = coach.get('name', '').strip(), coach.get('school', '').strip()
+            if name and school:
+                unique.setdefault(cache_key(name, school), coach)
+        coaches = list(unique.values())
+        
+        # One query for every coach already cached
+        cached = self.cache.get_many((c['name'].strip(), c['school'].strip()) for c in coaches)
+        logger.info(f"Twitter batch: {len(cached)}/{len(coaches)} coaches cached")
+        
+        lookups: List[HandleLookup] = []
+        to_search = []
+        for key, coach in unique.items():
+            name, school = coach['name'].strip(), coach['school'].strip()
+            hit = cached.get(key)
+            if hit is None:
+                to_search.append((name, school, coach.get('title', '')))
+                continue
+            lookup = HandleLookup(name, school, hit['handle'], hit['confidence'] or 0.0,
+                                  hit['query_used'] or '', cached=True)
+            lookups.append(lookup)
+            if callback:
+                callback(lookup)
+        
+        def run(name: str, school: str, title: str) -> Optional[HandleLookup]:
+            if should_stop and should_stop():
+                return None
+            return self._search_handle(name, school, title)
+        
+        pending_writes = []
+        with ThreadPoolExecutor(max_workers=max(1, workers or self.config.batch_workers),
+                                thread_name_prefix='twitter-search') as executor:
+            futures = [executor.submit(run, *coach) for coach in to_search]
+            for future in as_completed(futures):
+                try:
+                    lookup = future.result()
+                except Exception as e:
+                    logger.warning(f"Twitter lookup failed: {e}")
+                    continue
+                if lookup is None:
+                    continue
+                lookups.append(lookup)
+                if lookup.complete:
+                    self._memory_cache[f"{lookup.coach_name}|{lookup.school}".lower()] = lookup.handle
+                    pending_writes.append(lookup.to_cache_record())
+                    if len(pending_writes) >= self.config.cache_write_batch:
+                        self.cache.put_many(pending_writes)
+                        pending_writes = []
+                if callback:
+                    callback(lookup)
+                if len(lookups) % 10 == 0:
+                    logger.info(f"Processed {len(lookups)}/{len(coaches)} coaches")
+        
+        self.cache.put_many(pending_writes)
+        return lookups
+    
     def find_handles_batch(self, coaches: List[Dict[str, str]], 
                           callback=None) -> Dict[str, str]:
         """
-        Find Twitter handles for multiple coaches.
+        Find Twitter handles for multiple coaches (concurrently, see resolve_batch).
         
         Args:
             coaches: List of dicts with 'name', 'school', 'title' keys
@@ -483,78 +633,25 @@ class GoogleTwitterScraper:
         Returns:
             Dict mapping coach names to handles
         """
-        results = {}
-        
-        for i, coach in enumerate(coaches):
-            name = coach.get('name', '')
-            school = coach.get('school', '')
-            title = coach.get('title', '')
-            
-            if not name or not school:
-                continue
-            
-            handle = self.find_twitter_handle(name, school, title)
-            
-            if handle:
-                results[name] = handle
-            
-            if callback:
-                callback(name, handle)
-            
-            # Progress logging
-            if (i + 1) % 10 == 0:
-                logger.info(f"Processed {i + 1}/{len(coaches)} coaches")
-        
-        return results
+        on_lookup = (lambda lookup: callback(lookup.coach_name, lookup.handle)) if callback else None
+        return {lookup.coach_name: lookup.handle
+                for lookup in self.resolve_batch(coaches, on_lookup) if lookup.handle}
     
     def reset_session(self):
         """Reset session and search count"""
-        self.session = requests.Session()
-        self.search_count = 0
+        self.session.close()
+        self.session = self._make_session()
+        with self._count_lock:
+            self.search_count = 0
     
     def clear_cache(self) -> int:
         """Clear all cached results. Returns number of entries cleared."""
-        count = 0
-        for cache_file in self.config.cache_dir.glob('*.json'):
-            try:
-                cache_file.unlink()
-                count += 1
-            except:
-                pass
         self._memory_cache.clear()
-        return count
+        return self.cache.clear()
     
     def get_cache_stats(self) -> Dict:
         """Get cache statistics."""
-        cache_files = list(self.config.cache_dir.glob('*.json'))
-        total_size = sum(f.stat().st_size for f in cache_files)
-        
-        valid = 0
-        expired = 0
-        with_handle = 0
-        
-        for cache_file in cache_files:
-            try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                cached_time = datetime.fromisoformat(data.get('timestamp', '2000-01-01'))
-                if datetime.now() - cached_time > timedelta(days=self.config.cache_ttl_days):
-                    expired += 1
-                else:
-                    valid += 1
-                    if data.get('handle'):
-                        with_handle += 1
-            except:
-                expired += 1
-        
-        return {
-            'total_entries': len(cache_files),
-            'valid_entries': valid,
-            'expired_entries': expired,
-            'entries_with_handle': with_handle,
-            'total_size_kb': round(total_size / 1024, 1),
-            'cache_dir': str(self.config.cache_dir)
-        }
+        return self.cache.get_stats()
 
 
 # ============================================================================
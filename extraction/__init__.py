@@ -10,18 +10,25 @@ Version: 2.0.0
 
 from extraction.dom_parser import (
     DOMParser,
+    PageIndex,
     StructuredDataExtractor,
     StaffCardExtractor,
     DOMProximityExtractor,
     TableExtractor,
     TextPatternExtractor,
 )
+from extraction.parser_backend import make_soup, available_backends
+from extraction.result_cache import ExtractionCache
 
 __all__ = [
     'DOMParser',
+    'PageIndex',
     'StructuredDataExtractor',
     'StaffCardExtractor',
     'DOMProximityExtractor',
     'TableExtractor',
     'TextPatternExtractor',
+    'make_soup',
+    'available_backends',
+    'ExtractionCache',
 ]
@@ -8,6 +8,7 @@ staff information from college athletic websites. It employs multiple
 extraction strategies with fallback mechanisms.
 
 Extraction Strategies (in order of reliability):
+0. Vendor Layouts (Sidearm, Presto, WMT) - Fast path for known CMS markup
 1. Structured Data (JSON-LD, Microdata) - Most reliable when present
 2. Staff Cards - Common layout pattern in modern athletic sites
 3. DOM Proximity - Correlate elements by tree position
@@ -27,16 +28,22 @@ Version: 2.0.0
 ============================================================================
 """
 
+import os
 import re
+import copy
 import json
+import signal
 import hashlib
+import threading
+from bisect import bisect_left
 from typing import (
     List, Dict, Optional, Tuple, Set, Any,
-    Iterator, Callable, Union
+    Iterable, Iterator, Callable, Union
 )
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from bs4 import BeautifulSoup, Tag, NavigableString, Comment
+from bs4 import BeautifulSoup, Tag, NavigableString, CData, Comment
 from urllib.parse import urljoin, urlparse
 import logging
 
@@ -55,11 +62,11 @@ from core.normalizer import (
     normalize_whitespace,
 )
 from core.classifier import (
-    classify_role,
-    is_ol_coach,
-    is_recruiting_coordinator,
+    classify_many,
     get_classifier,
 )
+from extraction.parser_backend import make_soup, resolve_backend
+from extraction.result_cache import ExtractionCache, get_extraction_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -69,15 +76,27 @@ logger = logging.getLogger(__name__)
 # CONSTANTS AND CONFIGURATION
 # ============================================================================
 
+# Bump whenever extraction or classification output changes; cached results
+# from other versions are dropped (see extraction/result_cache.py)
+EXTRACTOR_VERSION = '2.4.0'
+
 # Minimum confidence thresholds
 MIN_NAME_CONFIDENCE = 50
 MIN_TITLE_CONFIDENCE = 30
 
+# Name/title pairs further apart than this in the tree aren't correlated
+MAX_PROXIMITY_DISTANCE = 6
+
 # Maximum elements to process (prevents runaway on huge pages)
 MAX_CARDS_TO_PROCESS = 200
 MAX_TABLES_TO_PROCESS = 50
 MAX_TEXT_LINES = 5000
 
+# parse_many(): seconds one page may take in a worker before it is abandoned,
+# and the most pages sent to a worker in one task
+DEFAULT_PAGE_TIMEOUT = 30
+MAX_CHUNK_SIZE = 50
+
 # CSS selectors for finding staff cards (ordered by specificity)
 STAFF_CARD_SELECTORS = [
     # Sidearm Sports (very common for college athletics)
@@ -126,6 +145,8 @@ STAFF_CARD_SELECTORS = [
     '[id*="staff"]',
 ]
 
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
 # Elements typically containing names
 NAME_ELEMENT_SELECTORS = [
     'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
@@ -416,6 +437,313 @@ def dom_distance(elem1: Tag, elem2: Tag) -> int:
     return dist1 + dist2
 
 
+def classify_staff(staff: List[StaffMember]) -> List[StaffMember]:
+    """
+    Set roles on every member from its raw title.
+    
+    Directories repeat a handful of titles ("Graduate Assistant",
+    "Defensive Coordinator"), so the titles are classified in one
+    classify_many() batch, each distinct title once.
+    """
+    roles = classify_many(m.raw_title for m in staff if m.raw_title)
+    assigned: Set[str] = set()
+    for member in staff:
+        title = member.raw_title
+        if title:
+            # Members sharing a title get their own copies of the results
+            member.roles = [copy.copy(r) for r in roles[title]] if title in assigned else roles[title]
+            assigned.add(title)
+    return staff
+
+
+# ============================================================================
+# PAGE INDEX
+# ============================================================================
+
+# String types Tag.get_text() includes (comments, doctypes etc. are skipped)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Tags whose own get_text() reads a different string type (see bs4 string_containers)
+SPECIAL_STRING_CONTAINERS = {'rt', 'rp', 'script', 'style', 'template'}
+
+# Simple compound selectors: optional tag name, then .class / [attr] / [attr op "value"]
+_SELECTOR_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?((?:\.[-\w]+|\[[-\w]+(?:[*^$]?="[^"]*")?\])*)$')
+_SELECTOR_PART_RE = re.compile(r'\.([-\w]+)|\[([-\w]+)(?:([*^$]?=)"([^"]*)")?\]')
+_compiled_selectors: Dict[str, Optional[Tuple[Optional[str], List[Tuple]]]] = {}
+
+
+def compile_selector(selector: str) -> Optional[Tuple[Optional[str], List[Tuple]]]:
+    """
+    Compile a simple CSS selector into (tag name, [(attr, op, value), ...]).
+    
+    Class tokens compile to ('class', '~=', token). Returns None for
+    selectors PageIndex.select can't evaluate itself (they go to soupsieve).
+    """
+    if selector in _compiled_selectors:
+        return _compiled_selectors[selector]
+    
+    compiled = None
+    match = _SELECTOR_RE.match(selector.strip())
+    if match and (match.group(1) or match.group(2)):
+        parts = []
+        for cls, attr, op, value in _SELECTOR_PART_RE.findall(match.group(2) or ''):
+            if cls:
+                parts.append(('class', '~=', cls))
+            else:
+                parts.append((attr.lower(), op or None, value))
+        name = match.group(1).lower() if match.group(1) else None
+        compiled = (name, parts)
+    
+    _compiled_selectors[selector] = compiled
+    return compiled
+
+
+def _attr_matches(tag: Tag, attr: str, op: Optional[str], value: str) -> bool:
+    actual = tag.attrs.get(attr)
+    if actual is None:
+        return False
+    if op == '~=':
+        tokens = actual if isinstance(actual, list) else actual.split()
+        return value in tokens
+    if op is None:
+        return True
+    if isinstance(actual, list):
+        actual = ' '.join(actual)
+    if op == '=':
+        return actual == value
+    if not value:
+        return False
+    if op == '*=':
+        return value in actual
+    if op == '^=':
+        return actual.startswith(value)
+    return actual.endswith(value)
+
+
+class PageIndex:
+    """
+    One-pass index of a parsed page shared by all extraction strategies.
+    
+    A single traversal records every tag in document order with its depth,
+    parent, subtree extent and text span, plus lookup tables by tag name,
+    attribute and class token. Strategies query the index instead of
+    re-walking the soup with find_all/select/get_text, and per-node text,
+    emails, phone and Twitter results are computed at most once.
+    
+    The index is a snapshot: build it after clean_soup() and don't mutate
+    the soup while it's in use.
+    """
+    
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self.tags: List[Tag] = []
+        self.depth: List[int] = []
+        self.parent: List[int] = []       # parent position, -1 for top-level tags
+        self.end: List[int] = []          # position after the tag's last descendant
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_attr: Dict[str, List[int]] = {}
+        self.by_class: Dict[str, List[int]] = {}
+        self.email_attr_tags: List[int] = []   # tags with a string *email* attribute
+        self._pos: Dict[int, int] = {}
+        self._string_span: List[Tuple[int, int]] = []
+        self._strings: List[str] = []
+        self._cache: Dict[Tuple, Any] = {}
+        self._build()
+    
+    def _build(self) -> None:
+        strings = self._strings
+        stack: List[Tuple[Any, Iterator, int, int]] = [(self.soup, iter(self.soup.contents), -1, 0)]
+        while stack:
+            node, children, pos, first_string = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if pos >= 0:
+                    self.end[pos] = len(self.tags)
+                    self._string_span[pos] = (first_string, len(strings))
+                continue
+            
+            if isinstance(child, Tag):
+                child_pos = len(self.tags)
+                self.tags.append(child)
+                self._pos[id(child)] = child_pos
+                self.depth.append(len(stack) - 1)
+                self.parent.append(pos)
+                self.end.append(child_pos + 1)
+                self._string_span.append((len(strings), len(strings)))
+                self.by_name.setdefault(child.name, []).append(child_pos)
+                has_email_attr = False
+                for attr, value in child.attrs.items():
+                    self.by_attr.setdefault(attr, []).append(child_pos)
+                    if isinstance(value, str) and 'email' in attr.lower():
+                        has_email_attr = True
+                if has_email_attr:
+                    self.email_attr_tags.append(child_pos)
+                classes = child.attrs.get('class')
+                if classes:
+                    tokens = classes if isinstance(classes, list) else classes.split()
+                    for token in set(tokens):
+                        self.by_class.setdefault(token, []).append(child_pos)
+                stack.append((child, iter(child.contents), child_pos, len(strings)))
+            elif type(child) in TEXT_STRING_TYPES:
+                strings.append(str(child))
+    
+    # ------------------------------------------------------------------
+    # Structure
+    # ------------------------------------------------------------------
+    
+    def position(self, tag: Tag) -> int:
+        """Document-order position of a tag (-1 for the soup itself)."""
+        return self._pos.get(id(tag), -1)
+    
+    def _scope(self, scope: Optional[Tag]) -> Tuple[int, int]:
+        """Position range of scope's descendants (the whole page when None)."""
+        if scope is None or scope is self.soup:
+            return 0, len(self.tags)
+        pos = self._pos[id(scope)]
+        return pos + 1, self.end[pos]
+    
+    @staticmethod
+    def _slice(positions: List[int], lo: int, hi: int) -> List[int]:
+        return positions[bisect_left(positions, lo):bisect_left(positions, hi)]
+    
+    def find_all(self, names: Union[str, List[str]], scope: Optional[Tag] = None,
+                 has_attr: Optional[str] = None) -> List[Tag]:
+        """Descendants of scope with the given tag name(s), in document order."""
+        lo, hi = self._scope(scope)
+        if isinstance(names, str):
+            positions = self._slice(self.by_name.get(names, []), lo, hi)
+        else:
+            positions = sorted(p for name in set(names)
+                               for p in self._slice(self.by_name.get(name, []), lo, hi))
+        if has_attr is not None:
+            return [self.tags[p] for p in positions if has_attr in self.tags[p].attrs]
+        return [self.tags[p] for p in positions]
+    
+    def select(self, selector: str, scope: Optional[Tag] = None) -> List[Tag]:
+        """Equivalent of (scope or soup).select(selector) for simple selectors."""
+        compiled = compile_selector(selector)
+        if compiled is None:
+            return (scope if scope is not None else self.soup).select(selector)
+        
+        name, parts = compiled
+        if name is not None:
+            pool = self.by_name.get(name, [])
+        elif parts[0][1] == '~=':
+            pool = self.by_class.get(parts[0][2], [])
+        else:
+            pool = self.by_attr.get(parts[0][0], [])
+        
+        lo, hi = self._scope(scope)
+        tags = self.tags
+        return [tags[p] for p in self._slice(pool, lo, hi)
+                if all(_attr_matches(tags[p], attr, op, value) for attr, op, value in parts)]
+    
+    def ancestor_path(self, tag: Tag, max_steps: int) -> List[int]:
+        """
+        Positions of tag and its ancestors, nearest first, at most
+        max_steps steps up. The soup itself appears as -1.
+        """
+        pos = self._pos[id(tag)]
+        path = [pos]
+        while pos >= 0 and len(path) <= max_steps:
+            pos = self.parent[pos]
+            path.append(pos)
+        return path
+    
+    # ------------------------------------------------------------------
+    # Text
+    # ------------------------------------------------------------------
+    
+    def text(self, tag: Optional[Tag] = None, separator: str = '', strip: bool = False) -> str:
+        """Same result as tag.get_text(separator, strip) (whole page when tag is None)."""
+        if tag is not None and tag.name in SPECIAL_STRING_CONTAINERS:
+            return tag.get_text(separator, strip=strip)
+        key = ('text', self.position(tag) if tag is not None else -1, separator, strip)
+        cached = self._cache.get(key)
+        if cached is None:
+            if tag is None or tag is self.soup:
+                strings = self._strings
+            else:
+                start, end = self._string_span[self._pos[id(tag)]]
+                strings = self._strings[start:end]
+            if strip:
+                strings = [s for s in (s.strip() for s in strings) if s]
+            cached = self._cache[key] = separator.join(strings)
+        return cached
+    
+    def clean_text(self, tag: Tag) -> str:
+        """Cached extract_text_content()."""
+        key = ('clean', self.position(tag))
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = normalize_whitespace(self.text(tag, ' ', strip=True))
+        return cached
+    
+    def lines(self, tag: Optional[Tag] = None) -> List[str]:
+        """Non-empty stripped lines of get_text(separator='\\n')."""
+        return [l.strip() for l in self.text(tag, '\n').split('\n') if l.strip()]
+    
+    # ------------------------------------------------------------------
+    # Contact details per node
+    # ------------------------------------------------------------------
+    
+    def emails(self, tag: Tag) -> List[str]:
+        """Cached extract_emails_from_element()."""
+        key = ('emails', self.position(tag))
+        if key not in self._cache:
+            emails: Set[str] = set()
+            for match in EMAIL_PATTERN.finditer(self.text(tag)):
+                email = match.group(0).lower()
+                if is_valid_email(email):
+                    emails.add(email)
+            for link in self.find_all('a', tag, has_attr='href'):
+                mailto_match = MAILTO_PATTERN.search(link.get('href', ''))
+                if mailto_match:
+                    email = mailto_match.group(1).lower()
+                    if is_valid_email(email):
+                        emails.add(email)
+            lo, hi = self._scope(tag)
+            for pos in self._slice(self.email_attr_tags, lo, hi):
+                for attr, value in self.tags[pos].attrs.items():
+                    if isinstance(value, str) and 'email' in attr.lower() and '@' in value:
+                        email = value.lower().strip()
+                        if is_valid_email(email):
+                            emails.add(email)
+            self._cache[key] = list(emails)
+        return self._cache[key]
+    
+    def phone(self, tag: Tag) -> Optional[str]:
+        """Cached extract_phone_from_element()."""
+        key = ('phone', self.position(tag))
+        if key not in self._cache:
+            phone = None
+            match = PHONE_PATTERN.search(self.text(tag))
+            if match:
+                digits = re.sub(r'[^\d]', '', match.group(0))
+                if len(digits) >= 10:
+                    phone = digits
+            self._cache[key] = phone
+        return self._cache[key]
+    
+    def twitter(self, tag: Tag) -> Optional[str]:
+        """Cached extract_twitter_from_element()."""
+        key = ('twitter', self.position(tag))
+        if key not in self._cache:
+            handle = None
+            for link in self.find_all('a', tag, has_attr='href'):
+                match = TWITTER_PATTERN.search(link.get('href', ''))
+                if match:
+                    handle = match.group(1)
+                    break
+            if handle is None:
+                match = TWITTER_PATTERN.search(self.text(tag))
+                if match:
+                    handle = match.group(1)
+            self._cache[key] = f"https://x.com/{handle}" if handle else None
+        return self._cache[key]
+
+
 # ============================================================================
 # STRATEGY 1: STRUCTURED DATA EXTRACTION
 # ============================================================================
@@ -428,23 +756,25 @@ class StructuredDataExtractor:
     as structured data follows defined schemas.
     """
     
-    def extract(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def extract(self, soup: BeautifulSoup, url: str,
+                index: Optional[PageIndex] = None) -> List[StaffMember]:
         """Extract staff from structured data."""
+        index = index or PageIndex(soup)
         staff: List[StaffMember] = []
         
         # Try JSON-LD
-        staff.extend(self._extract_json_ld(soup, url))
+        staff.extend(self._extract_json_ld(index, url))
         
         # Try Microdata
-        staff.extend(self._extract_microdata(soup, url))
+        staff.extend(self._extract_microdata(index, url))
         
-        return staff
+        return classify_staff(staff)
     
-    def _extract_json_ld(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def _extract_json_ld(self, index: PageIndex, url: str) -> List[StaffMember]:
         """Extract from JSON-LD script tags."""
         staff: List[StaffMember] = []
         
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script in index.select('script[type="application/ld+json"]'):
             try:
                 data = json.loads(script.string or '')
                 staff.extend(self._process_json_ld(data, url))
@@ -508,28 +838,27 @@ class StructuredDataExtractor:
             source_url=url,
         )
         
-        # Classify roles
-        if title:
-            member.roles = classify_role(title)
-        
         return member
     
-    def _extract_microdata(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def _extract_microdata(self, index: PageIndex, url: str) -> List[StaffMember]:
         """Extract from HTML Microdata."""
         staff: List[StaffMember] = []
         
         # Find Person items
-        for person in soup.find_all(itemtype=re.compile(r'schema\.org/Person', re.I)):
-            member = self._parse_microdata_person(person, url)
+        person_type = re.compile(r'schema\.org/Person', re.I)
+        for person in index.select('[itemtype]'):
+            if not person_type.search(' '.join(person.get_attribute_list('itemtype'))):
+                continue
+            member = self._parse_microdata_person(person, index, url)
             if member:
                 staff.append(member)
         
         return staff
     
-    def _parse_microdata_person(self, element: Tag, url: str) -> Optional[StaffMember]:
+    def _parse_microdata_person(self, element: Tag, index: PageIndex, url: str) -> Optional[StaffMember]:
         """Parse a microdata Person element."""
-        name_elem = element.find(itemprop='name')
-        name = name_elem.get_text(strip=True) if name_elem else ''
+        name_elem = next(iter(index.select('[itemprop="name"]', element)), None)
+        name = index.text(name_elem, strip=True) if name_elem else ''
         
         if not name:
             return None
@@ -538,13 +867,13 @@ class StructuredDataExtractor:
         if not is_name:
             return None
         
-        title_elem = element.find(itemprop='jobTitle')
-        title = title_elem.get_text(strip=True) if title_elem else ''
+        title_elem = next(iter(index.select('[itemprop="jobTitle"]', element)), None)
+        title = index.text(title_elem, strip=True) if title_elem else ''
         
-        email_elem = element.find(itemprop='email')
+        email_elem = next(iter(index.select('[itemprop="email"]', element)), None)
         email = ''
         if email_elem:
-            email = email_elem.get('content', email_elem.get_text(strip=True))
+            email = email_elem.get('content', index.text(email_elem, strip=True))
         
         member = StaffMember(
             name=normalize_name(name),
@@ -558,9 +887,6 @@ class StructuredDataExtractor:
             source_url=url,
         )
         
-        if title:
-            member.roles = classify_role(title)
-        
         return member
 
 
@@ -577,14 +903,16 @@ class StaffCardExtractor:
     contact info from each.
     """
     
-    def extract(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def extract(self, soup: BeautifulSoup, url: str,
+                index: Optional[PageIndex] = None) -> List[StaffMember]:
         """Extract staff from card layouts."""
+        index = index or PageIndex(soup)
         staff: List[StaffMember] = []
         processed_elements: Set[int] = set()  # Track by element id
         
         for selector in STAFF_CARD_SELECTORS:
             try:
-                cards = soup.select(selector)[:MAX_CARDS_TO_PROCESS]
+                cards = index.select(selector)[:MAX_CARDS_TO_PROCESS]
                 
                 for card in cards:
                     # Skip if already processed
@@ -593,7 +921,7 @@ class StaffCardExtractor:
                         continue
                     processed_elements.add(card_id)
                     
-                    member = self._extract_from_card(card, url)
+                    member = self._extract_from_card(card, index, url)
                     if member:
                         staff.append(member)
                         
@@ -601,22 +929,22 @@ class StaffCardExtractor:
                 logger.debug(f"Selector '{selector}' failed: {e}")
                 continue
         
-        return staff
+        return classify_staff(staff)
     
-    def _extract_from_card(self, card: Tag, url: str) -> Optional[StaffMember]:
+    def _extract_from_card(self, card: Tag, index: PageIndex, url: str) -> Optional[StaffMember]:
         """Extract staff member from a single card element."""
         # Try to find name
-        name, name_confidence = self._find_name_in_card(card)
+        name, name_confidence = self._find_name_in_card(card, index)
         if not name or name_confidence < MIN_NAME_CONFIDENCE:
             return None
         
         # Find title
-        title = self._find_title_in_card(card)
+        title = self._find_title_in_card(card, index)
         
         # Find contact info
-        emails = extract_emails_from_element(card)
-        phone = extract_phone_from_element(card)
-        twitter = extract_twitter_from_element(card)
+        emails = index.emails(card)
+        phone = index.phone(card)
+        twitter = index.twitter(card)
         
         member = StaffMember(
             name=normalize_name(name),
@@ -633,13 +961,9 @@ class StaffCardExtractor:
             source_url=url,
         )
         
-        # Classify roles
-        if title:
-            member.roles = classify_role(title)
-        
         return member
     
-    def _find_name_in_card(self, card: Tag) -> Tuple[str, int]:
+    def _find_name_in_card(self, card: Tag, index: PageIndex) -> Tuple[str, int]:
         """
         Find the name within a card element.
         
@@ -649,15 +973,15 @@ class StaffCardExtractor:
         
         # Strategy 1: Check specific name elements
         for selector in NAME_ELEMENT_SELECTORS:
-            for elem in card.select(selector)[:10]:
-                text = extract_text_content(elem)
+            for elem in index.select(selector, card)[:10]:
+                text = index.clean_text(elem)
                 is_name, conf, _ = is_valid_name(text)
                 if is_name and conf >= MIN_NAME_CONFIDENCE:
                     candidates.append((text, conf + 10, f"selector:{selector}"))
         
         # Strategy 2: Check headings (names often in headings)
-        for heading in card.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])[:5]:
-            text = extract_text_content(heading)
+        for heading in index.find_all(HEADING_TAGS, card)[:5]:
+            text = index.clean_text(heading)
             is_name, conf, _ = is_valid_name(text)
             if is_name:
                 candidates.append((text, conf + 15, "heading"))
@@ -666,7 +990,7 @@ class StaffCardExtractor:
         all_text = []
         for child in card.children:
             if isinstance(child, Tag):
-                text = extract_text_content(child)
+                text = index.clean_text(child)
                 if text and len(text) > 2:
                     all_text.append(text)
         
@@ -686,14 +1010,14 @@ class StaffCardExtractor:
         
         return best_name, best_conf
     
-    def _find_title_in_card(self, card: Tag) -> str:
+    def _find_title_in_card(self, card: Tag, index: PageIndex) -> str:
         """Find the job title within a card element."""
         candidates: List[Tuple[str, int]] = []  # (title, score)
         
         # Strategy 1: Check specific title elements
         for selector in TITLE_ELEMENT_SELECTORS:
-            for elem in card.select(selector)[:10]:
-                text = extract_text_content(elem)
+            for elem in index.select(selector, card)[:10]:
+                text = index.clean_text(elem)
                 if text and len(text) > 3:
                     # Score based on whether it looks like a title
                     score = 50
@@ -704,10 +1028,7 @@ class StaffCardExtractor:
                     candidates.append((text, score))
         
         # Strategy 2: Find text after name that looks like a title
-        card_text = card.get_text(separator='\n')
-        lines = [l.strip() for l in card_text.split('\n') if l.strip()]
-        
-        for line in lines:
+        for line in index.lines(card):
             # Skip if it looks like a name
             is_name, _, _ = is_valid_name(line)
             if is_name:
@@ -737,46 +1058,26 @@ class DOMProximityExtractor:
     then correlates them based on DOM tree proximity.
     """
     
-    def extract(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def extract(self, soup: BeautifulSoup, url: str,
+                index: Optional[PageIndex] = None) -> List[StaffMember]:
         """Extract staff using DOM proximity correlation."""
+        index = index or PageIndex(soup)
         staff: List[StaffMember] = []
         
         # Find all potential name elements
-        name_elements = self._find_name_elements(soup)
+        name_elements = self._find_name_elements(index)
         
         # Find all potential title elements
-        title_elements = self._find_title_elements(soup)
+        title_elements = self._find_title_elements(index)
         
         # Correlate names with titles
-        used_titles: Set[int] = set()
+        matches = self._match_titles(index, name_elements, title_elements)
         
-        for name_elem, name_text, name_conf in name_elements:
-            # Find closest title element
-            best_title = None
-            best_distance = float('inf')
-            best_title_idx = -1
-            
-            for idx, (title_elem, title_text) in enumerate(title_elements):
-                if idx in used_titles:
-                    continue
-                
-                distance = dom_distance(name_elem, title_elem)
-                if distance < best_distance:
-                    best_distance = distance
-                    best_title = title_text
-                    best_title_idx = idx
-            
-            # Only accept if distance is reasonable (within same card/section)
-            if best_distance > 6:
-                best_title = None
-            
-            if best_title_idx >= 0 and best_distance <= 6:
-                used_titles.add(best_title_idx)
-            
+        for (name_elem, name_text, name_conf), best_title in zip(name_elements, matches):
             # Find email near name
             parent = name_elem.parent
             search_area = parent if parent else name_elem
-            emails = extract_emails_from_element(search_area)
+            emails = index.emails(search_area)
             
             member = StaffMember(
                 name=normalize_name(name_text),
@@ -790,21 +1091,73 @@ class DOMProximityExtractor:
                 source_url=url,
             )
             
-            if best_title:
-                member.roles = classify_role(best_title)
-            
             staff.append(member)
         
-        return staff
+        return classify_staff(staff)
     
-    def _find_name_elements(self, soup: BeautifulSoup) -> List[Tuple[Tag, str, int]]:
+    def _match_titles(
+        self,
+        index: PageIndex,
+        name_elements: List[Tuple[Tag, str, int]],
+        title_elements: List[Tuple[Tag, str]],
+    ) -> List[Optional[str]]:
+        """
+        Greedily give each name (in order) the closest unused title.
+        
+        Same assignment as scanning every title with dom_distance() and
+        keeping the first minimum, but only pairs within
+        MAX_PROXIMITY_DISTANCE can match, so each title is registered under
+        its ancestors up to that many levels, bucketed by level. For a
+        name k steps below ancestor A, a title `level` steps below A is at
+        distance <= k + level (exactly, when A is their common ancestor),
+        and the lowest unused title index in each (A, level) bucket is
+        the only candidate that bucket can contribute.
+        """
+        limit = MAX_PROXIMITY_DISTANCE
+        
+        # (ancestor position, level) -> title indexes in ascending order
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for idx, (title_elem, _) in enumerate(title_elements):
+            for level, ancestor in enumerate(index.ancestor_path(title_elem, limit)):
+                buckets.setdefault((ancestor, level), []).append(idx)
+        heads: Dict[Tuple[int, int], int] = {}
+        used_titles: Set[int] = set()
+        
+        def first_unused(key: Tuple[int, int]) -> Optional[int]:
+            bucket = buckets.get(key)
+            if not bucket:
+                return None
+            head = heads.get(key, 0)
+            while head < len(bucket) and bucket[head] in used_titles:
+                head += 1
+            heads[key] = head
+            return bucket[head] if head < len(bucket) else None
+        
+        matches: List[Optional[str]] = []
+        for name_elem, _, _ in name_elements:
+            best: Optional[Tuple[int, int]] = None  # (distance, title index)
+            for steps, ancestor in enumerate(index.ancestor_path(name_elem, limit)):
+                for level in range(limit - steps + 1):
+                    idx = first_unused((ancestor, level))
+                    if idx is not None and (best is None or (steps + level, idx) < best):
+                        best = (steps + level, idx)
+            
+            if best is None:
+                matches.append(None)
+            else:
+                used_titles.add(best[1])
+                matches.append(title_elements[best[1]][1])
+        
+        return matches
+    
+    def _find_name_elements(self, index: PageIndex) -> List[Tuple[Tag, str, int]]:
         """Find all elements that appear to contain names."""
         results: List[Tuple[Tag, str, int]] = []
         seen_names: Set[str] = set()
         
         # Check headings
-        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            text = extract_text_content(heading)
+        for heading in index.find_all(HEADING_TAGS):
+            text = index.clean_text(heading)
             if text and text not in seen_names:
                 is_name, conf, _ = is_valid_name(text)
                 if is_name and conf >= MIN_NAME_CONFIDENCE:
@@ -813,8 +1166,8 @@ class DOMProximityExtractor:
         
         # Check elements with name-related classes
         for selector in ['[class*="name"]', '[itemprop="name"]']:
-            for elem in soup.select(selector):
-                text = extract_text_content(elem)
+            for elem in index.select(selector):
+                text = index.clean_text(elem)
                 if text and text not in seen_names:
                     is_name, conf, _ = is_valid_name(text)
                     if is_name and conf >= MIN_NAME_CONFIDENCE:
@@ -823,14 +1176,14 @@ class DOMProximityExtractor:
         
         return results
     
-    def _find_title_elements(self, soup: BeautifulSoup) -> List[Tuple[Tag, str]]:
+    def _find_title_elements(self, index: PageIndex) -> List[Tuple[Tag, str]]:
         """Find all elements that appear to contain job titles."""
         results: List[Tuple[Tag, str]] = []
         seen_titles: Set[str] = set()
         
         for selector in TITLE_ELEMENT_SELECTORS:
-            for elem in soup.select(selector):
-                text = extract_text_content(elem)
+            for elem in index.select(selector):
+                text = index.clean_text(elem)
                 if text and text not in seen_titles:
                     # Check if it looks like a title
                     if len(text) > 3 and len(text) < 200:
@@ -853,22 +1206,24 @@ class TableExtractor:
     This extractor handles both header-based and headerless tables.
     """
     
-    def extract(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def extract(self, soup: BeautifulSoup, url: str,
+                index: Optional[PageIndex] = None) -> List[StaffMember]:
         """Extract staff from tables."""
+        index = index or PageIndex(soup)
         staff: List[StaffMember] = []
         
-        for table in soup.find_all('table')[:MAX_TABLES_TO_PROCESS]:
+        for table in index.find_all('table')[:MAX_TABLES_TO_PROCESS]:
             # Skip navigation/layout tables
-            if self._is_layout_table(table):
+            if self._is_layout_table(table, index):
                 continue
             
             # Try to extract from this table
-            table_staff = self._extract_from_table(table, url)
+            table_staff = self._extract_from_table(table, index, url)
             staff.extend(table_staff)
         
-        return staff
+        return classify_staff(staff)
     
-    def _is_layout_table(self, table: Tag) -> bool:
+    def _is_layout_table(self, table: Tag, index: PageIndex) -> bool:
         """Check if table is likely used for layout, not data."""
         # Check for layout-related classes
         classes = ' '.join(table.get('class', []))
@@ -876,42 +1231,42 @@ class TableExtractor:
             return True
         
         # Check if it has very few rows (likely layout)
-        rows = table.find_all('tr')
+        rows = index.find_all('tr', table)
         if len(rows) < 2:
             return True
         
         return False
     
-    def _extract_from_table(self, table: Tag, url: str) -> List[StaffMember]:
+    def _extract_from_table(self, table: Tag, index: PageIndex, url: str) -> List[StaffMember]:
         """Extract staff from a single table."""
         staff: List[StaffMember] = []
         
-        rows = table.find_all('tr')
+        rows = index.find_all('tr', table)
         if not rows:
             return []
         
         # Try to detect headers
-        headers = self._detect_headers(rows[0])
+        headers = self._detect_headers(rows[0], index)
         data_rows = rows[1:] if headers else rows
         
         for row in data_rows:
-            cells = row.find_all(['td', 'th'])
+            cells = index.find_all(['td', 'th'], row)
             if not cells:
                 continue
             
-            member = self._extract_from_row(cells, headers, url)
+            member = self._extract_from_row(cells, headers, index, url)
             if member:
                 staff.append(member)
         
         return staff
     
-    def _detect_headers(self, row: Tag) -> Optional[List[str]]:
+    def _detect_headers(self, row: Tag, index: PageIndex) -> Optional[List[str]]:
         """Detect column headers from first row."""
-        cells = row.find_all(['th', 'td'])
+        cells = index.find_all(['th', 'td'], row)
         if not cells:
             return None
         
-        headers = [extract_text_content(cell).lower() for cell in cells]
+        headers = [index.clean_text(cell).lower() for cell in cells]
         
         # Check if this looks like a header row
         header_keywords = ['name', 'title', 'position', 'email', 'phone', 'role']
@@ -924,6 +1279,7 @@ class TableExtractor:
         self, 
         cells: List[Tag], 
         headers: Optional[List[str]], 
+        index: PageIndex,
         url: str
     ) -> Optional[StaffMember]:
         """Extract staff member from a table row."""
@@ -938,19 +1294,19 @@ class TableExtractor:
                     break
                 
                 header = headers[idx]
-                text = extract_text_content(cell)
+                text = index.clean_text(cell)
                 
                 if 'name' in header:
                     name = text
                 elif 'title' in header or 'position' in header or 'role' in header:
                     title = text
                 elif 'email' in header:
-                    emails = extract_emails_from_element(cell)
+                    emails = index.emails(cell)
                     email = emails[0] if emails else ""
         else:
             # No headers - try to infer from content
             for cell in cells:
-                text = extract_text_content(cell)
+                text = index.clean_text(cell)
                 
                 # Check if it's a name
                 if not name:
@@ -966,7 +1322,7 @@ class TableExtractor:
                 
                 # Check for email
                 if not email:
-                    emails = extract_emails_from_element(cell)
+                    emails = index.emails(cell)
                     if emails:
                         email = emails[0]
         
@@ -983,9 +1339,6 @@ class TableExtractor:
             source_url=url,
         )
         
-        if title:
-            member.roles = classify_role(title)
-        
         return member
 
 
@@ -1001,13 +1354,14 @@ class TextPatternExtractor:
     line by line to find name-title pairs.
     """
     
-    def extract(self, soup: BeautifulSoup, url: str) -> List[StaffMember]:
+    def extract(self, soup: BeautifulSoup, url: str,
+                index: Optional[PageIndex] = None) -> List[StaffMember]:
         """Extract staff using text patterns."""
+        index = index or PageIndex(soup)
         staff: List[StaffMember] = []
         
         # Get all text lines
-        text = soup.get_text(separator='\n')
-        lines = [l.strip() for l in text.split('\n') if l.strip()][:MAX_TEXT_LINES]
+        lines = index.lines()[:MAX_TEXT_LINES]
         
         # Find name-title pairs
         i = 0
@@ -1045,14 +1399,227 @@ class TextPatternExtractor:
                     source_url=url,
                 )
                 
-                if title:
-                    member.roles = classify_role(title)
-                
                 staff.append(member)
             
             i += 1
         
+        return classify_staff(staff)
+
+
+# ============================================================================
+# VENDOR FAST PATH (Sidearm / Presto / WMT)
+# ============================================================================
+
+@dataclass(frozen=True)
+class VendorProfile:
+    """
+    Markup signature and staff-directory layouts of an athletics CMS vendor.
+    
+    Attributes:
+        name: Vendor key ('sidearm', 'presto', 'wmt')
+        signatures: Lowercase substrings of the raw HTML that identify it
+        cards: (card, name selectors, title selectors) per card layout
+        tables: Selectors for header-driven staff directory tables
+    """
+    name: str
+    signatures: Tuple[str, ...]
+    cards: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...] = ()
+    tables: Tuple[str, ...] = ()
+
+
+VENDOR_PROFILES = [
+    VendorProfile(
+        name='sidearm',
+        signatures=('sidearm-', 'sidearmsports', 'sidearm sports'),
+        cards=(
+            ('.sidearm-roster-coach', ('.sidearm-roster-coach-name',), ('.sidearm-roster-coach-title',)),
+            ('.sidearm-staff-member', ('.sidearm-staff-member-name',), ('.sidearm-staff-member-title',)),
+            ('.s-person-card', ('.s-person-details__personal-single-line', 'h3', 'h4'),
+             ('.s-person-details__position', '.s-person-card__content-position')),
+        ),
+        tables=('table.sidearm-table', 'table.sidearm-staff-directory'),
+    ),
+    VendorProfile(
+        name='presto',
+        signatures=('prestosports', 'presto-sports'),
+        cards=(
+            ('.coach-bio', ('.name',), ('.title', '.position')),
+        ),
+        tables=('table',),
+    ),
+    VendorProfile(
+        name='wmt',
+        signatures=('wmt.games', 'wmt.digital', 'wmtdigital'),
+        cards=(
+            ('[class*="staff-card"]', ('[class*="__name"]', '[class*="name"]'),
+             ('[class*="__position"]', '[class*="__title"]', '[class*="position"]')),
+            ('[class*="roster-staff"]', ('[class*="__name"]', '[class*="name"]'),
+             ('[class*="__position"]', '[class*="__title"]', '[class*="position"]')),
+        ),
+        tables=('table',),
+    ),
+]
+
+# A vendor result with fewer members than this, or with neither an OL nor
+# an RC, falls back to the generic strategies; one naming only one of them
+# is merged with the generic strategies' candidates for the other
+MIN_VENDOR_STAFF = 3
+VENDOR_TARGET_ROLES = (CanonicalRole.OFFENSIVE_LINE_COACH, CanonicalRole.RECRUITING_COORDINATOR)
+
+VENDOR_TABLE_COLUMNS = {
+    'name': ('name',),
+    'title': ('title', 'position', 'role'),
+    'email': ('email', 'e-mail'),
+    'phone': ('phone',),
+}
+
+
+def detect_vendor(html: str) -> Optional[VendorProfile]:
+    """Vendor whose markup signatures appear most often in the page, if any."""
+    lower = html.lower()
+    best, best_hits = None, 0
+    for profile in VENDOR_PROFILES:
+        hits = sum(lower.count(signature) for signature in profile.signatures)
+        if hits > best_hits:
+            best, best_hits = profile, hits
+    return best
+
+
+class VendorLayoutExtractor:
+    """
+    Extract staff with a known vendor's own selectors.
+    
+    Sidearm, Presto and WMT staff directories render the same markup on
+    every school's site, so a detected vendor's card and table layouts are
+    read directly instead of running every generic strategy. DOMParser
+    falls back to the generic pipeline when the result looks incomplete.
+    """
+    
+    def extract(self, soup: BeautifulSoup, url: str,
+                index: Optional[PageIndex] = None,
+                vendor: Optional[VendorProfile] = None) -> List[StaffMember]:
+        """Extract staff using the vendor's layouts (detected from the soup if not given)."""
+        index = index or PageIndex(soup)
+        vendor = vendor or detect_vendor(str(soup))
+        if vendor is None:
+            return []
+        
+        # Vendor card selectors only match staff entries, so large
+        # directories aren't capped at MAX_CARDS_TO_PROCESS
+        staff: List[StaffMember] = []
+        for card_selector, name_selectors, title_selectors in vendor.cards:
+            for card in index.select(card_selector):
+                member = self._extract_from_card(card, name_selectors, title_selectors, index, url)
+                if member:
+                    staff.append(member)
+            if staff:
+                return classify_staff(staff)
+        
+        for table_selector in vendor.tables:
+            for table in index.select(table_selector)[:MAX_TABLES_TO_PROCESS]:
+                staff.extend(self._extract_from_table(table, index, url))
+            if staff:
+                return classify_staff(staff)
+        
+        return classify_staff(staff)
+    
+    def _first_text(self, card: Tag, selectors: Tuple[str, ...], index: PageIndex) -> str:
+        for selector in selectors:
+            for elem in index.select(selector, card)[:3]:
+                text = index.clean_text(elem)
+                if text:
+                    return text
+        return ""
+    
+    def _extract_from_card(
+        self,
+        card: Tag,
+        name_selectors: Tuple[str, ...],
+        title_selectors: Tuple[str, ...],
+        index: PageIndex,
+        url: str,
+    ) -> Optional[StaffMember]:
+        name = self._first_text(card, name_selectors, index)
+        is_name, confidence, _ = is_valid_name(name)
+        if not is_name or confidence < MIN_NAME_CONFIDENCE:
+            return None
+        
+        title = self._first_text(card, title_selectors, index)
+        emails = index.emails(card)
+        return self._member(name, title, sorted(emails)[0] if emails else None,
+                            index.phone(card), index.twitter(card), url)
+    
+    def _table_columns(self, table: Tag, index: PageIndex) -> Tuple[Optional[Tag], Dict[str, int]]:
+        """Header row and column positions of the name/title/email/phone columns."""
+        for row in index.find_all('tr', table)[:3]:
+            cells = index.find_all(['th', 'td'], row)
+            headers = [index.clean_text(cell).lower() for cell in cells]
+            columns = {}
+            for column, keywords in VENDOR_TABLE_COLUMNS.items():
+                for i, header in enumerate(headers):
+                    if any(kw in header for kw in keywords):
+                        columns.setdefault(column, i)
+            if 'name' in columns and 'title' in columns:
+                return row, columns
+        return None, {}
+    
+    def _extract_from_table(self, table: Tag, index: PageIndex, url: str) -> List[StaffMember]:
+        header_row, columns = self._table_columns(table, index)
+        if header_row is None:
+            return []
+        
+        staff = []
+        width = max(columns.values()) + 1
+        header_pos = index.position(header_row)
+        for row in index.find_all('tr', table):
+            # Skip the header and category rows (a single colspan cell)
+            if index.position(row) <= header_pos:
+                continue
+            cells = index.find_all(['th', 'td'], row)
+            if len(cells) < width:
+                continue
+            
+            name = index.clean_text(cells[columns['name']])
+            is_name, confidence, _ = is_valid_name(name)
+            if not is_name or confidence < MIN_NAME_CONFIDENCE:
+                continue
+            
+            title = index.clean_text(cells[columns['title']])
+            email_cell = cells[columns['email']] if 'email' in columns else row
+            emails = index.emails(email_cell)
+            phone = index.phone(cells[columns['phone']]) if 'phone' in columns else None
+            staff.append(self._member(name, title, sorted(emails)[0] if emails else None,
+                                      phone, index.twitter(row), url))
         return staff
+    
+    def _member(self, name: str, title: str, email: Optional[str], phone: Optional[str],
+                twitter: Optional[str], url: str) -> StaffMember:
+        member = StaffMember(
+            name=normalize_name(name),
+            raw_title=title,
+            normalized_title=normalize_title(title),
+            contact=ContactInfo(email=email, phone=phone, twitter=twitter),
+            extraction_method=ExtractionStrategy.VENDOR_LAYOUT,
+            extraction_confidence=90,
+            source_url=url,
+        )
+        return member
+
+
+def vendor_missing_roles(staff: List[StaffMember]) -> List[CanonicalRole]:
+    """OL coach / RC roles no member of a vendor result holds."""
+    return [role for role in VENDOR_TARGET_ROLES
+            if not any(m.get_role_confidence(role) > 0 for m in staff)]
+
+
+def vendor_staff_usable(staff: List[StaffMember]) -> bool:
+    """Whether a vendor fast-path result can stand in for the generic pipeline."""
+    return len(staff) >= MIN_VENDOR_STAFF and not vendor_missing_roles(staff)
+
+
+def vendor_staff_partial(staff: List[StaffMember]) -> bool:
+    """Whether a vendor result names one target role but not the other."""
+    return len(staff) >= MIN_VENDOR_STAFF and len(vendor_missing_roles(staff)) == 1
 
 
 # ============================================================================
@@ -1073,13 +1640,32 @@ class DOMParser:
         print(f"RC: {result.rc.name if result.rc else 'Not found'}")
     """
     
-    def __init__(self):
-        """Initialize the DOM parser with all extraction strategies."""
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        cache: Union[ExtractionCache, bool, None] = None,
+    ):
+        """
+        Initialize the DOM parser with all extraction strategies.
+        
+        Args:
+            backend: HTML parser backend (see extraction.parser_backend);
+                defaults to HTML_PARSER_BACKEND
+            cache: ExtractionCache to use, False to disable caching, or
+                None for the shared on-disk cache (EXTRACTION_CACHE)
+        """
+        self.backend = backend
+        if cache is None:
+            cache = get_extraction_cache(EXTRACTOR_VERSION)
+        self.cache: Optional[ExtractionCache] = cache or None
+        self.stats = {'pages': 0, 'cache_hits': 0, 'cache_misses': 0, 'parse_ms': 0, 'time_saved_ms': 0,
+                      'vendor_fast_path': 0, 'vendor_merged': 0, 'vendor_fallbacks': 0}
         self.structured_extractor = StructuredDataExtractor()
         self.card_extractor = StaffCardExtractor()
         self.proximity_extractor = DOMProximityExtractor()
         self.table_extractor = TableExtractor()
         self.text_extractor = TextPatternExtractor()
+        self.vendor_extractor = VendorLayoutExtractor()
     
     def parse(
         self, 
@@ -1098,94 +1684,55 @@ class DOMParser:
         Returns:
             ExtractionResult with all extracted data
         """
+        html_hash = compute_html_hash(html)
+        cached = self._cached_result(html_hash, url, school_name)
+        if cached is not None:
+            return cached
+        
+        result = self._parse_uncached(html, html_hash, url, school_name)
+        self._record(result)
+        return result
+    
+    def _parse_uncached(self, html: str, html_hash: str, url: str, school_name: str) -> ExtractionResult:
+        """Run every extraction strategy over the page."""
         start_time = datetime.now()
         result = ExtractionResult(url=url, school_name=school_name)
-        result.html_hash = compute_html_hash(html)
+        result.html_hash = html_hash
         
         try:
             # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html, self.backend)
             soup = clean_soup(soup)
             
-            # Track all extracted staff and which strategies worked
-            all_staff: List[StaffMember] = []
-            
-            # Strategy 1: Structured Data (most reliable)
-            try:
-                structured_staff = self.structured_extractor.extract(soup, url)
-                if structured_staff:
-                    all_staff.extend(structured_staff)
-                    result.strategies_used.append((ExtractionStrategy.STRUCTURED_DATA, len(structured_staff)))
-            except Exception as e:
-                result.strategies_failed.append((ExtractionStrategy.STRUCTURED_DATA, str(e)))
-            
-            # Strategy 2: Staff Cards
-            try:
-                card_staff = self.card_extractor.extract(soup, url)
-                if card_staff:
-                    all_staff.extend(card_staff)
-                    result.strategies_used.append((ExtractionStrategy.STAFF_CARDS, len(card_staff)))
-            except Exception as e:
-                result.strategies_failed.append((ExtractionStrategy.STAFF_CARDS, str(e)))
+            # One traversal shared by every strategy
+            index = PageIndex(soup)
             
-            # Strategy 3: DOM Proximity (if cards didn't find much)
-            if len(all_staff) < 5:
-                try:
-                    proximity_staff = self.proximity_extractor.extract(soup, url)
-                    if proximity_staff:
-                        all_staff.extend(proximity_staff)
-                        result.strategies_used.append((ExtractionStrategy.DOM_PROXIMITY, len(proximity_staff)))
-                except Exception as e:
-                    result.strategies_failed.append((ExtractionStrategy.DOM_PROXIMITY, str(e)))
-            
-            # Strategy 4: Tables
-            try:
-                table_staff = self.table_extractor.extract(soup, url)
-                if table_staff:
-                    all_staff.extend(table_staff)
-                    result.strategies_used.append((ExtractionStrategy.TABLE_PARSING, len(table_staff)))
-            except Exception as e:
-                result.strategies_failed.append((ExtractionStrategy.TABLE_PARSING, str(e)))
-            
-            # Strategy 5: Text Patterns (fallback)
-            if len(all_staff) < 3:
-                try:
-                    text_staff = self.text_extractor.extract(soup, url)
-                    if text_staff:
-                        all_staff.extend(text_staff)
-                        result.strategies_used.append((ExtractionStrategy.TEXT_PATTERN, len(text_staff)))
-                except Exception as e:
-                    result.strategies_failed.append((ExtractionStrategy.TEXT_PATTERN, str(e)))
+            # Vendor fast path: known Sidearm/Presto/WMT layouts skip the
+            # generic strategies when they name both an OL coach and an RC
+            all_staff = self._extract_vendor_staff(html, soup, url, index, result)
+            if not all_staff:
+                all_staff = self._extract_generic_staff(soup, url, index, result)
+            elif not vendor_staff_usable(all_staff):
+                all_staff = self._merge_missing_roles(
+                    all_staff, self._extract_generic_staff(soup, url, index, result))
             
             # Deduplicate staff by name
             result.staff = self._deduplicate_staff(all_staff)
             
-            # Collect all raw titles for debugging
+            # Collect raw titles and pick the best OL coach and RC in one
+            # pass; ties keep the earliest member, as the old sort did
+            best_ol = best_rc = 0
             for member in result.staff:
                 if member.raw_title:
                     result.raw_titles_found.append(member.raw_title)
-            
-            # Find best OL coach
-            ol_candidates = [
-                (m, m.get_role_confidence(CanonicalRole.OFFENSIVE_LINE_COACH))
-                for m in result.staff
-                if m.get_role_confidence(CanonicalRole.OFFENSIVE_LINE_COACH) > 0
-            ]
-            if ol_candidates:
-                ol_candidates.sort(key=lambda x: x[1], reverse=True)
-                result.ol_coach = ol_candidates[0][0]
-                result.ol_confidence = ol_candidates[0][1]
-            
-            # Find best RC
-            rc_candidates = [
-                (m, m.get_role_confidence(CanonicalRole.RECRUITING_COORDINATOR))
-                for m in result.staff
-                if m.get_role_confidence(CanonicalRole.RECRUITING_COORDINATOR) > 0
-            ]
-            if rc_candidates:
-                rc_candidates.sort(key=lambda x: x[1], reverse=True)
-                result.rc = rc_candidates[0][0]
-                result.rc_confidence = rc_candidates[0][1]
+                ol_confidence = member.get_role_confidence(CanonicalRole.OFFENSIVE_LINE_COACH)
+                if ol_confidence > best_ol:
+                    result.ol_coach, best_ol = member, ol_confidence
+                rc_confidence = member.get_role_confidence(CanonicalRole.RECRUITING_COORDINATOR)
+                if rc_confidence > best_rc:
+                    result.rc, best_rc = member, rc_confidence
+            result.ol_confidence = best_ol
+            result.rc_confidence = best_rc
             
             # Determine review status
             result.determine_review_status()
@@ -1200,6 +1747,239 @@ class DOMParser:
         
         return result
     
+    def _extract_vendor_staff(
+        self,
+        html: str,
+        soup: BeautifulSoup,
+        url: str,
+        index: PageIndex,
+        result: ExtractionResult,
+    ) -> List[StaffMember]:
+        """
+        Staff from a detected vendor layout, or [] to run the generic strategies.
+        
+        A result naming only one of OL coach / RC is returned as well; the
+        caller fills in the other role from the generic strategies.
+        """
+        vendor = detect_vendor(html)
+        if vendor is None:
+            return []
+        result.vendor = vendor.name
+        
+        try:
+            staff = self.vendor_extractor.extract(soup, url, index, vendor)
+        except Exception as e:
+            result.strategies_failed.append((ExtractionStrategy.VENDOR_LAYOUT, str(e)))
+            staff = []
+        
+        if vendor_staff_usable(staff):
+            self.stats['vendor_fast_path'] += 1
+        elif vendor_staff_partial(staff):
+            self.stats['vendor_merged'] += 1
+        else:
+            self.stats['vendor_fallbacks'] += 1
+            return []
+        result.strategies_used.append((ExtractionStrategy.VENDOR_LAYOUT, len(staff)))
+        return staff
+    
+    def _merge_missing_roles(
+        self,
+        vendor_staff: List[StaffMember],
+        generic_staff: List[StaffMember],
+    ) -> List[StaffMember]:
+        """
+        Vendor staff plus the generic candidates for the roles it lacks.
+        
+        A vendor member sharing a name with such a candidate is dropped so
+        deduplication can't prefer the higher-confidence vendor copy that
+        missed the role.
+        """
+        missing = vendor_missing_roles(vendor_staff)
+        extra = [m for m in generic_staff if any(m.get_role_confidence(role) > 0 for role in missing)]
+        names = {m.name.lower().strip() for m in extra}
+        return [m for m in vendor_staff if m.name.lower().strip() not in names] + extra
+    
+    def _extract_generic_staff(
+        self,
+        soup: BeautifulSoup,
+        url: str,
+        index: PageIndex,
+        result: ExtractionResult,
+    ) -> List[StaffMember]:
+        """Run the five generic strategies, recording which ones worked."""
+        # Track all extracted staff and which strategies worked
+        all_staff: List[StaffMember] = []
+        
+        # Strategy 1: Structured Data (most reliable)
+        try:
+            structured_staff = self.structured_extractor.extract(soup, url, index)
+            if structured_staff:
+                all_staff.extend(structured_staff)
+                result.strategies_used.append((ExtractionStrategy.STRUCTURED_DATA, len(structured_staff)))
+        except Exception as e:
+            result.strategies_failed.append((ExtractionStrategy.STRUCTURED_DATA, str(e)))
+        
+        # Strategy 2: Staff Cards
+        try:
+            card_staff = self.card_extractor.extract(soup, url, index)
+            if card_staff:
+                all_staff.extend(card_staff)
+                result.strategies_used.append((ExtractionStrategy.STAFF_CARDS, len(card_staff)))
+        except Exception as e:
+            result.strategies_failed.append((ExtractionStrategy.STAFF_CARDS, str(e)))
+        
+        # Strategy 3: DOM Proximity (if cards didn't find much)
+        if len(all_staff) < 5:
+            try:
+                proximity_staff = self.proximity_extractor.extract(soup, url, index)
+                if proximity_staff:
+                    all_staff.extend(proximity_staff)
+                    result.strategies_used.append((ExtractionStrategy.DOM_PROXIMITY, len(proximity_staff)))
+            except Exception as e:
+                result.strategies_failed.append((ExtractionStrategy.DOM_PROXIMITY, str(e)))
+        
+        # Strategy 4: Tables
+        try:
+            table_staff = self.table_extractor.extract(soup, url, index)
+            if table_staff:
+                all_staff.extend(table_staff)
+                result.strategies_used.append((ExtractionStrategy.TABLE_PARSING, len(table_staff)))
+        except Exception as e:
+            result.strategies_failed.append((ExtractionStrategy.TABLE_PARSING, str(e)))
+        
+        # Strategy 5: Text Patterns (fallback)
+        if len(all_staff) < 3:
+            try:
+                text_staff = self.text_extractor.extract(soup, url, index)
+                if text_staff:
+                    all_staff.extend(text_staff)
+                    result.strategies_used.append((ExtractionStrategy.TEXT_PATTERN, len(text_staff)))
+            except Exception as e:
+                result.strategies_failed.append((ExtractionStrategy.TEXT_PATTERN, str(e)))
+        
+        return all_staff
+    
+    def _cached_result(self, html_hash: str, url: str, school_name: str) -> Optional[ExtractionResult]:
+        """Stored result for identical HTML, re-labelled for this url/school."""
+        if self.cache is None:
+            return None
+        start_time = datetime.now()
+        result = self.cache.get(html_hash, resolve_backend(self.backend))
+        if result is None:
+            self.stats['cache_misses'] += 1
+            return None
+        
+        result.url = url
+        result.school_name = school_name
+        for member in result.staff:
+            member.source_url = url
+        
+        self.stats['pages'] += 1
+        self.stats['cache_hits'] += 1
+        self.stats['time_saved_ms'] += result.processing_time_ms
+        result.processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        return result
+    
+    def _record(self, result: ExtractionResult) -> None:
+        """Count a freshly parsed page and cache it if it parsed cleanly."""
+        self.stats['pages'] += 1
+        self.stats['parse_ms'] += result.processing_time_ms
+        if self.cache is not None and not result.errors:
+            try:
+                self.cache.put(result, resolve_backend(self.backend))
+            except Exception as e:
+                logger.warning(f"Extraction cache write failed: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Pages parsed, cache hit ratio and parse time saved by the cache."""
+        lookups = self.stats['cache_hits'] + self.stats['cache_misses']
+        return {
+            **self.stats,
+            'cache_hit_ratio': round(self.stats['cache_hits'] / lookups, 3) if lookups else 0.0,
+            'cache': self.cache.metrics() if self.cache is not None else None,
+        }
+    
+    def parse_many(
+        self,
+        pages: Iterable[Tuple[str, ...]],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        timeout: Optional[float] = DEFAULT_PAGE_TIMEOUT,
+    ) -> List[ExtractionResult]:
+        """
+        Parse many pages across a process pool.
+        
+        Parsing is pure CPU, so threads serialize on the GIL; worker
+        processes each get their own DOMParser and return plain
+        ExtractionResult dataclasses (no soup), which pickle cheaply.
+        Pages already in the extraction cache never reach a worker.
+        
+        Args:
+            pages: (html, url) or (html, url, school_name) tuples
+            workers: Worker processes (default: CPU count); 1 parses in-process
+            chunk_size: Pages per worker task (default: spread each worker
+                over ~4 tasks, at most MAX_CHUNK_SIZE)
+            timeout: Seconds a single page may take before it is abandoned
+                with a "Parse timeout" error; None disables it
+            
+        Returns:
+            One ExtractionResult per page, in input order
+        """
+        pages = [_page_tuple(page) for page in pages]
+        results: List[Optional[ExtractionResult]] = [None] * len(pages)
+        
+        # Cache hits are answered here; only misses go to the workers
+        pending = []
+        for i, (html, url, school_name) in enumerate(pages):
+            results[i] = self._cached_result(compute_html_hash(html), url, school_name)
+            if results[i] is None:
+                pending.append(i)
+        
+        parsed = self._parse_pool([pages[i] for i in pending], workers, chunk_size, timeout)
+        for i, result in zip(pending, parsed):
+            self._record(result)
+            results[i] = result
+        
+        return results
+    
+    def _parse_pool(
+        self,
+        pages: List[Tuple[str, str, str]],
+        workers: Optional[int],
+        chunk_size: Optional[int],
+        timeout: Optional[float],
+    ) -> List[ExtractionResult]:
+        """Parse pages across worker processes, in input order."""
+        if not pages:
+            return []
+        
+        workers = min(workers or os.cpu_count() or 1, len(pages))
+        if workers <= 1:
+            return _parse_chunk(self.backend, pages, timeout)
+        
+        if not chunk_size:
+            chunk_size = min(MAX_CHUNK_SIZE, -(-len(pages) // (workers * 4)))
+        
+        results: List[Optional[ExtractionResult]] = [None] * len(pages)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (start, executor.submit(_parse_chunk, self.backend, pages[start:start + chunk_size], timeout))
+                for start in range(0, len(pages), chunk_size)
+            ]
+            for start, future in futures:
+                chunk = pages[start:start + chunk_size]
+                try:
+                    results[start:start + len(chunk)] = future.result()
+                except Exception as e:
+                    # A crashed worker fails its chunk, not the whole batch
+                    logger.error(f"parse_many worker failed: {e}")
+                    results[start:start + len(chunk)] = [
+                        _error_result(html, url, school_name, f"Worker error: {e}")
+                        for html, url, school_name in chunk
+                    ]
+        
+        return results
+    
     def _deduplicate_staff(self, staff: List[StaffMember]) -> List[StaffMember]:
         """
         Deduplicate staff members by name.
@@ -1249,6 +2029,7 @@ class DOMParser:
         
         # Prefer more specific extraction method
         method_priority = {
+            ExtractionStrategy.VENDOR_LAYOUT: 6,
             ExtractionStrategy.STRUCTURED_DATA: 5,
             ExtractionStrategy.STAFF_CARDS: 4,
             ExtractionStrategy.TABLE_PARSING: 3,
@@ -1263,12 +2044,89 @@ class DOMParser:
         return new_priority > existing_priority
 
 
+# ============================================================================
+# BATCH PARSING (process pool workers)
+# ============================================================================
+
+class ParseTimeout(BaseException):
+    """
+    Raised by the worker alarm when a page exceeds its time budget.
+    
+    Derives from BaseException so the per-strategy `except Exception`
+    handlers in DOMParser.parse can't swallow it.
+    """
+
+
+def _raise_parse_timeout(signum, frame):
+    raise ParseTimeout()
+
+
+def _page_tuple(page: Tuple[str, ...]) -> Tuple[str, str, str]:
+    """Normalize a parse_many() page to (html, url, school_name)."""
+    html, url = page[0], page[1]
+    school_name = page[2] if len(page) > 2 else ""
+    return html, url or "", school_name or ""
+
+
+def _error_result(html: str, url: str, school_name: str, error: str) -> ExtractionResult:
+    """ExtractionResult for a page the batch couldn't parse."""
+    result = ExtractionResult(url=url, school_name=school_name)
+    result.html_hash = compute_html_hash(html)
+    result.errors.append(error)
+    result.determine_review_status()
+    return result
+
+
+# One DOMParser per worker process and backend
+_worker_parsers: Dict[Optional[str], DOMParser] = {}
+
+
+def _parse_chunk(
+    backend: Optional[str],
+    chunk: List[Tuple[str, str, str]],
+    timeout: Optional[float],
+) -> List[ExtractionResult]:
+    """Parse a chunk of pages in a worker, abandoning any page over `timeout`."""
+    parser = _worker_parsers.get(backend)
+    if parser is None:
+        # The calling DOMParser handles caching, so workers don't open the cache
+        parser = _worker_parsers[backend] = DOMParser(backend, cache=False)
+    
+    # SIGALRM only exists on POSIX and can only be handled on the main thread
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer') \
+        and threading.current_thread() is threading.main_thread()
+    previous_handler = signal.signal(signal.SIGALRM, _raise_parse_timeout) if use_alarm else None
+    
+    results = []
+    try:
+        for html, url, school_name in chunk:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                result = parser.parse(html, url, school_name)
+            except ParseTimeout:
+                logger.warning(f"DOM parse timed out after {timeout}s for {url}")
+                result = _error_result(html, url, school_name, f"Parse timeout after {timeout}s")
+            finally:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+            results.append(result)
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous_handler)
+    
+    return results
+
+
 # ============================================================================
 # MODULE EXPORTS
 # ============================================================================
 
 __all__ = [
     'DOMParser',
+    'EXTRACTOR_VERSION',
+    'PageIndex',
+    'ParseTimeout',
     'ExtractionResult',
     'StaffMember',
     'StructuredDataExtractor',
@@ -1276,6 +2134,10 @@ __all__ = [
     'DOMProximityExtractor',
     'TableExtractor',
     'TextPatternExtractor',
+    'VendorLayoutExtractor',
+    'VendorProfile',
+    'VENDOR_PROFILES',
+    'detect_vendor',
 ]
 
 
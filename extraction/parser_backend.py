@@ -0,0 +1,152 @@
+"""
+extraction/parser_backend.py - Pluggable HTML Parser Backends
+============================================================================
+Every extractor works on a BeautifulSoup tree, and building that tree with
+Python's pure-Python html.parser is the slowest step on large athletics
+pages. This module swaps the tokenizer while keeping the bs4 Tag API the
+extractors (and PageIndex) rely on.
+
+Backends:
+- html.parser: Python stdlib, always available
+- lxml: libxml2 via bs4's own lxml tree builder
+- selectolax: lexbor (selectolax) parses the page and SelectolaxTreeBuilder
+  replays its node tree into BeautifulSoup, so callers still get Tags
+
+Pick one with HTML_PARSER_BACKEND (default: lxml when installed, else
+html.parser). An unavailable backend falls back to html.parser with a
+warning. Backends build slightly different trees from malformed markup
+(implied <html>/<body>, unclosed tags); scripts/benchmark_extraction.py
+--backend compares throughput and results.
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import logging
+from typing import Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup, Comment
+from bs4.builder import HTMLTreeBuilder, HTML, FAST, PERMISSIVE
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401  (bs4 imports it itself)
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+
+HTML_PARSER = 'html.parser'
+LXML = 'lxml'
+SELECTOLAX = 'selectolax'
+
+PARSER_BACKENDS = [HTML_PARSER, LXML, SELECTOLAX]
+
+
+# ============================================================================
+# SELECTOLAX TREE BUILDER
+# ============================================================================
+
+class SelectolaxTreeBuilder(HTMLTreeBuilder):
+    """
+    bs4 tree builder backed by selectolax's lexbor parser.
+
+    lexbor builds the DOM in C; feed() then walks it once and issues the
+    same handle_starttag/handle_data/handle_endtag calls bs4's lxml builder
+    makes, so the result is an ordinary BeautifulSoup object.
+    """
+
+    NAME = SELECTOLAX
+    ALTERNATE_NAMES = ['lexbor']
+    features = [NAME, 'lexbor', HTML, FAST, PERMISSIVE]
+
+    def feed(self, markup: Union[str, bytes]) -> None:
+        soup = self.soup
+        root = LexborHTMLParser(markup).root
+        if root is None:
+            return
+
+        # Explicit stack: (node, None) opens a node, (None, name) closes a tag
+        stack = [(root, None)]
+        while stack:
+            node, closing = stack.pop()
+            if closing is not None:
+                soup.endData()
+                soup.handle_endtag(closing)
+                continue
+
+            tag = node.tag
+            if tag == '-text':
+                soup.handle_data(node.text_content or '')
+            elif tag == '-comment':
+                soup.endData()
+                soup.handle_data(node.comment_content or '')
+                soup.endData(Comment)
+            elif tag and tag[0] not in '-_#!':
+                attrs = {k: (v if v is not None else '') for k, v in node.attributes.items()}
+                soup.handle_starttag(tag, None, None, attrs)
+                stack.append((None, tag))
+                children = []
+                child = node.child
+                while child is not None:
+                    children.append(child)
+                    child = child.next
+                stack.extend((c, None) for c in reversed(children))
+
+    def test_fragment_to_document(self, fragment: str) -> str:
+        return f"<html><body>{fragment}</body></html>"
+
+
+# ============================================================================
+# BACKEND SELECTION
+# ============================================================================
+
+def available_backends() -> List[str]:
+    """Backends usable in this environment."""
+    backends = [HTML_PARSER]
+    if HAS_LXML:
+        backends.append(LXML)
+    if LexborHTMLParser is not None:
+        backends.append(SELECTOLAX)
+    return backends
+
+
+_warned: Dict[str, bool] = {}
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """Backend to use for `name` (or HTML_PARSER_BACKEND / the default)."""
+    name = (name or os.environ.get('HTML_PARSER_BACKEND') or '').strip().lower()
+    if not name:
+        return LXML if HAS_LXML else HTML_PARSER
+    if name in available_backends():
+        return name
+    if not _warned.get(name):
+        _warned[name] = True
+        logger.warning(f"HTML parser backend '{name}' unavailable, using {HTML_PARSER}")
+    return HTML_PARSER
+
+
+def make_soup(markup: Union[str, bytes], backend: Optional[str] = None) -> BeautifulSoup:
+    """Parse markup into a BeautifulSoup tree with the configured backend."""
+    backend = resolve_backend(backend)
+    if backend == SELECTOLAX:
+        return BeautifulSoup(markup, builder=SelectolaxTreeBuilder())
+    return BeautifulSoup(markup, backend)
+
+
+__all__ = [
+    'PARSER_BACKENDS',
+    'SelectolaxTreeBuilder',
+    'available_backends',
+    'resolve_backend',
+    'make_soup',
+]
@@ -0,0 +1,234 @@
+"""
+extraction/result_cache.py - Content-Addressed Extraction Cache
+============================================================================
+On-disk cache of ExtractionResults keyed by compute_html_hash(html), the
+HTML parser backend and the extractor version.
+
+Re-scraping an unchanged staff page used to re-run every extraction
+strategy and the role classifier; with the cache, DOMParser.parse returns
+the stored result instead.
+
+- Storage: one SQLite file (WAL) shared by threads and processes
+- Eviction: least recently used entries once the cache exceeds its size
+  or entry limit
+- Invalidation: opening the cache with a new EXTRACTOR_VERSION drops every
+  entry written by other versions
+
+Config (env):
+- EXTRACTION_CACHE: 'false' disables the shared cache (default: enabled)
+- EXTRACTION_CACHE_PATH: database file (default ~/.coach_outreach/extraction_cache.db)
+- EXTRACTION_CACHE_MAX_MB: size bound (default 256)
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import time
+import zlib
+import pickle
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.types import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = Path.home() / '.coach_outreach' / 'extraction_cache.db'
+DEFAULT_MAX_BYTES = int(os.environ.get('EXTRACTION_CACHE_MAX_MB', '256')) * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 50000
+
+# Eviction trims to this fraction of the bounds so it doesn't run on every put
+EVICTION_TARGET = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    html_hash TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    version TEXT NOT NULL,
+    result BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    parse_ms INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (html_hash, backend, version)
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_used ON extraction_cache(last_used);
+"""
+
+
+class ExtractionCache:
+    """
+    LRU, size-bounded SQLite store of ExtractionResults.
+
+    Usage:
+        cache = ExtractionCache(version=EXTRACTOR_VERSION)
+        result = cache.get(html_hash, 'lxml')
+        if result is None:
+            result = ...
+            cache.put(result, 'lxml')
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        version: str = '',
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path or os.environ.get('EXTRACTION_CACHE_PATH') or DEFAULT_CACHE_PATH).expanduser()
+        self.version = version
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'invalidated': 0}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+        # A version bump invalidates everything extracted by older code
+        cur = self._conn.execute('DELETE FROM extraction_cache WHERE version != ?', (version,))
+        self.stats['invalidated'] = cur.rowcount
+        if cur.rowcount:
+            logger.info(f"Extraction cache: dropped {cur.rowcount} entries from other extractor versions")
+        self._size, self._count = self._conn.execute(
+            'SELECT COALESCE(SUM(size), 0), COUNT(*) FROM extraction_cache').fetchone()
+
+    def get(self, html_hash: str, backend: str) -> Optional[ExtractionResult]:
+        """Stored result for this page content, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT result FROM extraction_cache WHERE html_hash = ? AND backend = ? AND version = ?',
+                (html_hash, backend, self.version),
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            self._conn.execute(
+                'UPDATE extraction_cache SET last_used = ? WHERE html_hash = ? AND backend = ? AND version = ?',
+                (time.time(), html_hash, backend, self.version),
+            )
+        try:
+            result = pickle.loads(zlib.decompress(row[0]))
+        except Exception as e:
+            logger.warning(f"Extraction cache: unreadable entry {html_hash}: {e}")
+            self.delete(html_hash, backend)
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return result
+
+    def put(self, result: ExtractionResult, backend: str) -> None:
+        """Store a result under its html_hash, evicting LRU entries if over the bounds."""
+        if not result.html_hash:
+            return
+        blob = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                'SELECT size FROM extraction_cache WHERE html_hash = ? AND backend = ? AND version = ?',
+                (result.html_hash, backend, self.version),
+            ).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO extraction_cache '
+                '(html_hash, backend, version, result, size, parse_ms, created_at, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (result.html_hash, backend, self.version, blob, len(blob),
+                 result.processing_time_ms, now, now),
+            )
+            if old:
+                self._size -= old[0]
+            else:
+                self._count += 1
+            self._size += len(blob)
+            self.stats['stores'] += 1
+            if self._size > self.max_bytes or self._count > self.max_entries:
+                self._evict()
+
+    def delete(self, html_hash: str, backend: str) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT size FROM extraction_cache WHERE html_hash = ? AND backend = ? AND version = ?',
+                (html_hash, backend, self.version),
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    'DELETE FROM extraction_cache WHERE html_hash = ? AND backend = ? AND version = ?',
+                    (html_hash, backend, self.version),
+                )
+                self._size -= row[0]
+                self._count -= 1
+
+    def _evict(self) -> None:
+        """Drop least recently used entries down to EVICTION_TARGET of the bounds (lock held)."""
+        max_bytes = self.max_bytes * EVICTION_TARGET
+        max_entries = self.max_entries * EVICTION_TARGET
+        victims = []
+        size, count = self._size, self._count
+        for key_hash, key_backend, key_version, entry_size in self._conn.execute(
+            'SELECT html_hash, backend, version, size FROM extraction_cache ORDER BY last_used'
+        ):
+            if size <= max_bytes and count <= max_entries:
+                break
+            victims.append((key_hash, key_backend, key_version))
+            size -= entry_size
+            count -= 1
+        self._conn.executemany(
+            'DELETE FROM extraction_cache WHERE html_hash = ? AND backend = ? AND version = ?', victims)
+        self._size, self._count = size, count
+        self.stats['evictions'] += len(victims)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM extraction_cache')
+            self._size = self._count = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_ratio': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+            'entries': self._count,
+            'bytes': self._size,
+            'max_bytes': self.max_bytes,
+            'max_entries': self.max_entries,
+            'version': self.version,
+            'path': str(self.path),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Dict[str, Optional[ExtractionCache]] = {}
+_shared_lock = threading.Lock()
+
+
+def get_extraction_cache(version: str) -> Optional[ExtractionCache]:
+    """Process-wide cache for this extractor version, or None when disabled/unavailable."""
+    if os.environ.get('EXTRACTION_CACHE', 'true').lower() in ('false', '0', 'no', 'off'):
+        return None
+    with _shared_lock:
+        if version not in _shared:
+            try:
+                _shared[version] = ExtractionCache(version=version)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Extraction cache unavailable: {e}")
+                _shared[version] = None
+        return _shared[version]
+
+
+__all__ = [
+    'ExtractionCache',
+    'get_extraction_cache',
+]
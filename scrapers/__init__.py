@@ -5,6 +5,10 @@ Enterprise-grade scrapers for extracting coach information.
 
 Modules:
 - unified_scraper: Combined name + email extraction from staff pages
+- auto_scrape: Quick OL/RC card heuristic used by auto_scrape_school
+- recrawl: Scheduled refresh of stale staff pages and changed coaches
+- bulk_scrape: Concurrent auto-scrape of pending school requests
+- discovery_cache: Per-school staff URL cache with conditional revalidation
 
 Author: Coach Outreach System
 Version: 4.0.0
@@ -0,0 +1,136 @@
+"""
+scrapers/auto_scrape.py - Quick OL/RC Pick From a Staff Page
+============================================================================
+The card heuristic auto_scrape_school (app.py) runs on a freshly fetched
+staff page: find staff/coach cards, match OL and recruiting-coordinator
+keywords in their text, and take the first name-like heading and email in
+the matching card.
+
+Sidearm, Presto and WMT pages are read with the vendor's own selectors
+first (extraction.dom_parser.VendorLayoutExtractor); the card heuristic
+runs when no vendor is detected or the vendor layout lacks the OL coach or
+RC, and then only fills in the role the vendor layout missed.
+
+Kept separate from the fetch/search code so it can be benchmarked offline
+(scripts/benchmark_golden.py).
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from core.types import CanonicalRole
+from extraction.dom_parser import PageIndex, VendorLayoutExtractor, detect_vendor, vendor_staff_partial, vendor_staff_usable
+from extraction.parser_backend import make_soup
+
+EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}', re.IGNORECASE)
+TWITTER_RE = re.compile(r'(?:twitter\.com|x\.com)/([A-Za-z0-9_]+)', re.IGNORECASE)
+
+OL_PATTERNS = ['offensive line', 'o-line', 'oline', 'ol coach', 'offensive line coach']
+RC_PATTERNS = ['recruiting coordinator', 'director of recruiting', 'recruiting director', 'director of player personnel']
+
+CARD_CLASS_KEYWORDS = ['staff', 'coach', 'card', 'person', 'bio', 'member']
+NAME_TAGS = ['h2', 'h3', 'h4', 'h5', 'a', 'strong', 'b', 'span']
+
+
+def _vendor_targets(html: str, soup) -> Optional[Dict[str, Any]]:
+    """OL/RC from a detected vendor layout (one may be None), or None to use the card heuristic."""
+    vendor = detect_vendor(html)
+    if vendor is None:
+        return None
+    staff = VendorLayoutExtractor().extract(soup, '', PageIndex(soup), vendor)
+    if not (vendor_staff_usable(staff) or vendor_staff_partial(staff)):
+        return None
+
+    def best(role):
+        scored = [(m.get_role_confidence(role), m) for m in staff]
+        confidence, member = max(scored, key=lambda x: x[0])
+        if confidence <= 0:
+            return None
+        return {'name': member.name, 'email': member.contact.email, 'twitter': member.contact.twitter}
+
+    return {
+        'ol_coach': best(CanonicalRole.OFFENSIVE_LINE_COACH),
+        'rc': best(CanonicalRole.RECRUITING_COORDINATOR),
+        'all_emails_found': list(set(EMAIL_RE.findall(html))),
+    }
+
+
+def extract_staff_targets(html: str, backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Pick the OL coach and recruiting coordinator out of a staff page.
+
+    Returns dict with:
+        - ol_coach: {name, email, twitter} or None
+        - rc: {name, email, twitter} or None
+        - all_emails_found: every email address in the page
+    """
+    soup = make_soup(html, backend)
+
+    targets = _vendor_targets(html, soup)
+    if targets is not None and targets['ol_coach'] and targets['rc']:
+        return targets
+
+    ol_coach = ol_email = ol_twitter = None
+    rc_coach = rc_email = rc_twitter = None
+
+    # Find staff cards/sections
+    staff_cards = soup.find_all(['div', 'article', 'li', 'section'], class_=lambda x: x and any(
+        k in str(x).lower() for k in CARD_CLASS_KEYWORDS
+    ))
+
+    # Also check all divs/sections for coach info
+    if not staff_cards:
+        staff_cards = soup.find_all(['div', 'article', 'li'])
+
+    for card in staff_cards:
+        card_text = card.get_text(' ', strip=True).lower()
+        card_html = str(card)
+
+        # Check for OL coach
+        if any(p in card_text for p in OL_PATTERNS) and not ol_coach:
+            name_tag = card.find(NAME_TAGS)
+            if name_tag:
+                name = name_tag.get_text(strip=True)
+                # Validate it looks like a name
+                if 2 < len(name) < 50 and '@' not in name and not any(x in name.lower() for x in ['coach', 'offensive', 'line', 'staff']):
+                    ol_coach = name
+            # Find email
+            card_emails = EMAIL_RE.findall(card_html)
+            if card_emails:
+                ol_email = card_emails[0]
+            # Find Twitter
+            twitter_match = TWITTER_RE.search(card_html)
+            if twitter_match:
+                ol_twitter = f'https://x.com/{twitter_match.group(1)}'
+
+        # Check for RC
+        if any(p in card_text for p in RC_PATTERNS) and not rc_coach:
+            name_tag = card.find(NAME_TAGS)
+            if name_tag:
+                name = name_tag.get_text(strip=True)
+                if 2 < len(name) < 50 and '@' not in name and not any(x in name.lower() for x in ['coordinator', 'recruiting', 'director', 'staff']):
+                    rc_coach = name
+            card_emails = EMAIL_RE.findall(card_html)
+            if card_emails:
+                rc_email = card_emails[0]
+            twitter_match = TWITTER_RE.search(card_html)
+            if twitter_match:
+                rc_twitter = f'https://x.com/{twitter_match.group(1)}'
+
+    found = {
+        'ol_coach': {'name': ol_coach, 'email': ol_email, 'twitter': ol_twitter} if ol_coach else None,
+        'rc': {'name': rc_coach, 'email': rc_email, 'twitter': rc_twitter} if rc_coach else None,
+        'all_emails_found': list(set(EMAIL_RE.findall(html))),
+    }
+    if targets is not None:
+        # Vendor layout named one role; keep it and take the other from the cards
+        found['ol_coach'] = targets['ol_coach'] or found['ol_coach']
+        found['rc'] = targets['rc'] or found['rc']
+    return found
+
+
+__all__ = ['extract_staff_targets']
@@ -0,0 +1,253 @@
+"""
+scrapers/bulk_scrape.py - Bulk Auto-Scrape of School Requests
+============================================================================
+auto_scrape_school (app.py) runs up to three searches, URL pattern probes
+and a page fetch, so one school can take 30 s+, and the admin endpoints
+run it one school per blocking HTTP request. BulkScrapeJob runs it for a
+whole queue of school_requests on a bounded thread pool in the background:
+
+- Workers: BULK_SCRAPE_WORKERS schools in flight at once (default 8)
+- Writes: results are buffered and written back to school_requests with
+  one upsert per BULK_SCRAPE_BATCH results (and at the end), not a write
+  per school
+- Progress: snapshot(), which the dashboard polls through
+  GET /api/admin/bulk-scrape; 'version' changes whenever a school finishes
+
+Each result lands in the same places the single-school flow uses: the
+[SCRAPED_DATA] block in notes (read by the admin dashboard) and the
+staff_url / scraped_data / scrape_status / scrape_error columns.
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_WORKERS = int(os.environ.get('BULK_SCRAPE_WORKERS', '8'))
+DEFAULT_BATCH_SIZE = int(os.environ.get('BULK_SCRAPE_BATCH', '10'))
+
+# Finished schools kept in snapshots for the progress panel
+RECENT_RESULTS = 20
+
+_SCRAPED_BLOCK_RE = re.compile(r'\[SCRAPED_DATA\].*?\[/SCRAPED_DATA\]\n?', re.DOTALL)
+
+
+def notes_with_scraped_data(notes: Optional[str], scraped: Dict[str, Any]) -> str:
+    """Replace (or add) the [SCRAPED_DATA] block the dashboard reads from notes."""
+    user_notes = _SCRAPED_BLOCK_RE.sub('', notes or '').strip()
+    block = f"[SCRAPED_DATA]{json.dumps(scraped)}[/SCRAPED_DATA]"
+    return f"{block}\n{user_notes}" if user_notes else block
+
+
+def scrape_status_for(result: Dict[str, Any]) -> str:
+    if result.get('success'):
+        return 'success'
+    return 'manual_needed' if result.get('staff_url') else 'failed'
+
+
+class BulkScrapeJob:
+    """
+    Auto-scrape many school requests concurrently.
+
+    Usage:
+        job = BulkScrapeJob(db, requests, auto_scrape_school)
+        job.start()
+        snapshot = job.snapshot()  # progress, polled while job.running
+    """
+
+    def __init__(
+        self,
+        db,
+        requests: List[Dict[str, Any]],
+        scrape_fn: Callable[[str], Dict[str, Any]],
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.id = uuid.uuid4().hex[:12]
+        self.db = db
+        self.requests = list(requests)
+        self.scrape_fn = scrape_fn
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+
+        self.running = False
+        self.cancelled = False
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.counts = {'done': 0, 'success': 0, 'manual_needed': 0, 'failed': 0, 'written': 0, 'write_errors': 0}
+        self.recent: List[Dict[str, Any]] = []
+        self.version = 0
+
+        self._pending_rows: List[Dict[str, Any]] = []
+        self._skipped: List[str] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------
+    # Lifecycle
+    # ------------------------------------------
+
+    def start(self) -> None:
+        self.running = True
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name=f'bulk-scrape-{self.id}', daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop handing out schools; those already in flight still finish and are written."""
+        self.cancelled = True
+        self._changed()
+
+    def _run(self) -> None:
+        try:
+            self._mark_scraping()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(self._scrape_one, req): req for req in self.requests}
+                for future in as_completed(futures):
+                    self._finish_one(futures[future], future.result())
+            self._flush()
+            self._reset_skipped()
+        except Exception as e:
+            logger.error(f"Bulk scrape {self.id} error: {e}")
+        finally:
+            self.running = False
+            self.finished_at = time.time()
+            self._changed()
+            logger.info(f"Bulk scrape {self.id}: {self.counts['done']}/{len(self.requests)} schools, "
+                        f"{self.counts['success']} found, {self.counts['manual_needed']} manual, "
+                        f"{self.counts['failed']} failed in {self.finished_at - self.started_at:.0f}s")
+
+    def _scrape_one(self, req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.cancelled:
+            return None
+        try:
+            return self.scrape_fn(req['school_name'])
+        except Exception as e:
+            logger.warning(f"Bulk scrape failed for {req['school_name']}: {e}")
+            return {'success': False, 'error': str(e), 'needs_manual': True}
+
+    def _finish_one(self, req: Dict[str, Any], result: Optional[Dict[str, Any]]) -> None:
+        if result is None:
+            self._skipped.append(req['id'])  # Cancelled before it started
+            return
+        status = scrape_status_for(result)
+        row = {
+            'id': req['id'],
+            'school_name': req['school_name'],
+            'notes': notes_with_scraped_data(req.get('notes'), result),
+            'staff_url': result.get('staff_url'),
+            'scraped_data': result,
+            'scrape_status': status,
+            'scrape_error': result.get('error'),
+        }
+        with self._lock:
+            self.counts['done'] += 1
+            self.counts[status] += 1
+            self.recent.append({
+                'school_name': req['school_name'],
+                'status': status,
+                'staff_url': result.get('staff_url'),
+                'ol_coach': (result.get('ol_coach') or {}).get('name'),
+                'rc': (result.get('rc') or {}).get('name'),
+                'error': result.get('error'),
+            })
+            del self.recent[:-RECENT_RESULTS]
+            self._pending_rows.append(row)
+            flush = len(self._pending_rows) >= self.batch_size
+        if flush:
+            self._flush()
+        self._changed()
+
+    # ------------------------------------------
+    # Writes
+    # ------------------------------------------
+
+    def _mark_scraping(self) -> None:
+        ids = [req['id'] for req in self.requests]
+        for start in range(0, len(ids), 100):
+            try:
+                (self.db.client.table('school_requests')
+                 .update({'scrape_status': 'scraping'})
+                 .in_('id', ids[start:start + 100]).execute())
+            except Exception as e:
+                logger.warning(f"Could not mark school requests as scraping: {e}")
+                return
+
+    def _reset_skipped(self) -> None:
+        """Requests a cancel skipped go back to 'pending'."""
+        for start in range(0, len(self._skipped), 100):
+            try:
+                (self.db.client.table('school_requests')
+                 .update({'scrape_status': 'pending'})
+                 .in_('id', self._skipped[start:start + 100]).execute())
+            except Exception as e:
+                logger.warning(f"Could not reset skipped school requests: {e}")
+                return
+
+    def _flush(self) -> None:
+        """Upsert buffered results in one request."""
+        with self._lock:
+            rows, self._pending_rows = self._pending_rows, []
+        if not rows:
+            return
+        try:
+            self.db.client.table('school_requests').upsert(rows, on_conflict='id').execute()
+            with self._lock:
+                self.counts['written'] += len(rows)
+        except Exception as e:
+            logger.error(f"Bulk scrape write failed ({len(rows)} rows): {e}")
+            with self._lock:
+                self.counts['write_errors'] += len(rows)
+
+    # ------------------------------------------
+    # Progress
+    # ------------------------------------------
+
+    def _changed(self) -> None:
+        with self._lock:
+            self.version += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self.counts)
+            recent = list(self.recent)
+            version = self.version
+        total = len(self.requests)
+        end = self.finished_at or time.time()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        remaining = total - counts['done']
+        eta = (elapsed / counts['done'] * remaining) if counts['done'] and self.running else None
+        return {
+            'job_id': self.id,
+            'version': version,
+            'running': self.running,
+            'cancelled': self.cancelled,
+            'total': total,
+            'workers': self.workers,
+            **counts,
+            'elapsed_s': round(elapsed, 1),
+            'eta_s': round(eta) if eta is not None else None,
+            'started_at': (datetime.fromtimestamp(self.started_at, timezone.utc).isoformat()
+                           if self.started_at else None),
+            'recent': recent,
+        }
+
+
+__all__ = [
+    'BulkScrapeJob',
+    'notes_with_scraped_data',
+    'scrape_status_for',
+]
@@ -0,0 +1,363 @@
+"""
+scrapers/discovery_cache.py - Staff URL Discovery Cache
+============================================================================
+auto_scrape_school used to rediscover a school's staff page on every call:
+up to three DuckDuckGo searches and three HEAD probes, even when the URL
+was already in schools.staff_url or had been found last week for another
+athlete. StaffUrlCache remembers, per normalized school name:
+
+- the resolved staff URL and how it was found ('known', 'manual', 'search'
+  or 'pattern') with a confidence
+- the page's ETag / Last-Modified and the OL/RC picked from it, so a repeat
+  lookup is one conditional GET; a 304 reuses the stored picks
+- when the URL was last verified, and misses (no URL found) with their own
+  shorter TTL so unfindable schools aren't searched on every request
+
+A page that stops yielding coaches halves its entry's confidence; below
+MIN_CONFIDENCE the entry is ignored and the school is rediscovered. A
+404/410 drops the entry at once.
+
+Config (env):
+- STAFF_URL_CACHE_PATH: database file (default ~/.coach_outreach/staff_urls.db)
+- STAFF_URL_NEGATIVE_TTL_HOURS: how long a miss is remembered (default 72)
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_CACHE_PATH = Path.home() / '.coach_outreach' / 'staff_urls.db'
+DEFAULT_NEGATIVE_TTL_HOURS = 72
+
+# Starting confidence by discovery method
+METHOD_CONFIDENCE = {
+    'manual': 1.0,    # Entered or approved by an admin
+    'known': 0.9,     # Already in schools.staff_url
+    'search': 0.6,    # First athletics-looking search result
+    'pattern': 0.5,   # Guessed URL that answered a HEAD probe
+}
+VERIFIED_CONFIDENCE = 0.9
+MIN_CONFIDENCE = 0.35
+
+REVALIDATE_TIMEOUT = 10
+
+# Responses that mean the cached URL is dead, not just temporarily failing
+GONE_STATUSES = frozenset({404, 410})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS staff_urls (
+    school_key TEXT PRIMARY KEY,
+    school_name TEXT NOT NULL,
+    staff_url TEXT,
+    method TEXT NOT NULL,
+    confidence REAL NOT NULL DEFAULT 0,
+    etag TEXT,
+    last_modified TEXT,
+    targets TEXT,
+    found_at REAL NOT NULL,
+    verified_at REAL,
+    checked_at REAL NOT NULL
+);
+"""
+
+_COLUMNS = ('school_key', 'school_name', 'staff_url', 'method', 'confidence', 'etag',
+            'last_modified', 'targets', 'found_at', 'verified_at', 'checked_at')
+
+
+def normalize_school_name(name: str) -> str:
+    """Cache key: lowercase, punctuation dropped, whitespace collapsed, no leading 'the'."""
+    key = re.sub(r"[^\w&\s]", ' ', (name or '').lower())
+    key = ' '.join(key.split())
+    return key[4:] if key.startswith('the ') else key
+
+
+@dataclass
+class StaffUrlEntry:
+    """
+    One cached discovery.
+
+    Attributes:
+        staff_url: Resolved staff page (None for a remembered miss)
+        method: How it was found ('manual', 'known', 'search', 'pattern', 'none')
+        confidence: 0-1; raised when the page yields coaches, halved when not
+        targets: OL/RC picks from the last scrape of this URL
+        verified_at: Last time the URL was fetched successfully
+        checked_at: Last time the entry was written
+    """
+    school_key: str
+    school_name: str
+    staff_url: Optional[str]
+    method: str
+    confidence: float = 0.0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    targets: Optional[Dict[str, Any]] = None
+    found_at: float = 0.0
+    verified_at: Optional[float] = None
+    checked_at: float = 0.0
+
+    @property
+    def negative(self) -> bool:
+        return self.staff_url is None
+
+
+@dataclass
+class Revalidation:
+    """Outcome of the conditional GET for a cached URL."""
+    status_code: Optional[int] = None
+    html: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @property
+    def gone(self) -> bool:
+        return self.status_code in GONE_STATUSES
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class StaffUrlCache:
+    """
+    SQLite store of staff page discoveries keyed by normalized school name.
+
+    Usage:
+        cache = get_staff_url_cache()
+        entry = cache.lookup("NC State")
+        if entry is None:
+            url = ...discover...
+            entry = cache.store("NC State", url, 'search')
+        check = cache.revalidate(entry, session)
+    """
+
+    def __init__(self, path: Optional[Path] = None, negative_ttl_hours: Optional[float] = None):
+        self.path = Path(path or os.environ.get('STAFF_URL_CACHE_PATH') or DEFAULT_CACHE_PATH).expanduser()
+        hours = negative_ttl_hours if negative_ttl_hours is not None else float(
+            os.environ.get('STAFF_URL_NEGATIVE_TTL_HOURS', DEFAULT_NEGATIVE_TTL_HOURS))
+        self.negative_ttl = hours * 3600
+        self.stats = {
+            'hits': 0,
+            'negative_hits': 0,
+            'misses': 0,
+            'not_modified': 0,
+            'revalidated': 0,
+            'invalidated': 0,
+            'stores': 0,
+        }
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+
+    # ------------------------------------------
+    # Reads
+    # ------------------------------------------
+
+    def get(self, school_name: str) -> Optional[StaffUrlEntry]:
+        """Stored entry regardless of freshness or confidence."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM staff_urls WHERE school_key = ?",
+                (normalize_school_name(school_name),),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = StaffUrlEntry(**dict(zip(_COLUMNS, row)))
+        if entry.targets:
+            try:
+                entry.targets = json.loads(entry.targets)
+            except ValueError:
+                entry.targets = None
+        return entry
+
+    def lookup(self, school_name: str) -> Optional[StaffUrlEntry]:
+        """Usable entry: a confident URL, or a miss still inside the negative TTL."""
+        entry = self.get(school_name)
+        if entry is not None and entry.negative and time.time() - entry.checked_at < self.negative_ttl:
+            self._count('negative_hits')
+            return entry
+        if entry is not None and not entry.negative and entry.confidence >= MIN_CONFIDENCE:
+            self._count('hits')
+            return entry
+        self._count('misses')
+        return None
+
+    # ------------------------------------------
+    # Writes
+    # ------------------------------------------
+
+    def store(self, school_name: str, staff_url: str, method: str,
+              confidence: Optional[float] = None) -> StaffUrlEntry:
+        """Remember a discovered URL (replaces validators and picks if the URL changed)."""
+        now = time.time()
+        confidence = METHOD_CONFIDENCE.get(method, 0.5) if confidence is None else confidence
+        key = normalize_school_name(school_name)
+        with self._lock:
+            previous = self._conn.execute(
+                'SELECT staff_url FROM staff_urls WHERE school_key = ?', (key,)).fetchone()
+            if previous and previous[0] == staff_url:
+                self._conn.execute(
+                    'UPDATE staff_urls SET method = ?, confidence = MAX(confidence, ?), checked_at = ? '
+                    'WHERE school_key = ?', (method, confidence, now, key))
+            else:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO staff_urls (school_key, school_name, staff_url, method, '
+                    'confidence, found_at, checked_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, school_name.strip(), staff_url, method, confidence, now, now))
+            self.stats['stores'] += 1
+        return self.get(school_name)
+
+    def store_negative(self, school_name: str) -> None:
+        """Remember that no staff URL could be found (expires after the negative TTL)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO staff_urls (school_key, school_name, staff_url, method, '
+                'confidence, found_at, checked_at) VALUES (?, ?, NULL, ?, 0, ?, ?)',
+                (normalize_school_name(school_name), school_name.strip(), 'none', now, now))
+            self.stats['stores'] += 1
+
+    def record_scrape(self, school_name: str, targets: Dict[str, Any], found: bool,
+                      etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store the picks and validators of a scrape; adjust confidence by whether it found coaches."""
+        now = time.time()
+        picks = {k: targets.get(k) for k in ('ol_coach', 'rc', 'all_emails_found')}
+        with self._lock:
+            if found:
+                self._conn.execute(
+                    'UPDATE staff_urls SET targets = ?, etag = ?, last_modified = ?, '
+                    'confidence = MAX(confidence, ?), verified_at = ?, checked_at = ? WHERE school_key = ?',
+                    (json.dumps(picks), etag, last_modified, VERIFIED_CONFIDENCE, now, now,
+                     normalize_school_name(school_name)))
+            else:
+                # Fetched fine but no OL/RC: maybe the wrong page; rediscover once this drops low enough
+                self._conn.execute(
+                    'UPDATE staff_urls SET targets = NULL, etag = NULL, last_modified = NULL, '
+                    'confidence = confidence / 2, verified_at = ?, checked_at = ? WHERE school_key = ?',
+                    (now, now, normalize_school_name(school_name)))
+
+    def mark_verified(self, school_name: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute('UPDATE staff_urls SET verified_at = ?, checked_at = ? WHERE school_key = ?',
+                               (now, now, normalize_school_name(school_name)))
+
+    def invalidate(self, school_name: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM staff_urls WHERE school_key = ?',
+                               (normalize_school_name(school_name),))
+            self.stats['invalidated'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM staff_urls')
+
+    # ------------------------------------------
+    # Revalidation
+    # ------------------------------------------
+
+    def revalidate(self, entry: StaffUrlEntry, session: requests.Session,
+                   timeout: float = REVALIDATE_TIMEOUT) -> Revalidation:
+        """
+        One conditional GET of a cached URL.
+
+        Sends If-None-Match / If-Modified-Since when the entry has stored picks
+        to fall back on; otherwise a plain GET whose body the caller can use.
+        """
+        check = Revalidation()
+        headers = {}
+        if entry.targets:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        self._count('revalidated')
+        try:
+            resp = session.get(entry.staff_url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            check.error = f'Revalidation failed: {e}'
+            return check
+        check.status_code = resp.status_code
+        if resp.status_code == 304:
+            self._count('not_modified')
+            self.mark_verified(entry.school_name)
+        elif resp.ok:
+            check.html = resp.text
+            check.etag = resp.headers.get('ETag')
+            check.last_modified = resp.headers.get('Last-Modified')
+        else:
+            check.error = f'HTTP {resp.status_code}'
+        return check
+
+    # ------------------------------------------
+    # Stats
+    # ------------------------------------------
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            positive, negative = self._conn.execute(
+                'SELECT COUNT(staff_url), COUNT(*) - COUNT(staff_url) FROM staff_urls').fetchone()
+        lookups = stats['hits'] + stats['negative_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['negative_hits']) / lookups, 3) if lookups else 0.0
+        stats['urls'] = positive
+        stats['negative'] = negative
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Optional[StaffUrlCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_staff_url_cache() -> StaffUrlCache:
+    """Process-wide discovery cache."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = StaffUrlCache()
+        return _shared
+
+
+__all__ = [
+    'StaffUrlCache',
+    'StaffUrlEntry',
+    'Revalidation',
+    'get_staff_url_cache',
+    'normalize_school_name',
+]
@@ -0,0 +1,416 @@
+"""
+scrapers/recrawl.py - Staff Page Recrawl Scheduler
+============================================================================
+Coach rows are scraped once (auto_scrape_school or an admin action) and
+were never refreshed, so staff turnover every winter kept stale addresses
+in the send queue until they bounced. RecrawlScheduler re-fetches
+schools.staff_url pages in priority order, within a per-run budget, and
+updates only the coaches whose extracted data changed.
+When a different person now holds the OL/RC job (last names differ), they
+get a new coach row and the old row is retired (role cleared, note added),
+so outreach history and contacted/responded/bounced state stay with the
+person they belong to.
+
+Per school (columns on schools, see supabase_migration_recrawl.sql):
+- last_scraped_at / staff_content_hash: when the page was last fetched and
+  the compute_html_hash of what came back
+- staff_scrape_count / staff_change_count / staff_changed_at: how often the
+  page was fetched and how often that changed a coach row; every such
+  change is logged to staff_page_changes
+
+Priority:
+- A school is due once RECRAWL_INTERVAL_DAYS have passed, divided by
+  SEASON_FACTOR in the coaching-change season (Dec-Feb) and by LIST_FACTOR
+  when it is on an active athlete's list
+- Due schools are ranked by how overdue they are, how many active athletes
+  list them and their smoothed change rate; never-scraped pages come first
+
+Fetching: one AsyncCrawler pass with conditional GETs, so an unchanged page
+costs a 304 and no extraction. Pages whose static HTML has no staff list
+go through the TieredFetcher (browser tier).
+
+Config (env):
+- RECRAWL_ENABLED: 'false' skips the daily run in the background scheduler
+- RECRAWL_BUDGET: schools fetched per run (default 50)
+- RECRAWL_INTERVAL_DAYS: base days between fetches of a school (default 30)
+
+Author: Coach Outreach System
+Version: 1.0.0
+============================================================================
+"""
+
+import os
+import re
+import math
+import time
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from browser.crawler import CrawlerConfig, ValidatorStore, crawl_urls
+from browser.fetcher import get_fetcher
+from extraction.dom_parser import compute_html_hash
+from scrapers.auto_scrape import extract_staff_targets
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_BUDGET = int(os.environ.get('RECRAWL_BUDGET', '50'))
+DEFAULT_INTERVAL_DAYS = float(os.environ.get('RECRAWL_INTERVAL_DAYS', '30'))
+
+# Coaching carousel: firings after the regular season through signing day
+COACHING_CHANGE_MONTHS = frozenset({12, 1, 2})
+SEASON_FACTOR = 3.0
+LIST_FACTOR = 2.0
+MIN_INTERVAL_DAYS = 2.0
+
+# Overdue ratio given to pages that have never been recrawled
+NEVER_SCRAPED_OVERDUE = 10.0
+
+# schools.role value -> extract_staff_targets key
+ROLE_TARGETS = (('ol', 'ol_coach'), ('rc', 'rc'))
+
+
+def recrawl_enabled() -> bool:
+    return os.environ.get('RECRAWL_ENABLED', 'true').lower() not in ('false', '0', 'no', 'off')
+
+
+def in_change_season(now: datetime) -> bool:
+    return now.month in COACHING_CHANGE_MONTHS
+
+
+def _parse_time(value) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+# Words extraction leaves around a name that don't identify the person
+NAME_NOISE = frozenset({'coach', 'dr', 'mr', 'mrs', 'ms', 'jr', 'sr', 'ii', 'iii', 'iv'})
+
+
+def _last_name(name: Optional[str]) -> str:
+    words = [w for w in re.sub(r"[^a-z' -]", ' ', (name or '').lower()).split() if w not in NAME_NOISE]
+    return words[-1] if words else ''
+
+
+def _same_person(a: Optional[str], b: Optional[str]) -> bool:
+    """False only on a real mismatch: both names readable and different last names."""
+    last_a, last_b = _last_name(a), _last_name(b)
+    return not (last_a and last_b) or last_a == last_b
+
+
+@dataclass
+class RecrawlTask:
+    """A school due for a staff page refetch."""
+    school_id: str
+    school_name: str
+    staff_url: str
+    priority: float
+    last_scraped_at: Optional[datetime] = None
+    content_hash: Optional[str] = None
+    scrape_count: int = 0
+    change_count: int = 0
+    athletes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'school_id': self.school_id,
+            'school_name': self.school_name,
+            'staff_url': self.staff_url,
+            'priority': round(self.priority, 3),
+            'last_scraped_at': self.last_scraped_at.isoformat() if self.last_scraped_at else None,
+            'athletes': self.athletes,
+            'changes': self.change_count,
+        }
+
+
+@dataclass
+class RecrawlOutcome:
+    """
+    Result of refetching one school's staff page.
+
+    status is one of:
+        'not_modified' - 304 or identical content hash, nothing extracted
+        'unchanged'    - page changed but the OL/RC data matches the coach rows
+        'updated'      - one or more coach rows were added or updated
+        'no_staff'     - page fetched but no OL/RC could be extracted
+        'failed'       - page could not be fetched
+    """
+    school_id: str
+    school_name: str
+    staff_url: str
+    status: str
+    tier: str = 'static'
+    changes: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+class RecrawlScheduler:
+    """
+    Picks stale staff pages and refreshes their coach rows.
+
+    Usage:
+        scheduler = RecrawlScheduler(get_db(), budget=25)
+        preview = scheduler.plan()
+        summary = scheduler.run()
+        print(summary['updated'], summary['coaches_updated'])
+    """
+
+    def __init__(
+        self,
+        db,
+        budget: int = DEFAULT_BUDGET,
+        interval_days: float = DEFAULT_INTERVAL_DAYS,
+        crawler_config: Optional[CrawlerConfig] = None,
+        validators: Optional[ValidatorStore] = None,
+        fetcher=None,
+    ):
+        self.db = db
+        self.budget = budget
+        self.interval_days = interval_days
+        self.crawler_config = crawler_config or CrawlerConfig(per_host=2, rate_per_second=5.0, burst=5)
+        self.validators = validators
+        self.fetcher = fetcher
+
+    # ------------------------------------------
+    # Planning
+    # ------------------------------------------
+
+    def interval_for(self, athletes: int, now: datetime) -> float:
+        """Days a school's page stays fresh."""
+        interval = self.interval_days
+        if in_change_season(now):
+            interval /= SEASON_FACTOR
+        if athletes:
+            interval /= LIST_FACTOR
+        return max(interval, MIN_INTERVAL_DAYS)
+
+    def plan(self, now: Optional[datetime] = None, budget: Optional[int] = None) -> List[RecrawlTask]:
+        """Due schools, highest priority first, cut to the budget."""
+        now = now or datetime.now(timezone.utc)
+        budget = self.budget if budget is None else budget
+        listed = self.db.get_active_school_counts()
+
+        tasks = []
+        for school in self.db.get_all_schools():
+            staff_url = (school.get('staff_url') or '').strip()
+            if not staff_url:
+                continue
+            athletes = listed.get(school['id'], 0)
+            last = _parse_time(school.get('last_scraped_at'))
+            if last is None:
+                overdue = NEVER_SCRAPED_OVERDUE
+            else:
+                overdue = (now - last).total_seconds() / 86400 / self.interval_for(athletes, now)
+                if overdue < 1:
+                    continue
+            scrapes = school.get('staff_scrape_count') or 0
+            changes = school.get('staff_change_count') or 0
+            change_rate = (changes + 1) / (scrapes + 2)
+            priority = overdue * (1 + math.log2(1 + athletes)) * (0.5 + change_rate)
+            tasks.append(RecrawlTask(
+                school_id=school['id'],
+                school_name=school['name'],
+                staff_url=staff_url,
+                priority=priority,
+                last_scraped_at=last,
+                content_hash=school.get('staff_content_hash'),
+                scrape_count=scrapes,
+                change_count=changes,
+                athletes=athletes,
+            ))
+
+        tasks.sort(key=lambda t: t.priority, reverse=True)
+        return tasks[:max(0, budget)]
+
+    # ------------------------------------------
+    # Running
+    # ------------------------------------------
+
+    def run(self, now: Optional[datetime] = None, budget: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch the planned pages and apply coach changes. Returns a summary dict."""
+        start = time.perf_counter()
+        now = now or datetime.now(timezone.utc)
+        tasks = self.plan(now, budget)
+        summary = {
+            'planned': len(tasks),
+            'not_modified': 0,
+            'unchanged': 0,
+            'updated': 0,
+            'no_staff': 0,
+            'failed': 0,
+            'coaches_updated': 0,
+            'in_change_season': in_change_season(now),
+            'outcomes': [],
+        }
+        if not tasks:
+            summary['elapsed_ms'] = int((time.perf_counter() - start) * 1000)
+            return summary
+
+        urls = list(dict.fromkeys(t.staff_url for t in tasks))
+        pages = dict(zip(urls, crawl_urls(urls, self.crawler_config, self.validators)))
+
+        for task in tasks:
+            try:
+                outcome = self._refresh(task, pages[task.staff_url], now)
+            except Exception as e:
+                logger.error(f"Recrawl failed for {task.school_name}: {e}")
+                outcome = RecrawlOutcome(task.school_id, task.school_name, task.staff_url,
+                                         status='failed', error=str(e))
+            summary[outcome.status] += 1
+            summary['coaches_updated'] += len(outcome.changes)
+            summary['outcomes'].append({
+                'school': outcome.school_name,
+                'status': outcome.status,
+                'tier': outcome.tier,
+                'changes': outcome.changes,
+                'error': outcome.error,
+            })
+
+        summary['elapsed_ms'] = int((time.perf_counter() - start) * 1000)
+        logger.info(f"Recrawl: {summary['planned']} pages, {summary['updated']} updated "
+                    f"({summary['coaches_updated']} coaches), {summary['not_modified']} not modified, "
+                    f"{summary['failed']} failed")
+        return summary
+
+    def _refresh(self, task: RecrawlTask, page, now: datetime) -> RecrawlOutcome:
+        outcome = RecrawlOutcome(task.school_id, task.school_name, task.staff_url, status='failed')
+
+        content_hash = page.content_hash
+        if task.content_hash and content_hash == task.content_hash:
+            outcome.status = 'not_modified'
+            self._mark(task, now, content_hash)
+            return outcome
+
+        # 304 against validators from before the school was tracked: extract anyway
+        html = page.html
+        fetcher = self.fetcher or get_fetcher()
+        if html is None or not fetcher.has_staff_content(html, task.staff_url, task.school_name):
+            fetched = fetcher.fetch(task.staff_url, school=task.school_name)
+            if fetched.html is not None:
+                html, outcome.tier = fetched.html, fetched.tier
+            elif html is None:
+                outcome.error = fetched.error or page.error
+                self._mark(task, now)
+                return outcome
+        content_hash = content_hash or compute_html_hash(html)
+
+        targets = extract_staff_targets(html)
+        if not (targets.get('ol_coach') or targets.get('rc')):
+            outcome.status = 'no_staff'
+            self._mark(task, now, content_hash)
+            return outcome
+
+        outcome.changes = self._apply(task, targets)
+        outcome.status = 'updated' if outcome.changes else 'unchanged'
+        if outcome.changes:
+            self.db.record_staff_page_change(task.school_id, task.staff_url, content_hash,
+                                             task.content_hash, outcome.changes)
+        # The first tracked fetch only fills gaps; it isn't evidence of turnover
+        self._mark(task, now, content_hash, changed=bool(outcome.changes) and task.content_hash is not None)
+        return outcome
+
+    def _apply(self, task: RecrawlTask, targets: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Add or update the OL/RC rows that differ from the page; returns the changes."""
+        by_role = {}
+        for coach in self.db.get_coaches_for_school(task.school_name):
+            by_role.setdefault(coach.get('role'), coach)
+
+        changes = []
+        for role, key in ROLE_TARGETS:
+            found = targets.get(key)
+            if not found or not found.get('name'):
+                continue
+            current = by_role.get(role)
+            if current is None:
+                self.db.add_coach(task.school_name, found['name'], role,
+                                  email=found.get('email'), twitter=found.get('twitter'))
+                changes.append({'role': role, 'action': 'added', 'name': found['name'],
+                                'email': self.db.clean_email(found.get('email'))})
+                continue
+            if not _same_person(current.get('name'), found['name']):
+                changes.append(self._replace_coach(task, role, current, found))
+                continue
+            fields = self._coach_updates(current, found)
+            if fields:
+                self.db.update_coach(current['id'], **fields)
+                changes.append({
+                    'role': role,
+                    'action': 'updated',
+                    'coach_id': current['id'],
+                    'before': {k: current.get(k) for k in fields},
+                    'after': fields,
+                })
+        return changes
+
+    def _replace_coach(self, task: RecrawlTask, role: str, current: Dict[str, Any],
+                       found: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        A different person holds the job: add them as a new coach row and retire
+        the old one, so outreach history and contacted/responded/bounced state
+        stay with the person they belong to.
+        """
+        # Clearing the role drops the old row from role lookups, the send plans and
+        # the queue status (update_coach invalidates both on a role change)
+        note = f"Left {role.upper()} role {datetime.now(timezone.utc):%Y-%m-%d}: replaced by {found['name']}"
+        notes = f"{current['notes']}; {note}" if current.get('notes') else note
+        self.db.update_coach(current['id'], role=None, notes=notes)
+        self.db.add_coach(task.school_name, found['name'], role,
+                          email=found.get('email'), twitter=found.get('twitter'))
+        return {
+            'role': role,
+            'action': 'replaced',
+            'retired_coach_id': current['id'],
+            'before': {k: current.get(k) for k in ('name', 'email', 'twitter')},
+            'after': {'name': found['name'], 'email': self.db.clean_email(found.get('email')),
+                      'twitter': found.get('twitter')},
+        }
+
+    def _coach_updates(self, current: Dict[str, Any], found: Dict[str, Any]) -> Dict[str, Any]:
+        """Contact fields to refresh for the same person (empty when nothing changed)."""
+        email = self.db.clean_email(found.get('email'))
+        twitter = found.get('twitter')
+        fields = {}
+        if email and email != (current.get('email') or '').lower():
+            fields['email'] = email
+        if twitter and twitter.lower() != (current.get('twitter') or '').lower():
+            fields['twitter'] = twitter
+        return fields
+
+    def _mark(self, task: RecrawlTask, now: datetime, content_hash: Optional[str] = None,
+              changed: bool = False) -> None:
+        fields = {
+            'last_scraped_at': now.isoformat(),
+            'staff_scrape_count': task.scrape_count + 1,
+        }
+        if content_hash:
+            fields['staff_content_hash'] = content_hash
+        if changed:
+            fields['staff_change_count'] = task.change_count + 1
+            fields['staff_changed_at'] = now.isoformat()
+        self.db.update_school(task.school_id, **fields)
+
+
+__all__ = [
+    'RecrawlScheduler',
+    'RecrawlTask',
+    'RecrawlOutcome',
+    'in_change_season',
+    'recrawl_enabled',
+]
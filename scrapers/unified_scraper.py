@@ -17,11 +17,14 @@ Version: 3.3.0
 import re
 import time
 import logging
+from bisect import bisect_left
 from typing import List, Dict, Optional, Tuple, Set, Any
 from dataclasses import dataclass, field
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, Tag, NavigableString, CData
 from urllib.parse import urljoin
 
+from extraction.parser_backend import make_soup
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +63,15 @@ RC_PATTERNS = [
     r'\brc\b',
 ]
 
+# Block containers: class/id keywords and the text keyword
+CONTAINER_KEYWORDS = ['coach', 'staff', 'person', 'bio', 'member', 'card']
+BLOCK_TEXT_KEYWORD = 'coach'
+BLOCK_TEXT_MAX_LEN = 500
+
+# String types get_text() includes (comments, doctypes etc. are skipped)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+
 # Name validation
 def is_valid_name(text: str) -> Tuple[bool, int]:
     """Check if text looks like a person's name. Returns (is_name, confidence)."""
@@ -147,6 +159,40 @@ class CoachRecord:
     source: str = ""  # extraction method
 
 
+# ============================================================================
+# TEXT INDEX
+# ============================================================================
+
+def index_text(soup: BeautifulSoup) -> Tuple[List[Tag], Dict[int, Tuple[int, int]], str]:
+    """
+    Walk the tree once and record where each tag's text sits in the page text.
+
+    Returns (tags in document order, {id(tag): (start, end)}, lowercased page
+    text). text[start:end] equals tag.get_text().lower(), so text lengths and
+    keyword checks for every tag cost O(1)/O(log n) instead of re-walking
+    each subtree.
+    """
+    tags: List[Tag] = []
+    spans: Dict[int, Tuple[int, int]] = {}
+    pieces: List[str] = []
+    offset = 0
+    stack = [(soup, iter(soup.contents), 0)]
+    while stack:
+        node, children, start = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            spans[id(node)] = (start, offset)
+        elif isinstance(child, Tag):
+            tags.append(child)
+            stack.append((child, iter(child.contents), offset))
+        elif type(child) in TEXT_STRING_TYPES:
+            lowered = child.lower()
+            pieces.append(lowered)
+            offset += len(lowered)
+    return tags, spans, ''.join(pieces)
+
+
 # ============================================================================
 # UNIFIED EXTRACTOR
 # ============================================================================
@@ -163,8 +209,9 @@ class UnifiedCoachExtractor:
     5. Plain text parsing
     """
     
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None):
         self.extracted: List[CoachRecord] = []
+        self.backend = backend  # HTML parser backend, see extraction.parser_backend
     
     def extract(self, html: str, url: str = "") -> List[CoachRecord]:
         """
@@ -173,7 +220,7 @@ class UnifiedCoachExtractor:
         Returns list of CoachRecord with names, titles, and emails.
         """
         self.extracted = []
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, self.backend)
         
         # Remove script/style
         for tag in soup.find_all(['script', 'style', 'noscript']):
@@ -194,11 +241,13 @@ class UnifiedCoachExtractor:
                 seen_names.add(name_key)
                 unique.append(coach)
         
-        # Classify roles
+        # Classify roles, each distinct title once
+        title_roles: Dict[str, Tuple[bool, bool]] = {}
         for coach in unique:
             if coach.title:
-                coach.is_ol = is_ol_coach(coach.title)
-                coach.is_rc = is_recruiting_coordinator(coach.title)
+                if coach.title not in title_roles:
+                    title_roles[coach.title] = (is_ol_coach(coach.title), is_recruiting_coordinator(coach.title))
+                coach.is_ol, coach.is_rc = title_roles[coach.title]
         
         return unique
     
@@ -209,25 +258,33 @@ class UnifiedCoachExtractor:
         This handles formats where coaches are in divs/sections with
         name, title, and contact info grouped together.
         """
-        # Find containers that might hold coach info
-        containers = []
+        # One pass computes every element's text span; keyword hits are
+        # looked up by offset instead of calling get_text() per element
+        tags, spans, text = index_text(soup)
+        keyword_hits = [m.start() for m in re.finditer(BLOCK_TEXT_KEYWORD, text)]
+        keyword_len = len(BLOCK_TEXT_KEYWORD)
         
-        # Look for coach-related class names
-        for elem in soup.find_all(['div', 'article', 'section', 'li']):
-            classes = ' '.join(elem.get('class', []))
-            elem_id = elem.get('id', '')
-            
-            if any(kw in classes.lower() or kw in elem_id.lower() 
-                   for kw in ['coach', 'staff', 'person', 'bio', 'member', 'card']):
-                containers.append(elem)
-        
-        # Also look for elements containing coach keywords in text
-        for elem in soup.find_all(['div', 'p', 'section']):
-            text = elem.get_text().lower()
-            if 'coach' in text and len(text) < 500:
-                # This might be a coach block
-                if elem not in containers:
+        # Containers with coach-related class names / ids first, then
+        # elements whose text mentions a coach
+        containers = []
+        text_blocks = []
+        seen = set()
+        for elem in tags:
+            name = elem.name
+            if name in ('div', 'article', 'section', 'li'):
+                classes = ' '.join(elem.get('class', [])).lower()
+                elem_id = elem.get('id', '').lower()
+                if any(kw in classes or kw in elem_id for kw in CONTAINER_KEYWORDS):
                     containers.append(elem)
+                    seen.add(id(elem))
+            if name in ('div', 'p', 'section'):
+                start, end = spans[id(elem)]
+                if end - start < BLOCK_TEXT_MAX_LEN:
+                    i = bisect_left(keyword_hits, start)
+                    if i < len(keyword_hits) and keyword_hits[i] + keyword_len <= end:
+                        text_blocks.append(elem)
+        
+        containers.extend(elem for elem in text_blocks if id(elem) not in seen)
         
         for container in containers[:100]:  # Limit to prevent runaway
             coach = self._parse_block(container)
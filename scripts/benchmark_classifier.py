@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Time RoleClassifier.classify over a large batch of staff titles.
+Titles are drawn (with the repetition real directories have) from a list
+of common football staff titles plus random multi-role combinations.
+
+Compares the normalized-title cache, the uncached fingerprinted matcher
+and audit mode (inference chains built for every match), and checks that
+all three return the same roles and confidences.
+
+Usage: python scripts/benchmark_classifier.py [--titles N] [--unique N] [--seed N]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.classifier import RoleClassifier
+
+COMMON_TITLES = [
+    'Head Coach', 'Offensive Line Coach', 'Recruiting Coordinator', 'Defensive Coordinator',
+    'Offensive Coordinator / Quarterbacks', 'Run Game Coordinator / Offensive Line',
+    'Assistant Head Coach / OL', 'Director of Player Personnel', 'Director of Football Operations',
+    'Graduate Assistant', 'Graduate Assistant - Offensive Line', 'Defensive Line Coach',
+    'Special Teams Coordinator / Tight Ends', 'Wide Receivers Coach', 'Running Backs Coach',
+    'Linebackers Coach', 'Cornerbacks Coach', 'Safeties Coach', 'Quality Control - Offense',
+    'Director of Recruiting', 'Assistant Director of Recruiting', 'Video Coordinator',
+    'Equipment Manager', 'Athletic Trainer', 'Director of Strength and Conditioning',
+    'Co-OC / O-Line', 'OL / Recruiting Coordinator', 'Recruiting Operations Coordinator',
+    'Director of On-Campus Recruiting', 'Player Personnel Assistant',
+]
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'OL', 'DL', 'LB', 'DB', 'Special Teams', 'Recruiting']
+ROLES = ['Coach', 'Coordinator', 'Assistant', 'Analyst', 'Director']
+
+
+def make_titles(count, unique, seed):
+    rng = random.Random(seed)
+    pool = list(COMMON_TITLES)
+    while len(pool) < unique:
+        parts = [f"{rng.choice(POSITIONS)} {rng.choice(ROLES)}" for _ in range(rng.randint(1, 3))]
+        pool.append(' / '.join(parts))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def run(label, classifier, titles, **kwargs):
+    start = time.perf_counter()
+    outputs = [[(r.role, r.confidence, r.matched_pattern) for r in classifier.classify(t, **kwargs)]
+               for t in titles]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:>10.0f} ms {len(titles) / elapsed:>12,.0f} titles/s")
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--titles', type=int, default=100000, help='titles to classify')
+    parser.add_argument('--unique', type=int, default=2000, help='distinct titles in the batch')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles, args.unique, args.seed)
+    print(f"=== RoleClassifier over {len(titles):,} titles ({len(set(titles)):,} distinct) ===\n")
+    cached = RoleClassifier()
+    results = {
+        'cached': run('cached', cached, titles),
+        'uncached': run('uncached', RoleClassifier(cache_size=0), titles),
+        'audit': run('audit (inference chains)', RoleClassifier(cache_size=0), titles, audit=True),
+    }
+    print(f"\n  cache: {cached.cache_info()}")
+    same = results['cached'] == results['uncached'] == results['audit']
+    print(f"  outputs identical: {same}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
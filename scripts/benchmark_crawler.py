@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Crawl a local fixture server with AsyncCrawler.
+Serves the golden staff pages (benchmarks/golden) under many per-school
+URLs with per-request latency, ETag and Last-Modified support, then crawls
+them twice: the first pass downloads every page, the second should be all
+304 Not Modified.
+
+Usage: python scripts/benchmark_crawler.py [--schools N] [--latency MS] [--hosts N]
+           [--per-host N] [--rate N] [--fail-rate P]
+"""
+import os
+import sys
+import time
+import random
+import hashlib
+import tempfile
+import argparse
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from browser.crawler import CrawlerConfig, ValidatorStore, crawl_urls
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(ROOT, 'benchmarks', 'golden')
+
+
+def load_fixtures():
+    pages = []
+    for name in sorted(os.listdir(CORPUS)):
+        if name.endswith('.html'):
+            with open(os.path.join(CORPUS, name), 'rb') as fh:
+                pages.append(fh.read())
+    return pages
+
+
+def make_handler(pages, latency, fail_rate):
+    started = formatdate(time.time(), usegmt=True)
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        """GET /school/<n> -> a golden page; honours If-None-Match."""
+
+        def do_GET(self):
+            time.sleep(latency)
+            if fail_rate and random.random() < fail_rate:
+                self.send_response(503)
+                self.send_header('Retry-After', '0')
+                self.end_headers()
+                return
+            try:
+                school = int(self.path.rstrip('/').rsplit('/', 1)[-1])
+            except ValueError:
+                self.send_error(404)
+                return
+            body = pages[school % len(pages)]
+            etag = '"%s"' % hashlib.md5(body + str(school).encode()).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', started)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return FixtureHandler
+
+
+def serve(handler):
+    """Start a fixture server on a free localhost port."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def report(label, results, elapsed):
+    fetched = sum(1 for r in results if r.html is not None)
+    not_modified = sum(1 for r in results if r.not_modified)
+    failed = sum(1 for r in results if not r.ok)
+    retries = sum(r.attempts - 1 for r in results)
+    print(f"  {label:<8} {elapsed:>7.2f}s {len(results) / elapsed:>9.1f} pages/s "
+          f"{fetched:>6} fetched {not_modified:>6} 304 {failed:>5} failed {retries:>5} retries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--schools', type=int, default=500, help='staff pages to crawl')
+    parser.add_argument('--latency', type=float, default=200, help='server latency per request (ms)')
+    parser.add_argument('--hosts', type=int, default=50, help='distinct hosts (fixture servers)')
+    parser.add_argument('--per-host', type=int, default=4, help='concurrent requests per host')
+    parser.add_argument('--rate', type=float, default=100, help='global requests/second')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='share of requests answered 503')
+    args = parser.parse_args()
+
+    handler = make_handler(load_fixtures(), args.latency / 1000, args.fail_rate)
+    servers = [serve(handler) for _ in range(args.hosts)]
+    urls = [f'http://127.0.0.1:{servers[i % len(servers)].server_port}/school/{i}'
+            for i in range(args.schools)]
+    config = CrawlerConfig(per_host=args.per_host, rate_per_second=args.rate, burst=int(args.rate),
+                           backoff_base=0.1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        validators = ValidatorStore(os.path.join(tmp, 'validators.db'))
+        print(f"=== AsyncCrawler: {args.schools} pages on {args.hosts} hosts, {args.latency:.0f} ms latency, "
+              f"{args.per_host}/host, {args.rate:.0f} req/s ===\n")
+        for label in ('cold', 'warm'):
+            start = time.perf_counter()
+            results = crawl_urls(urls, config, validators)
+            report(label, results, time.perf_counter() - start)
+        validators.close()
+
+    sequential = args.schools * args.latency / 1000
+    print(f"\n  sequential estimate at this latency: {sequential:.0f}s")
+    for server in servers:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Time the staff-page extractors over saved HTML pages.
+Without arguments it generates nested Sidearm-style staff pages of growing
+size, which is where per-element get_text() calls used to go quadratic.
+
+Usage: python scripts/benchmark_extraction.py [page.html | pages_dir ...]
+           [--extractor unified|dom] [--backend NAME|all] [--repeat N]
+
+--backend all compares parse-only and parse+extract throughput for every
+installed HTML parser backend (see extraction/parser_backend.py).
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.unified_scraper import UnifiedCoachExtractor
+from extraction.dom_parser import DOMParser
+from extraction.parser_backend import available_backends, make_soup, resolve_backend
+
+EXTRACTORS = {
+    'unified': ('UnifiedCoachExtractor', lambda html, backend: UnifiedCoachExtractor(backend).extract(html)),
+    'dom': ('DOMParser', lambda html, backend: DOMParser(backend, cache=False).parse(html, '').staff),
+}
+
+FIRST = ['John', 'Mike', 'Chris', 'David', 'Brian', 'Kevin', 'Matt', 'Jason', 'Ryan', 'Scott']
+LAST = ['Smith', 'Johnson', 'Williams', 'Brown', 'Miller', 'Davis', 'Wilson', 'Moore', 'Taylor', 'Clark']
+TITLES = ['Head Coach', 'Offensive Line Coach', 'Recruiting Coordinator', 'Defensive Coordinator',
+          'Running Backs Coach', 'Director of Football Operations', 'Special Teams Coordinator']
+
+
+def synthetic_page(staff_count, nesting=6):
+    """Staff directory where every card sits inside `nesting` wrapper divs."""
+    cards = []
+    for i in range(staff_count):
+        name = f"{FIRST[i % len(FIRST)]} {LAST[(i // len(FIRST)) % len(LAST)]}{'' if i < 100 else ' ' + 'I' * (i // 100)}"
+        card = (
+            f'<div class="sidearm-staff-member">'
+            f'<h4 class="sidearm-staff-member-name"><a href="/staff-directory/{i}">{name}</a></h4>'
+            f'<p class="sidearm-staff-member-title">{TITLES[i % len(TITLES)]}</p>'
+            f'<p><a href="mailto:coach{i}@school.edu">coach{i}@school.edu</a></p>'
+            f'<p>(555) 555-{i:04d}</p>'
+            f'</div>'
+        )
+        for depth in range(nesting):
+            card = f'<div class="wrap-{depth}">{card}</div>'
+        cards.append(card)
+    sections = ''.join(f'<section class="staff-group"><h3>Football Staff</h3>{"".join(cards[i:i + 20])}</section>'
+                       for i in range(0, len(cards), 20))
+    return f'<html><body><div id="main"><div class="content">{sections}</div></div></body></html>'
+
+
+def load_pages(paths):
+    pages = []
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, '*.htm*'))) if os.path.isdir(path) else [path]
+        for f in files:
+            with open(f, encoding='utf-8', errors='replace') as fh:
+                pages.append((os.path.basename(f), fh.read()))
+    return pages
+
+
+def best_time(fn, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def bench(label, html, repeat, extract, backend):
+    best, coaches = best_time(lambda: extract(html, backend), repeat)
+    print(f"  {label:<40} {len(html) / 1024:>8.0f} KB {best * 1000:>10.1f} ms {len(coaches):>6} coaches")
+    return best
+
+
+def compare_backends(pages, repeat, name, extract):
+    """Parse-only and parse+extract totals per backend."""
+    print(f"=== {name}: {len(pages)} page(s), best of {repeat}, per backend ===\n")
+    print(f"  {'backend':<14} {'parse ms':>10} {'pages/s':>9} {'extract ms':>11} {'pages/s':>9} {'coaches':>8}")
+    for backend in available_backends():
+        parse_total = sum(best_time(lambda: make_soup(html, backend), repeat)[0] for _, html in pages)
+        extract_total = 0.0
+        found = 0
+        for _, html in pages:
+            elapsed, coaches = best_time(lambda: extract(html, backend), repeat)
+            extract_total += elapsed
+            found += len(coaches)
+        print(f"  {backend:<14} {parse_total * 1000:>10.1f} {len(pages) / parse_total:>9.1f} "
+              f"{extract_total * 1000:>11.1f} {len(pages) / extract_total:>9.1f} {found:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*', help='saved HTML pages or directories of them')
+    parser.add_argument('--extractor', choices=sorted(EXTRACTORS), default='unified')
+    parser.add_argument('--backend', default=None,
+                        help="HTML parser backend, or 'all' to compare backends (default: HTML_PARSER_BACKEND)")
+    parser.add_argument('--repeat', type=int, default=3, help='runs per page (best is reported)')
+    args = parser.parse_args()
+
+    if args.paths:
+        pages = load_pages(args.paths)
+    else:
+        pages = [(f'synthetic ({n} staff)', synthetic_page(n)) for n in (25, 50, 100, 200, 400)]
+
+    name, extract = EXTRACTORS[args.extractor]
+    if args.backend == 'all':
+        compare_backends(pages, args.repeat, name, extract)
+        return
+
+    backend = resolve_backend(args.backend)
+    print(f"=== {name} ({backend}) over {len(pages)} page(s), best of {args.repeat} ===\n")
+    total = sum(bench(label, html, args.repeat, extract, backend) for label, html in pages)
+    print(f"\n  total {total * 1000:.1f} ms, {len(pages) / total:.1f} pages/sec")
+
+
+if __name__ == '__main__':
+    main()
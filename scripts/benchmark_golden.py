@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Speed and accuracy of every staff extractor over the golden corpus.
+Runs DOMParser, each DOMParser strategy on its own, UnifiedCoachExtractor
+and auto_scrape_school's card heuristic over benchmarks/golden/*.html and
+scores their OL coach / recruiting coordinator picks against expected.json.
+
+Reports pages/sec, p50/p95 per-page time, peak traced memory, and name/email
+precision and recall per extractor. Strategy timings exclude building the
+soup and PageIndex, which the strategies share.
+
+Usage: python scripts/benchmark_golden.py [--corpus DIR] [--backend NAME] [--repeat N]
+           [--json results.json] [--baseline previous.json] [--verbose]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.types import CanonicalRole, ExtractionStrategy
+from extraction.dom_parser import (
+    DOMParser, PageIndex, clean_soup,
+    StructuredDataExtractor, StaffCardExtractor, DOMProximityExtractor,
+    TableExtractor, TextPatternExtractor, VendorLayoutExtractor,
+)
+from extraction.parser_backend import make_soup, resolve_backend
+from scrapers.unified_scraper import UnifiedCoachExtractor
+from scrapers.auto_scrape import extract_staff_targets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.join(ROOT, 'benchmarks', 'golden')
+
+ROLES = ('ol', 'rc')
+FIELDS = ('name', 'email')
+
+STRATEGIES = {
+    ExtractionStrategy.STRUCTURED_DATA: StructuredDataExtractor,
+    ExtractionStrategy.STAFF_CARDS: StaffCardExtractor,
+    ExtractionStrategy.DOM_PROXIMITY: DOMProximityExtractor,
+    ExtractionStrategy.TABLE_PARSING: TableExtractor,
+    ExtractionStrategy.TEXT_PATTERN: TextPatternExtractor,
+    ExtractionStrategy.VENDOR_LAYOUT: VendorLayoutExtractor,
+}
+
+
+# ============================================================================
+# EXTRACTORS
+# ============================================================================
+# Each takes (html, backend) and returns {'ol': (name, email) | None, 'rc': ...}
+
+def pick(name, email):
+    return (name, email) if name else None
+
+
+def run_dom(backend):
+    parser = DOMParser(backend, cache=False)
+
+    def extract(html):
+        result = parser.parse(html, '')
+        return {
+            'ol': pick(result.ol_coach.name, result.ol_coach.contact.email) if result.ol_coach else None,
+            'rc': pick(result.rc.name, result.rc.contact.email) if result.rc else None,
+        }
+    return extract
+
+
+def best_member(staff, role):
+    """The member DOMParser.parse would pick for `role` from these staff."""
+    scored = [(m, m.get_role_confidence(role)) for m in staff]
+    scored = [pair for pair in scored if pair[1] > 0]
+    if not scored:
+        return None
+    member = max(scored, key=lambda pair: pair[1])[0]
+    return pick(member.name, member.contact.email)
+
+
+def run_unified(backend):
+    extractor = UnifiedCoachExtractor(backend)
+
+    def extract(html):
+        extractor.extract(html)
+        ol, rc = extractor.find_ol_coach(), extractor.find_rc()
+        return {
+            'ol': pick(ol.name, ol.email) if ol else None,
+            'rc': pick(rc.name, rc.email) if rc else None,
+        }
+    return extract
+
+
+def run_auto_scrape(backend):
+    def extract(html):
+        targets = extract_staff_targets(html, backend)
+        return {
+            role: pick(targets[key]['name'], targets[key]['email']) if targets[key] else None
+            for role, key in (('ol', 'ol_coach'), ('rc', 'rc'))
+        }
+    return extract
+
+
+EXTRACTORS = {
+    'dom': run_dom,
+    'unified': run_unified,
+    'auto_scrape': run_auto_scrape,
+}
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def normalize(field, value):
+    value = ' '.join((value or '').split()).lower()
+    return value or None
+
+
+def score(predictions, corpus):
+    """Name/email precision and recall for OL and RC picks, plus the misses."""
+    counts = {(role, f): {'tp': 0, 'fp': 0, 'fn': 0} for role in ROLES for f in FIELDS}
+    misses = []
+    for fixture, expected in corpus:
+        for role in ROLES:
+            want = expected.get(role) or {}
+            got = predictions[fixture['file']].get(role)
+            for i, f in enumerate(FIELDS):
+                want_value = normalize(f, want.get(f))
+                got_value = normalize(f, got[i]) if got else None
+                c = counts[(role, f)]
+                if got_value and got_value == want_value:
+                    c['tp'] += 1
+                    continue
+                if got_value:
+                    c['fp'] += 1
+                if want_value:
+                    c['fn'] += 1
+                misses.append({'page': fixture['file'], 'role': role, 'field': f,
+                               'expected': want_value, 'got': got_value})
+
+    def ratios(c):
+        return {
+            'precision': round(c['tp'] / (c['tp'] + c['fp']), 3) if c['tp'] + c['fp'] else None,
+            'recall': round(c['tp'] / (c['tp'] + c['fn']), 3) if c['tp'] + c['fn'] else None,
+            **c,
+        }
+
+    accuracy = {role: {f: ratios(counts[(role, f)]) for f in FIELDS} for role in ROLES}
+    for f in FIELDS:
+        total = {k: sum(counts[(role, f)][k] for role in ROLES) for k in ('tp', 'fp', 'fn')}
+        accuracy.setdefault('all', {})[f] = ratios(total)
+    return accuracy, misses
+
+
+def measure(pages, repeat, run_page):
+    """Best-of-`repeat` seconds per page, peak traced bytes, and the last outputs."""
+    times = []
+    outputs = {}
+    for fixture, html in pages:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outputs[fixture['file']] = run_page(fixture, html)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        times.append(best)
+
+    # Memory in a separate pass: tracing slows everything down
+    peak = 0
+    tracemalloc.start()
+    try:
+        for fixture, html in pages:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            run_page(fixture, html)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+    total = sum(times)
+    return {
+        'pages': len(pages),
+        'total_ms': round(total * 1000, 2),
+        'pages_per_sec': round(len(pages) / total, 1) if total else None,
+        'p50_ms': round(percentile(times, 50) * 1000, 2),
+        'p95_ms': round(percentile(times, 95) * 1000, 2),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }, outputs
+
+
+def strategy_runner(strategy_cls, backend):
+    """Runs one DOMParser strategy on a pre-built soup + PageIndex per page."""
+    extractor = strategy_cls()
+    prepared = {}
+
+    def run_page(fixture, html):
+        if fixture['file'] not in prepared:
+            soup = clean_soup(make_soup(html, backend))
+            prepared[fixture['file']] = (soup, PageIndex(soup))
+        soup, index = prepared[fixture['file']]
+        staff = extractor.extract(soup, '', index)
+        return {
+            'ol': best_member(staff, CanonicalRole.OFFENSIVE_LINE_COACH),
+            'rc': best_member(staff, CanonicalRole.RECRUITING_COORDINATOR),
+        }
+
+    def warm(pages):
+        for fixture, html in pages:
+            run_page(fixture, html)
+
+    return run_page, warm
+
+
+def load_corpus(path):
+    with open(os.path.join(path, 'expected.json'), encoding='utf-8') as fh:
+        expected = json.load(fh)
+    pages = []
+    for filename in sorted(expected):
+        with open(os.path.join(path, filename), encoding='utf-8') as fh:
+            pages.append(({'file': filename, 'vendor': expected[filename].get('vendor')}, fh.read()))
+    return pages, expected
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def fmt(value, width):
+    return f"{value:>{width}.2f}" if value is not None else '-'.rjust(width)
+
+
+def print_report(report):
+    print(f"=== Golden corpus: {report['pages']} pages, backend {report['backend']}, "
+          f"best of {report['repeat']} ===\n")
+    print(f"  {'extractor':<24} {'pages/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'peak KB':>9}"
+          f" {'name P':>7} {'name R':>7} {'email P':>8} {'email R':>8}")
+    for name, row in report['extractors'].items():
+        acc = row['accuracy']['all']
+        print(f"  {name:<24} {row['pages_per_sec'] or 0:>8.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+              f" {row['peak_memory_kb']:>9.0f}"
+              f" {fmt(acc['name']['precision'], 7)} {fmt(acc['name']['recall'], 7)}"
+              f" {fmt(acc['email']['precision'], 8)} {fmt(acc['email']['recall'], 8)}")
+
+
+def print_misses(report):
+    for name, row in report['extractors'].items():
+        if row['misses']:
+            print(f"\n  {name} misses:")
+            for miss in row['misses']:
+                print(f"    {miss['page']:<32} {miss['role']} {miss['field']:<5} "
+                      f"expected {miss['expected']!r}, got {miss['got']!r}")
+
+
+def print_comparison(report, baseline):
+    print(f"\n=== vs baseline {baseline.get('git_revision') or ''} ({baseline.get('run_at', '?')}) ===\n")
+    print(f"  {'extractor':<24} {'pages/s':>16} {'name R':>14} {'email R':>14}")
+    for name, row in report['extractors'].items():
+        old = baseline.get('extractors', {}).get(name)
+        if not old:
+            continue
+
+        def delta(new, prev, spec):
+            if new is None or prev is None:
+                return '-'.rjust(14)
+            return f"{format(new, spec)} ({new - prev:+{spec}})".rjust(14)
+
+        print(f"  {name:<24} {delta(row['pages_per_sec'], old['pages_per_sec'], '.1f'):>16}"
+              f" {delta(row['accuracy']['all']['name']['recall'], old['accuracy']['all']['name']['recall'], '.2f')}"
+              f" {delta(row['accuracy']['all']['email']['recall'], old['accuracy']['all']['email']['recall'], '.2f')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='fixture directory with expected.json')
+    parser.add_argument('--backend', default=None, help='HTML parser backend (default: HTML_PARSER_BACKEND)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per page (best is reported)')
+    parser.add_argument('--json', dest='json_path', help="write the report as JSON ('-' for stdout)")
+    parser.add_argument('--baseline', help='earlier --json report to compare against')
+    parser.add_argument('--verbose', '-v', action='store_true', help='list every wrong or missing pick')
+    args = parser.parse_args()
+
+    pages, expected = load_corpus(args.corpus)
+    corpus = [(fixture, expected[fixture['file']]) for fixture, _ in pages]
+    backend = resolve_backend(args.backend)
+
+    report = {
+        'run_at': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'backend': backend,
+        'repeat': args.repeat,
+        'pages': len(pages),
+        'extractors': {},
+    }
+
+    for name, factory in EXTRACTORS.items():
+        extract = factory(backend)
+        stats, outputs = measure(pages, args.repeat, lambda fixture, html: extract(html))
+        stats['accuracy'], stats['misses'] = score(outputs, corpus)
+        report['extractors'][name] = stats
+
+    for strategy, strategy_cls in STRATEGIES.items():
+        run_page, warm = strategy_runner(strategy_cls, backend)
+        warm(pages)
+        stats, outputs = measure(pages, args.repeat, run_page)
+        stats['accuracy'], stats['misses'] = score(outputs, corpus)
+        report['extractors'][f'dom:{strategy.name.lower()}'] = stats
+
+    if args.json_path == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.verbose:
+            print_misses(report)
+        if args.json_path:
+            with open(args.json_path, 'w', encoding='utf-8') as fh:
+                json.dump(report, fh, indent=2)
+            print(f"\n  wrote {args.json_path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as fh:
+            print_comparison(report, json.load(fh))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Copy the Supabase tables into a local SQLite file.
+Use it to move a single-athlete deployment to DB_BACKEND=sqlite, or to get a
+realistic offline fixture for benchmarks.
+
+Usage: python scripts/export_to_sqlite.py [path/to/coaches.db]
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.supabase_client import SupabaseDB
+from db.sqlite_client import SQLiteDB
+
+TABLES = ['schools', 'coaches', 'athletes', 'athlete_schools', 'athlete_credentials',
+          'outreach', 'dm_queue', 'templates', 'settings', 'school_requests']
+BATCH_SIZE = 1000
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    source = SupabaseDB()
+    target = SQLiteDB(path)
+    print(f"=== Exporting {source.url} -> {target.url} ===\n")
+
+    for table in TABLES:
+        copied = 0
+        offset = 0
+        try:
+            while True:
+                rows = (source.client.table(table).select('*')
+                        .range(offset, offset + BATCH_SIZE - 1).execute().data)
+                if not rows:
+                    break
+                target.client.table(table).upsert(rows, on_conflict='id').execute()
+                copied += len(rows)
+                if len(rows) < BATCH_SIZE:
+                    break
+                offset += BATCH_SIZE
+        except Exception as e:
+            print(f"  {table}: FAILED after {copied} rows ({e})")
+            continue
+        print(f"  {table}: {copied} rows")
+
+    print("\nDone! Start the app with DB_BACKEND=sqlite to use the local copy.")
+
+
+if __name__ == '__main__':
+    main()
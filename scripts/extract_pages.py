@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Re-extract staff from saved HTML pages with DOMParser.parse_many().
+Pages are parsed across a process pool; results come back in input order
+and are written as JSON lines (one ExtractionResult.to_dict() per page).
+
+Usage: python scripts/extract_pages.py page.html | pages_dir ... [--output results.jsonl]
+           [--workers N] [--chunk-size N] [--timeout SECONDS] [--backend NAME] [--no-cache]
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extraction.dom_parser import DOMParser, DEFAULT_PAGE_TIMEOUT
+
+
+def load_pages(paths):
+    """(html, url) per saved page; the file path stands in for the URL."""
+    pages = []
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, '*.htm*'))) if os.path.isdir(path) else [path]
+        for f in files:
+            with open(f, encoding='utf-8', errors='replace') as fh:
+                pages.append((fh.read(), f))
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='saved HTML pages or directories of them')
+    parser.add_argument('--output', '-o', help='write JSON lines here (default: stdout)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=None, help='pages per worker task')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_PAGE_TIMEOUT,
+                        help='seconds per page before it is abandoned (0 disables)')
+    parser.add_argument('--backend', default=None, help='HTML parser backend (default: HTML_PARSER_BACKEND)')
+    parser.add_argument('--no-cache', action='store_true', help='ignore the extraction cache')
+    args = parser.parse_args()
+
+    pages = load_pages(args.paths)
+    start = time.perf_counter()
+    dom_parser = DOMParser(args.backend, cache=False if args.no_cache else None)
+    results = dom_parser.parse_many(
+        pages, workers=args.workers, chunk_size=args.chunk_size, timeout=args.timeout or None,
+    )
+    elapsed = time.perf_counter() - start
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for result in results:
+            out.write(json.dumps(result.to_dict()) + '\n')
+    finally:
+        if args.output:
+            out.close()
+
+    failed = sum(1 for r in results if r.errors)
+    print(f"{len(results)} pages in {elapsed:.1f}s ({len(results) / elapsed if elapsed else 0:.1f} pages/sec), "
+          f"OL found {sum(r.found_ol for r in results)}, RC found {sum(r.found_rc for r in results)}, "
+          f"{failed} with errors", file=sys.stderr)
+    stats = dom_parser.get_stats()
+    if stats['cache'] is not None:
+        print(f"cache: {stats['cache_hits']} hits / {stats['cache_misses']} misses "
+              f"({stats['cache_hit_ratio']:.0%}), {stats['time_saved_ms'] / 1000:.1f}s parse time saved",
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+-- Migration: Indexed, ranked coach search
+-- Run this in Supabase SQL Editor
+--
+-- /api/coach/search used to run three leading-wildcard ILIKE queries (which
+-- can't use a btree index) plus an outreach lookup. The trigram indexes below
+-- let ILIKE '%q%' use a GIN index, and search_coaches() returns ranked
+-- coach + school + latest-outreach rows in a single round-trip.
+--
+-- Ranking (mirrored in db/coach_search.py for the SQLite backend/replica):
+--   1. coaches whose name or email contains the query, before coaches that
+--      only match through their school name
+--   2. highest trigram similarity() against name, email or school name
+--   3. coach name
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_coaches_name_trgm ON coaches USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_coaches_email_trgm ON coaches USING gin (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_schools_name_trgm ON schools USING gin (name gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION search_coaches(p_query TEXT, p_athlete_id UUID DEFAULT NULL, p_limit INT DEFAULT 20)
+RETURNS TABLE (
+    id UUID,
+    name TEXT,
+    email TEXT,
+    role TEXT,
+    school_name TEXT,
+    division TEXT,
+    rank REAL,
+    responded BOOLEAN,
+    responded_at TIMESTAMPTZ,
+    response_sentiment TEXT,
+    outreach JSONB
+)
+LANGUAGE sql STABLE AS $$
+    WITH pattern AS (
+        -- Treat % and _ in the user's query literally
+        SELECT '%' || replace(replace(replace(p_query, '\', '\\'), '%', '\%'), '_', '\_') || '%' AS p
+    ),
+    coach_hits AS (
+        SELECT c.id, 0 AS tier
+        FROM coaches c, pattern
+        WHERE c.name ILIKE pattern.p OR c.email ILIKE pattern.p
+    ),
+    school_hits AS (
+        SELECT c.id, 1 AS tier
+        FROM schools s
+        JOIN coaches c ON c.school_id = s.id, pattern
+        WHERE s.name ILIKE pattern.p
+    ),
+    hits AS (
+        SELECT h.id, min(h.tier) AS tier
+        FROM (SELECT * FROM coach_hits UNION ALL SELECT * FROM school_hits) h
+        GROUP BY h.id
+    ),
+    ranked AS (
+        SELECT c.id, c.name, c.email, c.role, s.name AS school_name, s.division, hits.tier,
+               greatest(similarity(p_query, coalesce(c.name, '')),
+                        similarity(p_query, coalesce(c.email, '')),
+                        similarity(p_query, coalesce(s.name, ''))) AS rank
+        FROM hits
+        JOIN coaches c ON c.id = hits.id
+        LEFT JOIN schools s ON s.id = c.school_id
+        ORDER BY hits.tier, rank DESC, c.name
+        LIMIT p_limit
+    )
+    SELECT r.id, r.name, r.email, r.role, r.school_name, r.division, r.rank,
+           coalesce(reply.replied, false) AS responded,
+           reply.replied_at,
+           reply.reply_sentiment,
+           latest.outreach
+    FROM ranked r
+    LEFT JOIN LATERAL (
+        SELECT jsonb_build_object(
+                   'coach_email', o.coach_email, 'email_type', o.email_type, 'status', o.status,
+                   'sent_at', o.sent_at, 'opened', o.opened, 'open_count', o.open_count,
+                   'replied', o.replied, 'replied_at', o.replied_at,
+                   'reply_snippet', o.reply_snippet, 'reply_sentiment', o.reply_sentiment
+               ) AS outreach
+        FROM outreach o
+        WHERE p_athlete_id IS NOT NULL AND o.athlete_id = p_athlete_id AND o.coach_email = r.email
+        ORDER BY o.sent_at DESC
+        LIMIT 1
+    ) latest ON true
+    LEFT JOIN LATERAL (
+        SELECT o.replied, o.replied_at, o.reply_sentiment
+        FROM outreach o
+        WHERE p_athlete_id IS NOT NULL AND o.athlete_id = p_athlete_id AND o.coach_email = r.email
+          AND o.replied
+        ORDER BY o.sent_at DESC
+        LIMIT 1
+    ) reply ON true
+    ORDER BY r.tier, r.rank DESC, r.name;
+$$;
+
+-- Used by the outreach lookups above
+CREATE INDEX IF NOT EXISTS idx_outreach_athlete_coach_email ON outreach(athlete_id, coach_email);
@@ -0,0 +1,20 @@
+-- Migration: Persisted per-athlete email queue status
+-- Run this in Supabase SQL Editor
+--
+-- The app keeps queue-status counters in-process and updates them on every
+-- outreach / reply / school-selection write. This table holds the latest
+-- snapshot so /api/email/queue-status stays a single-row read after restarts.
+-- Rows flagged stale are rebuilt by the app on the next read.
+
+CREATE TABLE IF NOT EXISTS email_queue_status (
+    athlete_id UUID PRIMARY KEY REFERENCES athletes(id) ON DELETE CASCADE,
+    counts JSONB NOT NULL DEFAULT '{}'::jsonb,
+    stale BOOLEAN NOT NULL DEFAULT false,
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_email_queue_status_stale ON email_queue_status(stale);
+
+-- Indexes used by the cold-rebuild queries
+CREATE INDEX IF NOT EXISTS idx_outreach_athlete_coach_email ON outreach(athlete_id, coach_email);
+CREATE INDEX IF NOT EXISTS idx_athlete_schools_athlete ON athlete_schools(athlete_id);
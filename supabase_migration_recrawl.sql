@@ -0,0 +1,30 @@
+-- Migration: Staff page recrawl tracking
+-- Run this in Supabase SQL Editor
+--
+-- scrapers/recrawl.py re-fetches schools.staff_url on a schedule. These
+-- columns record when each page was last fetched, the hash of its content
+-- and how often it has changed; staff_page_changes logs every detected
+-- change and the coach rows it updated.
+
+ALTER TABLE schools
+ADD COLUMN IF NOT EXISTS last_scraped_at TIMESTAMPTZ,
+ADD COLUMN IF NOT EXISTS staff_content_hash TEXT,
+ADD COLUMN IF NOT EXISTS staff_scrape_count INT DEFAULT 0,
+ADD COLUMN IF NOT EXISTS staff_change_count INT DEFAULT 0,
+ADD COLUMN IF NOT EXISTS staff_changed_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_schools_last_scraped ON schools(last_scraped_at);
+
+CREATE TABLE IF NOT EXISTS staff_page_changes (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    school_id UUID REFERENCES schools(id) ON DELETE CASCADE,
+    staff_url TEXT,
+    content_hash TEXT,
+    previous_hash TEXT,
+    coaches_updated INT DEFAULT 0,
+    changes JSONB NOT NULL DEFAULT '[]'::jsonb,
+    detected_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_staff_page_changes_school ON staff_page_changes(school_id, detected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_staff_page_changes_detected ON staff_page_changes(detected_at DESC);
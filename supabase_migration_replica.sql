@@ -0,0 +1,10 @@
+-- Migration: Indexes for the in-process coaches/schools replica
+-- Run this in Supabase SQL Editor
+--
+-- The app keeps a copy of coaches and schools in memory and pulls only rows
+-- with updated_at >= its last watermark every REPLICA_SYNC_INTERVAL seconds.
+-- updated_at and its trigger already exist (supabase_schema.sql); these
+-- indexes keep the delta query an index range scan.
+
+CREATE INDEX IF NOT EXISTS idx_coaches_updated_at ON coaches(updated_at);
+CREATE INDEX IF NOT EXISTS idx_schools_updated_at ON schools(updated_at);